@@ -0,0 +1,72 @@
+"""
+Benchmark the newest-bar lookup of get_current_price on synthetic 5min series.
+
+    python bench_current_price.py              # 100 (compact) and 5760 (30 days, full) bars
+    python bench_current_price.py 1000 20000   # or other series lengths
+
+"sorted" is the former per-call work on the upstream body: decode it and sort every timestamp
+to pick the newest bar. "stored" reads the last bar of a series kept in the series store, which
+is what a call costs until the next 5min bar is due.
+"""
+import sys
+import time
+
+import numpy as np
+
+import json_codec
+from columnar import Series
+
+REPEAT = 200
+
+
+def best(func) -> float:
+    """
+    Fastest of REPEAT runs, in microseconds.
+    """
+    timings = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1e6
+
+
+def payload(bars: int) -> bytes:
+    """
+    Upstream TIME_SERIES_INTRADAY body with bars 5min bars, newest first.
+    """
+    stamps = np.datetime64("2024-01-02T04:00:00") + np.arange(bars)[::-1] * np.timedelta64(5, "m")
+    close = 100 + np.cumsum(np.random.default_rng(0).normal(0, 0.1, bars))
+    rows = {
+        str(stamp).replace("T", " "): {"1. open": f"{price:.4f}", "2. high": f"{price:.4f}", "3. low": f"{price:.4f}",
+                                       "4. close": f"{price:.4f}", "5. volume": "1000"}
+        for stamp, price in zip(stamps, close)
+    }
+    return json_codec.dumps({"Meta Data": {}, "Time Series (5min)": rows})
+
+
+def sorted_lookup(body: bytes) -> tuple:
+    time_series = json_codec.loads(body)["Time Series (5min)"]
+    latest_time = sorted(time_series.keys())[-1]
+    return latest_time, time_series[latest_time]["4. close"]
+
+
+def stored_lookup(series: Series) -> tuple:
+    decimals = series.decimals[series.names.index("close")]
+    return series.stamp(-1), f"{series.column('close')[-1]:.{decimals}f}"
+
+
+def main() -> None:
+    sizes = [int(arg) for arg in sys.argv[1:]] or [100, 30 * 192]
+    print(f"{'bars':>7} {'sorted':>10} {'stored':>8}  (us)")
+    for bars in sizes:
+        body = payload(bars)
+        series = Series.from_rows(json_codec.loads(body)["Time Series (5min)"])
+        # Drop the timestamp strings kept from parsing, as for a series merged by the store
+        series = Series(series.timestamps, series.fields, series.values, series.decimals, series.intraday)
+        assert sorted_lookup(body) == stored_lookup(series)
+        print(f"{bars:7} {best(lambda: sorted_lookup(body)):10.1f} {best(lambda: stored_lookup(series)):8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Benchmark upstream round trips through the shared pooled session against a local stub server.
+
+    python bench_http.py            # 200 requests, 20 ms simulated handshake per new connection
+    python bench_http.py 1000 50    # or other request counts and handshake costs (ms)
+
+"fresh" opens a connection per request, as every call did before the shared session; "pooled"
+goes through http_client.get and reuses keep-alive connections. The stub sleeps once per accepted
+connection to stand in for the TCP/TLS handshake to the real API, and counts the connections.
+"""
+import http.server
+import sys
+import threading
+import time
+
+import requests
+
+import http_client
+
+BODY = b'{"Global Quote": {"01. symbol": "IBM", "05. price": "100.0000"}}'
+
+
+class StubHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    disable_nagle_algorithm = True  # headers and body are separate writes
+    handshake = 0.0
+    connections = 0
+
+    def setup(self) -> None:
+        StubHandler.connections += 1
+        time.sleep(StubHandler.handshake)
+        super().setup()
+
+    def do_GET(self) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+def start_stub() -> http.server.ThreadingHTTPServer:
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def percentile(timings: list, fraction: float) -> float:
+    """
+    Value at fraction of the sorted timings, in milliseconds.
+    """
+    ordered = sorted(timings)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] * 1000
+
+
+def run(get, url: str, count: int) -> tuple:
+    """
+    (connections opened, p50, p99, total seconds) of count sequential GETs.
+    """
+    StubHandler.connections = 0
+    timings = []
+    began = time.perf_counter()
+    for _ in range(count):
+        start = time.perf_counter()
+        response = get(url)
+        response.content
+        timings.append(time.perf_counter() - start)
+    return StubHandler.connections, percentile(timings, 0.5), percentile(timings, 0.99), time.perf_counter() - began
+
+
+def fresh_get(url: str) -> requests.Response:
+    with requests.Session() as session:
+        return session.get(url, params={"function": "GLOBAL_QUOTE", "symbol": "IBM"}, timeout=10)
+
+
+def pooled_get(url: str) -> requests.Response:
+    return http_client.get(url, params={"function": "GLOBAL_QUOTE", "symbol": "IBM"})
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    StubHandler.handshake = (float(sys.argv[2]) if len(sys.argv) > 2 else 20) / 1000
+    server = start_stub()
+    url = f"http://127.0.0.1:{server.server_address[1]}/query"
+    print(f"{count} requests, {StubHandler.handshake * 1000:.0f} ms handshake")
+    print(f"{'mode':8} {'conns':>6} {'p50':>8} {'p99':>8} {'total':>8}  (ms, total in s)")
+    for mode, get in (("fresh", fresh_get), ("pooled", pooled_get)):
+        connections, p50, p99, total = run(get, url, count)
+        print(f"{mode:8} {connections:6} {p50:8.2f} {p99:8.2f} {total:8.2f}")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
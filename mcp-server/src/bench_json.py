@@ -0,0 +1,69 @@
+"""
+Benchmark JSON decoding and encoding on recorded Alpha Vantage responses.
+
+    python bench_json.py                 # every response stored in the disk cache
+    python bench_json.py daily.json ...  # or saved response bodies
+
+For each payload it times the standard library against orjson (when installed) for
+decoding the upstream body, parsing it into columnar Series, and encoding the tool result.
+"""
+import json
+import sqlite3
+import sys
+import time
+import zlib
+
+import json_codec
+from columnar import to_columnar, to_legacy
+from disk_cache import PATH
+
+REPEAT = 5
+
+
+def best(func) -> float:
+    """
+    Fastest of REPEAT runs, in milliseconds.
+    """
+    timings = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def recorded() -> list:
+    """
+    (label, body) pairs from the command line files or the disk cache.
+    """
+    if sys.argv[1:]:
+        return [(path, open(path, "rb").read()) for path in sys.argv[1:]]
+    try:
+        rows = sqlite3.connect(PATH).execute("SELECT key, payload FROM entries ORDER BY size DESC").fetchall()
+    except sqlite3.Error:
+        return []
+    labels = [" ".join(str(value) for name, value in json.loads(key) if name in ("function", "symbol", "outputsize"))
+              for key, _ in rows]
+    return [(label, zlib.decompress(payload)) for label, (_, payload) in zip(labels, rows)]
+
+
+def main() -> None:
+    payloads = recorded()
+    if not payloads:
+        print(f"No recorded responses: pass JSON files or fill the disk cache ({PATH})")
+        return
+    backends = ["json"] + (["orjson"] if json_codec.orjson is not None else [])
+    print(f"{'payload':36} {'KB':>7} {'backend':8} {'decode':>8} {'columnar':>9} {'encode':>8}  (ms)")
+    for label, body in payloads:
+        for backend in backends:
+            json_codec.BACKEND = backend
+            data = json_codec.loads(body)
+            columnar = to_columnar(data)
+            decode = best(lambda: json_codec.loads(body))
+            parse = best(lambda: to_columnar(json_codec.loads(body)))
+            encode = best(lambda: json_codec.dumps(to_legacy(columnar)))
+            print(f"{label[:36]:36} {len(body) / 1024:7.0f} {backend:8} {decode:8.1f} {parse:9.1f} {encode:8.1f}")
+
+
+if __name__ == "__main__":
+    main()
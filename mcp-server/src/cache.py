@@ -0,0 +1,142 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+# In-process response cache in front of the Alpha Vantage fetch path.
+# Entries expire after a per-endpoint TTL and the least recently used ones are
+# evicted once the cached payloads exceed a byte budget. An entry stored with a
+# grace period stays available to stale() for that long after it expires.
+
+MAX_BYTES = int(os.getenv("ALPHA_VANTAGE_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+
+MISSING = object()
+
+
+def make_key(params: dict) -> tuple:
+    """
+    Canonical cache key for an upstream query: sorted (name, value) pairs without the API key.
+    """
+    return tuple(sorted((name, str(value)) for name, value in params.items() if name != "apikey"))
+
+
+class ResponseCache:
+    def __init__(self, max_bytes: int = MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # key -> (expires_at, size, value, grace)
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.stale_hits = 0
+        self.evictions = 0
+
+    def get(self, key: tuple) -> Any:
+        """
+        Return the cached value for key, or MISSING when absent or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return MISSING
+            expires_at, size, value, grace = entry
+            now = time.monotonic()
+            if expires_at <= now:
+                if expires_at + grace <= now:
+                    self._remove(key)
+                self.expired += 1
+                self.misses += 1
+                return MISSING
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def stale(self, key: tuple) -> Any:
+        """
+        The value of an entry that expired but is still inside its grace period, or MISSING.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return MISSING
+            expires_at, size, value, grace = entry
+            if not expires_at <= time.monotonic() < expires_at + grace:
+                return MISSING
+            self._entries.move_to_end(key)
+            self.stale_hits += 1
+            return value
+
+    def peek(self, key: tuple) -> Any:
+        """
+        Like get() but without touching LRU order or hit/miss counters.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                return MISSING
+            return entry[2]
+
+    def set(self, key: tuple, value: Any, ttl: float, size: int, grace: float = 0.0) -> None:
+        """
+        Store value for ttl seconds, then keep it grace seconds longer for stale().
+        size is the payload size in bytes used for the byte budget.
+        """
+        if ttl <= 0 or size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic() + ttl, size, value, grace)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "expired": self.expired,
+                "stale_hits": self.stale_hits,
+                "evictions": self.evictions,
+            }
+
+    def _remove(self, key: tuple) -> Optional[tuple]:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[1]
+        return entry
+
+
+response_cache = ResponseCache()
+
+# Upstream refusals that repeat until something changes: an invalid call (usually an
+# unknown symbol) and functions the API key is not entitled to. Remembered apart
+# from real responses so retries are answered locally without spending quota.
+NEGATIVE_TTL_INVALID = float(os.getenv("ALPHA_VANTAGE_NEGATIVE_TTL", str(60 * 60)))
+NEGATIVE_TTL_PREMIUM = 24 * 60 * 60.0
+negative_cache = ResponseCache(max_bytes=1024 * 1024)
+
+
+class Refusal(dict):
+    """
+    {"error": ...} for a query upstream refused itself (an invalid call, e.g. a currency pair, or a
+    premium-only function), as opposed to a failure on the way (rate limit, network). Callers see a
+    plain error; an indicator whose price series is refused falls back to its own upstream endpoint,
+    and a history whose full series is refused starts from a compact one.
+    """
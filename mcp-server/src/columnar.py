@@ -0,0 +1,166 @@
+from typing import Any, Optional
+
+import numpy as np
+
+# Compact columnar form of Alpha Vantage time series. Upstream sends
+# {"2024-01-02": {"1. open": "185.1000", ...}, ...}: one small dict of strings
+# per bar. The caches and the indicator layer keep a Series instead (int64 epoch
+# timestamps plus one float64 array per field, oldest first) and tools convert
+# back to the upstream shape only when answering.
+
+
+def epoch(stamp: str) -> int:
+    """
+    Seconds since the epoch of an upstream timestamp ("2024-01-02" or "2024-01-02 19:55:00"), zone-naive.
+    """
+    return int(np.datetime64(stamp.replace(" ", "T"), "s").astype(np.int64))
+
+
+class Series:
+    """
+    Time series bars as columns. values is (bars x fields), column-major so each field is contiguous.
+    """
+
+    __slots__ = ("timestamps", "fields", "values", "decimals", "intraday", "_stamps")
+
+    def __init__(self, timestamps: np.ndarray, fields: tuple, values: np.ndarray, decimals: tuple, intraday: bool):
+        self.timestamps = timestamps  # int64 epoch seconds, ascending
+        self.fields = fields          # upstream field names ("1. open", "5. adjusted close", ...)
+        self.values = values
+        self.decimals = decimals      # digits after the point in the upstream strings, per field
+        self.intraday = intraday
+        self._stamps = None
+
+    @classmethod
+    def from_rows(cls, rows: dict) -> "Series":
+        """
+        Parse an upstream {timestamp: {field: "number"}} payload. Raises ValueError on non-numeric fields.
+        """
+        stamps = list(rows)
+        fields = tuple(rows[stamps[0]])
+        if all(a > b for a, b in zip(stamps, stamps[1:])) and all(tuple(row) == fields for row in rows.values()):
+            # Upstream order (newest first, same fields in every bar): parse all values in one flat pass
+            flat = np.array([value for row in rows.values() for value in row.values()], dtype=float)
+            values = np.asfortranarray(flat.reshape(len(stamps), len(fields))[::-1])
+            stamps.reverse()
+        else:
+            stamps.sort()
+            fields = tuple(rows[stamps[-1]])
+            values = np.array([[rows[stamp][field] for field in fields] for stamp in stamps], dtype=float, order="F")
+        newest = rows[stamps[-1]]
+        decimals = tuple(len(newest[field].partition(".")[2]) for field in fields)
+        intraday = len(stamps[0]) > 10
+        timestamps = np.array([stamp.replace(" ", "T") for stamp in stamps], dtype="datetime64[s]").astype(np.int64)
+        series = cls(timestamps, fields, values, decimals, intraday)
+        series._stamps = stamps
+        return series
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    @property
+    def names(self) -> list:
+        """
+        Field names without their upstream numbering ("open", "adjusted close", ...).
+        """
+        return [field.split(". ", 1)[-1] for field in self.fields]
+
+    @property
+    def nbytes(self) -> int:
+        return self.timestamps.nbytes + self.values.nbytes
+
+    def column(self, name: str) -> Optional[np.ndarray]:
+        """
+        Values of a field by its short name, or None if the series has no such field.
+        """
+        names = self.names
+        return self.values[:, names.index(name)] if name in names else None
+
+    def stamps(self) -> list:
+        """
+        Upstream timestamp strings, oldest first (computed once per series).
+        """
+        if self._stamps is None:
+            text = np.datetime_as_string(self.timestamps.astype("datetime64[s]"), unit=self._unit())
+            self._stamps = [stamp.replace("T", " ") for stamp in text.tolist()]
+        return self._stamps
+
+    def stamp(self, index: int) -> str:
+        """
+        Upstream timestamp string of one bar, without formatting the others.
+        """
+        if self._stamps is not None:
+            return self._stamps[index]
+        return str(np.datetime_as_string(self.timestamps[index].astype("datetime64[s]"), unit=self._unit())).replace("T", " ")
+
+    def _unit(self) -> str:
+        # Epoch seconds, printed down to the second for intraday bars and to the day otherwise
+        return "s" if self.intraday else "D"
+
+    def index(self, stamp: str) -> int:
+        """
+        Position of the bar at stamp, or -1.
+        """
+        moment = epoch(stamp)
+        position = int(np.searchsorted(self.timestamps, moment))
+        return position if position < len(self) and self.timestamps[position] == moment else -1
+
+    def slice(self, start: int = 0, stop: Optional[int] = None) -> "Series":
+        """
+        Bars start:stop as a new Series sharing this one's arrays.
+        """
+        series = Series(self.timestamps[start:stop], self.fields, self.values[start:stop], self.decimals, self.intraday)
+        if self._stamps is not None:
+            series._stamps = self._stamps[start:stop]
+        return series
+
+    def select(self, fields: list) -> "Series":
+        """
+        The same bars restricted to the given upstream fields.
+        """
+        indexes = [self.fields.index(field) for field in fields]
+        series = Series(self.timestamps, tuple(fields), self.values[:, indexes],
+                        tuple(self.decimals[index] for index in indexes), self.intraday)
+        series._stamps = self._stamps
+        return series
+
+    def to_rows(self) -> dict:
+        """
+        The upstream {timestamp: {field: "number"}} shape, newest first.
+        """
+        columns = [
+            list(map(f"%.{decimals}f".__mod__, self.values[::-1, j].tolist()))
+            for j, decimals in enumerate(self.decimals)
+        ]
+        return {stamp: dict(zip(self.fields, row)) for stamp, row in zip(reversed(self.stamps()), zip(*columns))}
+
+
+def is_series_key(key: str) -> bool:
+    return "Time Series" in key
+
+
+def to_columnar(data: Any) -> Any:
+    """
+    Copy of an upstream response with its time series payloads as Series. Other data is returned as is.
+    """
+    if not isinstance(data, dict) or not any(is_series_key(key) for key in data):
+        return data
+    converted = dict(data)
+    for key, rows in data.items():
+        if is_series_key(key) and isinstance(rows, dict) and rows:
+            try:
+                converted[key] = Series.from_rows(rows)
+            except (ValueError, TypeError, AttributeError, KeyError):
+                pass  # not a plain numeric series, keep the upstream shape
+    return converted
+
+
+def to_legacy(data: Any) -> Any:
+    """
+    Inverse of to_columnar: the upstream shape for a Series or a response holding some.
+    """
+    if isinstance(data, Series):
+        return data.to_rows()
+    if isinstance(data, dict) and any(isinstance(value, Series) for value in data.values()):
+        return {key: to_legacy(value) for key, value in data.items()}
+    return data
@@ -0,0 +1,86 @@
+import csv
+from typing import Callable, Optional
+
+import json_codec
+
+# Streaming ingestion of the endpoints that only answer with CSV (LISTING_STATUS,
+# EARNINGS_CALENDAR, IPO_CALENDAR). The body is parsed line by line as it comes off
+# the socket into typed rows, so the text is never held in full next to its parsed
+# form, and the caches keep {"columns": [...], "rows": [[...], ...]}.
+
+DOC = " Optional filters: symbol, and start/end (inclusive dates, e.g. 2024-01-02) on the report or IPO date."
+CHUNK_SIZE = 64 * 1024
+NULLS = ("", "null", "None")
+NUMBER_COLUMNS = {"estimate", "priceRangeLow", "priceRangeHigh"}
+
+# Column each CSV function is filtered on by start/end
+DATE_COLUMNS = {"LISTING_STATUS": "ipoDate", "EARNINGS_CALENDAR": "reportDate", "IPO_CALENDAR": "ipoDate"}
+
+
+def _text(value: str) -> Optional[str]:
+    return None if value in NULLS else value
+
+
+def _number(value: str) -> Optional[float]:
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def converter(column: str) -> Callable[[str], object]:
+    return _number if column in NUMBER_COLUMNS else _text
+
+
+def read(response) -> tuple:
+    """
+    Parse a streamed requests response as it arrives. Returns (data, size in bytes) where data is
+    {"columns": [...], "rows": [[...], ...]}, or the JSON message upstream sent instead of CSV
+    (invalid call, throttling).
+    """
+    response.encoding = "utf-8"
+    size = 0
+
+    def lines():
+        nonlocal size
+        for line in response.iter_lines(chunk_size=CHUNK_SIZE, decode_unicode=True):
+            size += len(line) + 1
+            if line:
+                yield line
+
+    stream = lines()
+    first = next(stream, "")
+    if first.lstrip().startswith("{"):
+        return json_codec.loads("\n".join([first, *stream])), size
+    columns = next(csv.reader([first]), [])
+    converters = [converter(column) for column in columns]
+    rows = [[convert(value) for convert, value in zip(converters, row)] for row in csv.reader(stream)]
+    return {"columns": columns, "rows": rows}, size
+
+
+def select(table: dict, function: str, symbol: Optional[str] = None, start: Optional[str] = None,
+           end: Optional[str] = None) -> dict:
+    """
+    Rows of a parsed table for symbol and the inclusive start/end dates on the function's date column,
+    in one pass; without filters the table itself.
+    """
+    if symbol is None and start is None and end is None:
+        return table
+    columns = table["columns"]
+    date = DATE_COLUMNS.get(function)
+    at_symbol = columns.index("symbol") if "symbol" in columns else None
+    at_date = columns.index(date) if date in columns else None
+    if (symbol is not None and at_symbol is None) or ((start or end) and at_date is None):
+        return {"columns": columns, "rows": []}
+    symbol = symbol.strip().upper() if symbol is not None else None
+    end = end + "\x7f" if end else None  # an end date includes timestamps on that day
+    rows = []
+    for row in table["rows"]:
+        if symbol is not None and row[at_symbol] != symbol:
+            continue
+        if at_date is not None and (start or end):
+            day = row[at_date]
+            if day is None or (start and day < start) or (end and day > end):
+                continue
+        rows.append(row)
+    return {"columns": columns, "rows": rows}
@@ -0,0 +1,188 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Any
+
+import json_codec
+from cache import MISSING
+from columnar import to_columnar, to_legacy
+
+# Persistent response store behind the in-memory cache. Survives restarts of the
+# stdio server so a fresh process does not re-spend API quota warming up.
+# SQLite in WAL mode lets several server processes share one file safely;
+# payloads are stored as zlib-compressed JSON with a wall-clock expiry. Time series
+# are written in the upstream shape and come back as columnar Series.
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".cache", "alpha_vantage.sqlite3")
+PATH = os.getenv("ALPHA_VANTAGE_DISK_CACHE", DEFAULT_PATH)  # empty string disables the disk cache
+MAX_BYTES = int(os.getenv("ALPHA_VANTAGE_DISK_CACHE_MAX_BYTES", str(512 * 1024 * 1024)))
+WARM_START = os.getenv("ALPHA_VANTAGE_DISK_CACHE_WARM", "0").lower() in ("1", "true", "yes")
+COMPACT_EVERY = 200     # writes between two compactions
+BUSY_TIMEOUT = 5.0      # seconds to wait for another process holding the write lock
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    expires_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    size INTEGER NOT NULL,
+    payload BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed_at);
+"""
+
+
+def _encode_key(key: tuple) -> str:
+    return json.dumps(key, separators=(",", ":"))
+
+
+class DiskCache:
+    def __init__(self, path: str = PATH, max_bytes: int = MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.enabled = bool(path)
+        self._local = threading.local()  # one connection per thread
+        self._lock = threading.Lock()
+        self._writes = 0
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        self.evictions = 0
+        if self.enabled:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            with self._connect() as db:
+                db.executescript(SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        db = getattr(self._local, "db", None)
+        if db is None:
+            db = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT)
+            db.execute("PRAGMA auto_vacuum=INCREMENTAL")  # only takes effect on a new file
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            self._local.db = db
+        return db
+
+    def get(self, key: tuple) -> Any:
+        """
+        Return (value, seconds_left, size) for an unexpired entry, or MISSING.
+        """
+        if not self.enabled:
+            return MISSING
+        now = time.time()
+        try:
+            with self._connect() as db:
+                row = db.execute(
+                    "SELECT expires_at, payload FROM entries WHERE key = ?", (_encode_key(key),)
+                ).fetchone()
+                if row is not None and row[0] > now:
+                    db.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (now, _encode_key(key)))
+        except sqlite3.Error:
+            self.errors += 1
+            return MISSING
+        if row is None or row[0] <= now:
+            self.misses += 1
+            return MISSING
+        self.hits += 1
+        raw = zlib.decompress(row[1])
+        return to_columnar(json_codec.loads(raw)), row[0] - now, len(raw)
+
+    def set(self, key: tuple, value: Any, ttl: float) -> None:
+        """
+        Store value for ttl seconds. Never raises: a broken disk cache only costs hit rate.
+        """
+        if not self.enabled or ttl <= 0:
+            return
+        payload = zlib.compress(json_codec.dumps(to_legacy(value)))
+        if len(payload) > self.max_bytes:
+            return
+        now = time.time()
+        try:
+            with self._connect() as db:
+                db.execute(
+                    "INSERT OR REPLACE INTO entries (key, expires_at, accessed_at, size, payload) VALUES (?, ?, ?, ?, ?)",
+                    (_encode_key(key), now + ttl, now, len(payload), payload),
+                )
+        except sqlite3.Error:
+            self.errors += 1
+            return
+        with self._lock:
+            self._writes += 1
+            due = self._writes % COMPACT_EVERY == 0
+        if due:
+            self.compact()
+
+    def compact(self) -> None:
+        """
+        Drop expired entries, then the least recently used ones until the file fits max_bytes.
+        """
+        if not self.enabled:
+            return
+        try:
+            with self._connect() as db:
+                db.execute("DELETE FROM entries WHERE expires_at <= ?", (time.time(),))
+                total = db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+                stale = []
+                if total > self.max_bytes:
+                    for key, size in db.execute("SELECT key, size FROM entries ORDER BY accessed_at"):
+                        if total <= self.max_bytes:
+                            break
+                        stale.append((key,))
+                        total -= size
+                    db.executemany("DELETE FROM entries WHERE key = ?", stale)
+            db.execute("PRAGMA incremental_vacuum")
+            db.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        except sqlite3.Error:
+            self.errors += 1
+            return
+        self.evictions += len(stale)
+
+    def warm(self, memory_cache) -> int:
+        """
+        Load unexpired entries, most recently used first, into memory_cache until its budget is full.
+        Returns the number of entries loaded.
+        """
+        if not self.enabled:
+            return 0
+        now = time.time()
+        loaded = budget = 0
+        try:
+            rows = self._connect().execute(
+                "SELECT key, expires_at, payload FROM entries WHERE expires_at > ? ORDER BY accessed_at DESC", (now,)
+            )
+            for key, expires_at, payload in rows:
+                raw = zlib.decompress(payload)
+                budget += len(raw)
+                if budget > memory_cache.max_bytes:
+                    break
+                value = to_columnar(json_codec.loads(raw))
+                memory_cache.set(tuple(map(tuple, json.loads(key))), value, expires_at - now, len(raw))
+                loaded += 1
+        except sqlite3.Error:
+            self.errors += 1
+        return loaded
+
+    def stats(self) -> dict:
+        if not self.enabled:
+            return {"enabled": False}
+        try:
+            entries, size = self._connect().execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+        except sqlite3.Error:
+            entries = size = None
+        return {
+            "enabled": True,
+            "path": os.path.abspath(self.path),
+            "entries": entries,
+            "bytes": size,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "errors": self.errors,
+        }
+
+
+disk_cache = DiskCache()
@@ -0,0 +1,96 @@
+import threading
+from bisect import bisect_left, bisect_right
+from datetime import date
+
+# Local index of the EARNINGS_CALENDAR table: reports sorted by date, with the
+# reports of each symbol, so "who reports this week" or "when does AAPL report"
+# is two binary searches on the cached calendar instead of an upstream call. The
+# index follows the cached response of each horizon (refreshed daily) and is
+# rebuilt only when that response changes.
+
+HORIZONS = ((90, "3month"), (182, "6month"), (365, "12month"))  # days ahead each horizon covers
+
+
+def horizon(end: date, today: date) -> str:
+    """
+    Shortest calendar horizon that reaches end.
+    """
+    days = (end - today).days
+    for reach, name in HORIZONS:
+        if days <= reach:
+            return name
+    return HORIZONS[-1][1]
+
+
+class EarningsIndex:
+    """
+    Earnings reports sorted by (report date, symbol), plus the positions of each symbol's reports.
+    """
+
+    __slots__ = ("columns", "rows", "dates", "by_symbol")
+
+    def __init__(self, columns: list, rows: list, at_date: int, at_symbol: int):
+        rows = sorted((row for row in rows if row[at_date] and row[at_symbol]),
+                      key=lambda row: (row[at_date], row[at_symbol]))
+        self.columns = columns
+        self.rows = rows
+        self.dates = [row[at_date] for row in rows]
+        self.by_symbol = {}  # symbol -> positions in rows, by date
+        for i, row in enumerate(rows):
+            self.by_symbol.setdefault(row[at_symbol], []).append(i)
+
+    @classmethod
+    def from_table(cls, table: dict) -> "EarningsIndex":
+        """
+        Index of a parsed EARNINGS_CALENDAR table (symbol, name, reportDate, fiscalDateEnding, estimate, currency).
+        """
+        columns = table.get("columns", [])
+        if not {"symbol", "reportDate"} <= set(columns):
+            return cls(columns, [], 0, 0)
+        return cls(columns, table["rows"], columns.index("reportDate"), columns.index("symbol"))
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def between(self, start: str, end: str) -> list:
+        """
+        Reports dated start to end (inclusive ISO dates), by date.
+        """
+        return self.rows[bisect_left(self.dates, start):bisect_right(self.dates, end)]
+
+    def of_symbol(self, symbol: str, start: str, end: str) -> list:
+        """
+        Reports of one symbol dated start to end, by date.
+        """
+        positions = self.by_symbol.get(symbol, [])
+        dates = [self.dates[i] for i in positions]  # a handful per symbol within a horizon
+        return [self.rows[i] for i in positions[bisect_left(dates, start):bisect_right(dates, end)]]
+
+
+class EarningsCalendar:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._indexes = {}  # horizon -> (cached EARNINGS_CALENDAR response, its index)
+        self.builds = 0
+        self.lookups = 0
+
+    def index(self, horizon: str, data: dict) -> EarningsIndex:
+        """
+        Index of the EARNINGS_CALENDAR response of a horizon, rebuilt only when the response changes.
+        """
+        with self._lock:
+            self.lookups += 1
+            source, index = self._indexes.get(horizon, (None, None))
+            if data is not source:
+                index = EarningsIndex.from_table(data)
+                self._indexes[horizon] = (data, index)
+                self.builds += 1
+            return index
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"horizons": {horizon: len(index) for horizon, (_, index) in self._indexes.items()},
+                    "builds": self.builds, "lookups": self.lookups}
+
+
+earnings_calendar = EarningsCalendar()
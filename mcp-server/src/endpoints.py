@@ -0,0 +1,406 @@
+import inspect
+from dataclasses import dataclass, field
+from typing import Any, Optional, Tuple
+
+from csv_stream import DOC as FILTER_DOC
+from projection import DOC as PROJECTION_DOC
+from rate_limit import INTERACTIVE, NORMAL
+
+# Declarative registry of every Alpha Vantage endpoint exposed by the server.
+# tools.py generates one fetcher per entry and server.py one MCP tool per entry,
+# so all of them share a single request path.
+
+REQUIRED = inspect.Parameter.empty
+
+# Default cache lifetimes in seconds
+TTL_REALTIME = 60            # quotes, intraday bars, market movers
+TTL_DAILY = 60 * 60          # daily series and indicators
+TTL_SLOW = 24 * 60 * 60      # fundamentals, calendars, economic and commodity series
+
+# How long an expired response may still be answered while a background call refreshes it
+GRACE_SLOW = 7 * 24 * 60 * 60  # company fundamentals, which change a few times a year
+
+
+@dataclass(frozen=True)
+class Param:
+    name: str
+    type: Any = str
+    default: Any = REQUIRED
+    upstream: Optional[str] = None  # query string name when it differs from name
+
+    @property
+    def query_name(self) -> str:
+        return self.upstream or self.name
+
+
+@dataclass(frozen=True)
+class Endpoint:
+    name: str                          # fetcher name in tools.py
+    function: Optional[str]            # Alpha Vantage "function" (None when passed by the caller)
+    params: Tuple[Param, ...] = ()
+    payload_key: Optional[str] = None  # key holding the useful data, may use {param} placeholders
+    tool: Optional[str] = None         # MCP tool name
+    path: Optional[str] = None         # FastAPI route
+    doc: str = ""
+    fixed: dict = field(default_factory=dict)  # query params that are always sent
+    datatype: str = "json"             # "csv" for endpoints that only answer with CSV
+    ttl: float = TTL_DAILY             # how long a successful response may be served from cache
+    market_hours: bool = False         # US equity data whose TTL follows the trading calendar
+    priority: str = NORMAL             # rate limiter class for tool calls; quotes are INTERACTIVE
+    stale_grace: float = 0.0           # seconds a stale response is served while it is revalidated
+    listed: bool = True                # symbol is a stock ticker (normalized locally, see listing.py), not a currency
+
+    @property
+    def projectable(self) -> bool:
+        """
+        Whether the payload is a time series or indicator that accepts the projection parameters.
+        """
+        return bool(self.payload_key) and ("Time Series" in self.payload_key
+                                           or self.payload_key.startswith("Technical Analysis"))
+
+    @property
+    def checks_symbol(self) -> bool:
+        """
+        Whether the syntax of the symbol argument is validated locally before calling upstream.
+        """
+        return SYMBOL in self.params
+
+    @property
+    def history(self) -> bool:
+        """
+        Whether the series is served from a merged full history kept up to date with compact calls.
+        """
+        return OUTPUTSIZE in self.params
+
+    @property
+    def filterable(self) -> bool:
+        """
+        Whether the payload is a CSV table that accepts the record filter parameters.
+        """
+        return self.datatype == "csv"
+
+    @property
+    def description(self) -> str:
+        """
+        Docstring of the generated fetcher and MCP tool.
+        """
+        return self.doc + (PROJECTION_DOC if self.projectable else "") + (FILTER_DOC if self.filterable else "")
+
+    def signature(self) -> inspect.Signature:
+        """
+        Python signature shared by the generated fetcher and MCP tool.
+        """
+        params = self.params + (PROJECTION if self.projectable else ()) + (RECORD_FILTER if self.filterable else ())
+        parameters = [
+            inspect.Parameter(p.name, inspect.Parameter.POSITIONAL_OR_KEYWORD, default=p.default, annotation=p.type)
+            for p in params
+        ]
+        return inspect.Signature(parameters, return_annotation=dict)
+
+    def query(self, arguments: dict) -> dict:
+        """
+        Build the upstream query parameters (without the API key) for bound arguments.
+        """
+        params = {"function": self.function} if self.function else {}
+        params.update(self.fixed)
+        for p in self.params:
+            value = arguments.get(p.name)
+            if value is not None:
+                params[p.query_name] = value
+        return params
+
+    def cache_ttl(self, arguments: dict) -> float:
+        """
+        Cache lifetime for bound arguments; intraday intervals always get the realtime TTL.
+        """
+        interval = arguments.get("interval") or self.fixed.get("interval")
+        if isinstance(interval, str) and interval.endswith("min"):
+            return min(self.ttl, TTL_REALTIME)
+        return self.ttl
+
+    def payload(self, arguments: dict) -> Optional[str]:
+        """
+        Resolve the response key that holds the data for bound arguments.
+        """
+        if self.payload_key is None:
+            return None
+        return self.payload_key.format(**arguments)
+
+
+# Projection parameters of every time series and indicator tool (see projection.py); never sent upstream
+PROJECTION = (
+    Param("start", Optional[str], None),
+    Param("end", Optional[str], None),
+    Param("last_n", Optional[int], None),
+    Param("fields", Optional[str], None),
+)
+
+# Record filters of the CSV endpoints (see csv_stream.py); never sent upstream
+RECORD_FILTER = (
+    Param("symbol", Optional[str], None),
+    Param("start", Optional[str], None),
+    Param("end", Optional[str], None),
+)
+
+SYMBOL = Param("symbol")
+SERIES_TYPE = Param("series_type", default="close")
+# "compact" (latest 100 bars) or "full" (whole history); start/end/last_n always select from the whole history
+OUTPUTSIZE = Param("outputsize", default="compact")
+
+
+def _period(default: int, name: str = "time_period") -> Param:
+    return Param(name, int, default)
+
+
+def _simple(name: str, function: str, doc: str, *params: Param, payload_key: str = None,
+            tool: str = None, path: str = None, **options) -> Endpoint:
+    """
+    Endpoint whose tool is named <name>_tool and routed at /<name>/{required params}.
+    """
+    if path is None:
+        required = "".join("/{%s}" % p.name for p in params if p.default is REQUIRED)
+        path = f"/{name}{required}"
+    return Endpoint(name=name, function=function, params=params, payload_key=payload_key,
+                    tool=tool or f"{name}_tool", path=path, doc=doc, **options)
+
+
+def _indicator(function: str, doc: str, *params: Param, interval: str = "daily",
+               name: str = None, tool: str = None, path: str = None) -> Endpoint:
+    """
+    Technical indicator endpoint answering under "Technical Analysis: <FUNCTION>". Its symbol may be a
+    stock or a currency pair (USDEUR), so it is not checked against the stock listing.
+    """
+    slug = function.lower()
+    params = (SYMBOL, Param("interval", default=interval)) + params
+    if path is None:
+        path = f"/get_{slug}_data/{{symbol}}"
+        if SERIES_TYPE in params:
+            path += "/{series_type}"
+    return Endpoint(name=name or f"get_{slug}_values", function=function, params=params,
+                    payload_key=f"Technical Analysis: {function}", tool=tool or f"get_{slug}_data_tool",
+                    path=path, doc=doc, market_hours=True, listed=False)
+
+
+ENDPOINTS = [
+    # Core stock time series
+    _simple("get_stock_price", "TIME_SERIES_INTRADAY", "Get the latest intraday stock price.",
+            SYMBOL, payload_key="Time Series (1min)", fixed={"interval": "1min"}, ttl=TTL_REALTIME, priority=INTERACTIVE, market_hours=True),
+    _simple("get_intraday", "TIME_SERIES_INTRADAY",
+            "Fetch intraday time series for a given stock symbol (outputsize: compact for the latest 100 bars, full for all; start/end/last_n select from the full history).",
+            SYMBOL, Param("interval", Optional[str], "1min"), OUTPUTSIZE, payload_key="Time Series ({interval})", ttl=TTL_REALTIME, priority=INTERACTIVE, market_hours=True),
+    _simple("get_daily_adjusted", "TIME_SERIES_DAILY_ADJUSTED",
+            "Fetch daily adjusted time series data for a given symbol (outputsize: compact for the latest 100 bars, full for all; start/end/last_n select from the full history).",
+            SYMBOL, OUTPUTSIZE, payload_key="Time Series (Daily)", market_hours=True),
+    _simple("get_weekly", "TIME_SERIES_WEEKLY", "Fetch weekly time series data for a given symbol.",
+            SYMBOL, payload_key="Weekly Time Series", market_hours=True),
+    _simple("get_weekly_adjusted", "TIME_SERIES_WEEKLY_ADJUSTED", "Fetch weekly adjusted time series data for a given symbol.",
+            SYMBOL, payload_key="Weekly Adjusted Time Series", market_hours=True),
+    _simple("get_monthly", "TIME_SERIES_MONTHLY", "Fetch monthly time series data for a given symbol.",
+            SYMBOL, payload_key="Monthly Time Series", market_hours=True),
+    _simple("get_monthly_adjusted", "TIME_SERIES_MONTHLY_ADJUSTED", "Fetch monthly adjusted time series data for a given symbol.",
+            SYMBOL, payload_key="Monthly Adjusted Time Series", market_hours=True),
+    _simple("get_quote", "GLOBAL_QUOTE", "Fetch the current global quote for a given stock symbol.",
+            SYMBOL, payload_key="Global Quote", ttl=TTL_REALTIME, priority=INTERACTIVE, market_hours=True),
+    _simple("get_market_status", "MARKET_STATUS", "Fetch the current global market status.", ttl=TTL_REALTIME, priority=INTERACTIVE, market_hours=True),
+    _simple("get_historical_options_simple", "HISTORICAL_OPTIONS",
+            "Fetch historical options data for a symbol, optionally for a specific date.",
+            SYMBOL, Param("date", Optional[str], None), Param("datatype", default="json"),
+            tool="get_historical_options_tool", path="/get_historical_options/{symbol}"),
+
+    # Alpha Intelligence
+    _simple("get_news_sentiment", "NEWS_SENTIMENT", "Fetch news and sentiment trending data for a symbol.",
+            Param("symbol", upstream="tickers"), ttl=TTL_REALTIME),
+    _simple("get_earnings_transcript", "EARNINGS_CALL_TRANSCRIPT", "Fetch earnings call transcript for a symbol.",
+            SYMBOL, ttl=TTL_SLOW),
+    _simple("get_top_gainers_losers", "TOP_GAINERS_LOSERS", "Fetch top gainers and losers data.", ttl=TTL_REALTIME, priority=INTERACTIVE),
+    _simple("get_insider_transactions", "INSIDER_TRADING", "Fetch insider transactions trending data for a symbol.",
+            SYMBOL, ttl=TTL_SLOW),
+    _simple("get_analytics_fixed", None, "Fetch fixed window technical indicator data (e.g., SMA, EMA, RSI).",
+            SYMBOL, Param("function_name", upstream="function"), Param("interval", default="daily"),
+            _period(10), SERIES_TYPE, market_hours=True),
+    _simple("get_analytics_sliding", None, "Fetch sliding window technical indicator data (requires premium API).",
+            SYMBOL, Param("function_name", upstream="function"), Param("interval", default="daily"),
+            _period(10), SERIES_TYPE, market_hours=True),
+
+    # Fundamental data
+    _simple("get_fundamental_data", "OVERVIEW", "Fetch fundamental data for a symbol.", SYMBOL, ttl=TTL_SLOW,
+            stale_grace=GRACE_SLOW),
+    _simple("get_company_overview_trending", "TRENDING_COMPANY_OVERVIEW", "Fetch trending company overview data.", ttl=TTL_SLOW),
+    _simple("get_etf_profile_and_holdings", "ETF_HOLDINGS", "Fetch ETF profile and holdings for a symbol.", SYMBOL, ttl=TTL_SLOW,
+            stale_grace=GRACE_SLOW),
+    _simple("get_corporate_action_dividends", "DIVIDEND_HISTORY", "Fetch corporate action dividend data for a symbol.",
+            SYMBOL, ttl=TTL_SLOW),
+    _simple("get_corporate_action_splits", "SPLIT_HISTORY", "Fetch corporate action splits data for a symbol.", SYMBOL, ttl=TTL_SLOW),
+    _simple("get_income_statement", "INCOME_STATEMENT", "Fetch income statement data for a company symbol.", SYMBOL, ttl=TTL_SLOW,
+            stale_grace=GRACE_SLOW),
+    _simple("get_balance_sheet", "BALANCE_SHEET", "Fetch the balance sheet data for a company symbol.", SYMBOL, ttl=TTL_SLOW,
+            stale_grace=GRACE_SLOW),
+    _simple("get_cash_flow", "CASH_FLOW", "Fetch the cash flow statement for a company symbol.", SYMBOL, ttl=TTL_SLOW,
+            stale_grace=GRACE_SLOW),
+    _simple("get_earnings_trending", "EARNINGS_TRENDING", "Fetch trending earnings data.", ttl=TTL_SLOW),
+    _simple("get_listing_delisting_status", "LISTING_STATUS", "Fetch listing and delisting status data.",
+            datatype="csv", ttl=TTL_SLOW),
+    _simple("get_earnings_calendar", "EARNINGS_CALENDAR", "Fetch earnings calendar data.",
+            Param("horizon", default="3month"), datatype="csv", ttl=TTL_SLOW, stale_grace=TTL_SLOW),
+    _simple("get_ipo_calendar", "IPO_CALENDAR", "Fetch IPO calendar data.", datatype="csv", ttl=TTL_SLOW),
+
+    # Forex and digital currencies
+    _simple("get_currency_exchange_rate", "CURRENCY_EXCHANGE_RATE",
+            "Gets the current exchange rate between two currencies (e.g.: USD, EUR, BTC).",
+            Param("from_currency"), Param("to_currency"), payload_key="Realtime Currency Exchange Rate", ttl=TTL_REALTIME, priority=INTERACTIVE),
+    _simple("get_fx_daily_data", "FX_DAILY",
+            "Fetch daily time series (timestamp, open, high, low, close) of the FX currency pair "
+            "(outputsize: compact for the latest 100 bars, full for all; start/end/last_n select from the full history).",
+            Param("from_symbol"), Param("to_symbol"), OUTPUTSIZE, payload_key="Time Series FX (Daily)"),
+    _simple("get_fx_weekly_data", "FX_WEEKLY",
+            "Fetch weekly time series (timestamp, open, high, low, close) of the FX currency pair.",
+            Param("from_symbol"), Param("to_symbol"), payload_key="Time Series FX (Weekly)"),
+    _simple("get_fx_monthly_data", "FX_MONTHLY",
+            "Fetch monthly time series (timestamp, open, high, low, close) of the FX currency pair.",
+            Param("from_symbol"), Param("to_symbol"), payload_key="Time Series FX (Monthly)"),
+    _simple("get_digital_currency_daily_data", "DIGITAL_CURRENCY_DAILY",
+            "Fetch daily historical time series for a digital currency (e.g., BTC) traded on a specific market (e.g., EUR).",
+            SYMBOL, Param("market"), payload_key="Time Series (Digital Currency Daily)", listed=False),
+    _simple("get_digital_currency_weekly_data", "DIGITAL_CURRENCY_WEEKLY",
+            "Fetch weekly historical time series for a digital currency (e.g., BTC) traded on a specific market (e.g., EUR).",
+            SYMBOL, Param("market"), payload_key="Time Series (Digital Currency Weekly)", listed=False),
+    _simple("get_digital_currency_monthly_data", "DIGITAL_CURRENCY_MONTHLY",
+            "Fetch monthly historical time series for a digital currency (e.g., BTC) traded on a specific market (e.g., EUR).",
+            SYMBOL, Param("market"), payload_key="Time Series (Digital Currency Monthly)", listed=False),
+
+    # Commodities
+    _simple("get_crude_oil_wti_data", "WTI",
+            "Fetch the West Texas Intermediate (WTI) crude oil prices (interval: daily, weekly, monthly).",
+            Param("interval"), path="/get_crude_oil_wti_data/", ttl=TTL_SLOW),
+    _simple("get_crude_oil_brent_data", "BRENT", "Fetch the Brent crude oil prices (interval: daily, weekly, monthly).",
+            Param("interval"), ttl=TTL_SLOW),
+    _simple("get_natural_gas_data", "NATURAL_GAS",
+            "Fetch the Henry Hub natural gas prices (interval: daily, weekly, monthly).", Param("interval"), ttl=TTL_SLOW),
+    _simple("get_copper_data", "COPPER", "Fetch the global price of copper (interval: monthly, quarterly, annual).",
+            Param("interval"), ttl=TTL_SLOW),
+    _simple("get_aluminum_data", "ALUMINUM", "Fetch the global price of aluminum (interval: monthly, quarterly, annual).",
+            Param("interval"), ttl=TTL_SLOW),
+    _simple("get_wheat_data", "WHEAT", "Fetch the global price of wheat (interval: monthly, quarterly, annual).",
+            Param("interval"), ttl=TTL_SLOW),
+    _simple("get_corn_data", "CORN", "Fetch the global price of corn (interval: monthly, quarterly, annual).",
+            Param("interval"), ttl=TTL_SLOW),
+    _simple("get_cotton_data", "COTTON", "Fetch the global price of cotton (interval: monthly, quarterly, annual).",
+            Param("interval"), ttl=TTL_SLOW),
+    _simple("get_sugar_data", "SUGAR", "Fetch the global price of sugar (interval: monthly, quarterly, annual).",
+            Param("interval"), ttl=TTL_SLOW),
+    _simple("get_coffee_data", "COFFEE", "Fetch the global price of coffee (interval: monthly, quarterly, annual).",
+            Param("interval"), ttl=TTL_SLOW),
+    _simple("get_all_commodities_data", "ALL_COMMODITIES",
+            "Fetch the global price index of all commodities (interval: monthly, quarterly, annual).", Param("interval"), ttl=TTL_SLOW),
+
+    # Economic indicators
+    _simple("get_real_gdp", "REAL_GDP", "Fetch the Real GDP of the US (interval: quarterly, annual).",
+            Param("interval"), tool="get_real_gdp_data_tool", path="/get_real_gdp_data/{interval}", ttl=TTL_SLOW),
+    _simple("get_real_gdp_per_capita", "REAL_GDP_PER_CAPITA", "Fetch the quarterly Real GDP per Capita data of the US.",
+            tool="get_real_gdp_per_capita_data_tool", path="/get_real_gdp_per_capita_data/", ttl=TTL_SLOW),
+    _simple("get_treasury_yield", "TREASURY_YIELD",
+            "Fetch the US treasury yield (interval: daily, weekly, monthly) of a given maturity (e.g.: 10year, 30year).",
+            Param("interval"), Param("maturity"), path="/get_treasury_yield/{interval}-{maturity}", ttl=TTL_SLOW),
+    _simple("get_federal_funds_rate", "FEDERAL_FUNDS_RATE",
+            "Fetch the federal funds rate (interest rate) of the US (interval: daily, weekly, monthly).", Param("interval"), ttl=TTL_SLOW),
+    _simple("get_cpi_data", "CPI", "Fetch the consumer price index (CPI) of the US (interval: monthly, semiannual).",
+            Param("interval"), ttl=TTL_SLOW),
+    _simple("get_inflation", "INFLATION", "Fetch the annual inflation rates (consumer prices) of the US.",
+            tool="get_inflation_data_tool", path="/get_inflation_data", ttl=TTL_SLOW),
+    _simple("get_retail_sales", "RETAIL_SALES", "Fetch the monthly Advance Retail Sales: Retail Trade data of the US.", ttl=TTL_SLOW),
+    _simple("get_durables", "DURABLES", "Fetch the monthly manufacturers' new orders of durable goods in the US.", ttl=TTL_SLOW),
+    _simple("get_monthly_unemployment", "UNEMPLOYMENT", "Fetch the monthly unemployment rate of the US.",
+            tool="get_monthly_unemployment_rate_tool", path="/get_monthly_unemployment_rate", ttl=TTL_SLOW),
+    _simple("get_nonfarm_payroll", "NONFARM_PAYROLL",
+            "Fetch the monthly US All Employees: Total Nonfarm (Total Nonfarm Payroll).",
+            tool="get_nonfarm_payrolls_tool", path="/get_nonfarm_payrolls", ttl=TTL_SLOW),
+
+    # Technical indicators
+    _indicator("SMA", "Fetch Simple Moving Average (SMA) values for a given symbol.", _period(60), SERIES_TYPE),
+    _indicator("EMA", "Fetch Exponential Moving Average (EMA) values for a given symbol.", _period(60), SERIES_TYPE),
+    _indicator("WMA", "Fetch Weighted Moving Average (WMA) values for a given symbol.", _period(60), SERIES_TYPE),
+    _indicator("DEMA", "Fetch Double Exponential Moving Average (DEMA) values for a given symbol.",
+               _period(60), SERIES_TYPE),
+    _indicator("TEMA", "Fetch Triple Exponential Moving Average (TEMA) values for a given symbol.",
+               _period(60), SERIES_TYPE),
+    _indicator("TRIMA", "Fetch Triangular Moving Average (TRIMA) values for a given symbol.", _period(60), SERIES_TYPE),
+    _indicator("KAMA", "Fetch Kaufman Adaptive Moving Average (KAMA) values for a given symbol.",
+               _period(60), SERIES_TYPE),
+    _indicator("MAMA", "Fetch MESA Adaptive Moving Average (MAMA) values for a given symbol.", _period(60), SERIES_TYPE),
+    _indicator("VWAP", "Fetch Volume Weighted Average Price (VWAP) values for a given symbol (intraday intervals only).",
+               interval="15min"),
+    _indicator("T3", "Fetch Triple Exponential Moving Average (T3) values for a given symbol.",
+               _period(60), SERIES_TYPE, name="get_tthree_values", tool="get_tthree_data_tool",
+               path="/get_tthree_data/{symbol}/{series_type}"),
+    _indicator("MACD", "Fetch Moving Average Convergence Divergence (MACD) values for a given symbol.",
+               Param("series_type", default="open"), _period(12, "fastperiod"), _period(26, "slowperiod"),
+               _period(9, "signalperiod"), path="/get_macd_data/{symbol}/{series_type}"),
+    _indicator("MACDEXT", "Fetch Moving Average Convergence Divergence (MACD) with controllable moving average type.",
+               Param("series_type", default="open"), _period(12, "fastperiod"), _period(26, "slowperiod"),
+               _period(9, "signalperiod"), path="/get_macdext_data/{symbol}/{series_type}"),
+    _indicator("STOCH", "Fetch the Stochastic Oscillator (STOCH) values for a given symbol.",
+               _period(14, "fastk_period"), _period(3, "slowk_period"), _period(3, "slowd_period"), SERIES_TYPE,
+               name="get_stoch_oscillator_values"),
+    _indicator("STOCHF", "Fetch the Stochastic Fast (STOCHF) values for a given symbol.",
+               _period(5, "fastk_period"), Param("fastdperiod", int, 3, upstream="fastd_period"),
+               name="get_stochf_oscillator_values", path="/get_stochfast_data/{symbol}"),
+    _indicator("RSI", "Fetch Relative Strength Index (RSI) values for a given symbol.", _period(60), SERIES_TYPE),
+    _indicator("STOCHRSI", "Fetch Stochastic Relative Strength Index (STOCHRSI) values for a given symbol.",
+               _period(60), SERIES_TYPE, _period(5, "fastkperiod"), _period(3, "fastdperiod")),
+    _indicator("WILLR", "Fetch Williams %R (WILLR) values for a given symbol.", _period(60),
+               tool="get_wilrr_data_tool"),
+    _indicator("ADX", "Fetch Average Directional Movement Index (ADX) values for a given symbol.",
+               _period(60), SERIES_TYPE),
+    _indicator("ADXR", "Fetch Average Directional Movement Rating Index (ADXR) values for a given symbol.",
+               _period(60), SERIES_TYPE),
+    _indicator("APO", "Fetch Absolute Price Oscillator (APO) values for a given symbol.",
+               SERIES_TYPE, _period(12, "fastperiod"), _period(26, "slowperiod")),
+    _indicator("PPO", "Fetch Percentage Price Oscillator (PPO) values for a given symbol.",
+               SERIES_TYPE, _period(12, "fastperiod"), _period(26, "slowperiod")),
+    _indicator("MOM", "Fetch Momentum (MOM) values for a given symbol.", _period(60), SERIES_TYPE),
+    _indicator("BOP", "Fetch Balance of Power (BOP) values for a given symbol."),
+    _indicator("CCI", "Fetch Commodity Channel Index (CCI) values for a given symbol.", _period(60)),
+    _indicator("CMO", "Fetch Chande momentum oscillator (CMO) values for a given symbol.", _period(60), SERIES_TYPE),
+    _indicator("ROC", "Fetch rate of change (ROC) values for a given symbol.", _period(60), SERIES_TYPE),
+    _indicator("ROCR", "Fetch rate of change ratio (ROCR) values for a given symbol.", _period(60), SERIES_TYPE),
+    _indicator("AROON", "Fetch Aroon (AROON) values for a given symbol.", _period(14)),
+    _indicator("AROONOSC", "Fetch Aroon Oscillator (AROONOSC) values for a given symbol.", _period(14)),
+    _indicator("MFI", "Fetch Money Flow Index (MFI) values for a given symbol.", _period(14)),
+    _indicator("TRIX", "Fetch 1-day rate of change of a triple smooth EMA (TRIX) values for a given symbol.",
+               _period(15), SERIES_TYPE),
+    _indicator("ULTOSC", "Fetch Ultimate Oscillator (ULTOSC) values for a given symbol.",
+               _period(7, "timeperiod1"), _period(14, "timeperiod2"), _period(28, "timeperiod3")),
+    _indicator("DX", "Fetch Directional Movement Index (DX) values for a given symbol.", _period(14)),
+    _indicator("MINUS_DI", "Fetch Minus Directional Indicator (MINUS_DI) values for a given symbol.", _period(14)),
+    _indicator("PLUS_DI", "Fetch Plus Directional Indicator (PLUS_DI) values for a given symbol.", _period(14)),
+    _indicator("MINUS_DM", "Fetch Minus Directional Movement (MINUS_DM) values for a given symbol.", _period(14)),
+    _indicator("PLUS_DM", "Fetch Plus Directional Movement (PLUS_DM) values for a given symbol.", _period(14)),
+    _indicator("BBANDS", "Fetch Bollinger Bands (BBANDS) values for a given symbol.",
+               _period(5), SERIES_TYPE, Param("nbdevup", float, 2), Param("nbdevdn", float, 2), _period(0, "matype")),
+    _indicator("MIDPOINT", "Fetch MIDPOINT values ((highest value + lowest value) / 2) for a given symbol.",
+               _period(14)),
+    _indicator("MIDPRICE", "Fetch MIDPRICE values ((highest high + lowest low) / 2) for a given symbol.", _period(14)),
+    _indicator("SAR", "Fetch Parabolic SAR (SAR) values for a given symbol.",
+               Param("acceleration", float, 0.02), Param("maximum", float, 0.2)),
+    _indicator("TRANGE", "Fetch True Range (TRANGE) values for a given symbol."),
+    _indicator("ATR", "Fetch Average True Range (ATR) values for a given symbol.", _period(14)),
+    _indicator("NATR", "Fetch Normalized Average True Range (NATR) values for a given symbol.", _period(14)),
+    Endpoint(name="get_ad_values", function="AD", params=(SYMBOL, Param("interval", default="daily")),
+             payload_key="Technical Analysis: Chaikin A/D", tool="get_ad_data_tool", path="/get_ad_data/{symbol}",
+             doc="Fetch Chaikin A/D line (AD) values for a given symbol.", market_hours=True, listed=False),
+    _indicator("ADOSC", "Fetch Chaikin A/D Oscillator (ADOSC) values for a given symbol.",
+               _period(3, "fastperiod"), _period(10, "slowperiod")),
+    _indicator("OBV", "Fetch On Balance Volume (OBV) values for a given symbol.", path="/get_obv_values/{symbol}"),
+    _indicator("HT_TRENDLINE", "Fetch Hilbert transform, instantaneous trendline (HT_TRENDLINE) values for a given symbol."),
+    _indicator("HT_SINE", "Fetch Hilbert transform, sine wave (HT_SINE) values for a given symbol."),
+    _indicator("HT_TRENDMODE", "Fetch Hilbert transform, trend vs cycle mode (HT_TRENDMODE) values for a given symbol."),
+    _indicator("HT_DCPERIOD", "Fetch Hilbert transform, dominant cycle period (HT_DCPERIOD) values for a given symbol."),
+    _indicator("HT_DCPHASE", "Fetch Hilbert transform, dominant cycle phase (HT_DCPHASE) values for a given symbol."),
+    _indicator("HT_PHASOR", "Fetch Hilbert transform, phasor components (HT_PHASOR) values for a given symbol."),
+]
+
+ENDPOINTS_BY_NAME = {endpoint.name: endpoint for endpoint in ENDPOINTS}
+
+# Technical indicator endpoints by Alpha Vantage function ("SMA", "MACD", ...)
+INDICATORS = {endpoint.function: endpoint for endpoint in ENDPOINTS
+              if endpoint.payload_key and endpoint.payload_key.startswith("Technical Analysis")}
@@ -0,0 +1,36 @@
+import os
+import requests
+from requests.adapters import HTTPAdapter
+
+# Shared HTTP client for every Alpha Vantage call.
+# A single Session keeps TCP/TLS connections alive between tool calls
+# instead of paying a new handshake on each request.
+
+BASE_URL = os.getenv("ALPHA_VANTAGE_BASE_URL", "https://www.alphavantage.co/query")
+POOL_SIZE = int(os.getenv("ALPHA_VANTAGE_POOL_SIZE", "10"))
+DEFAULT_TIMEOUT = float(os.getenv("ALPHA_VANTAGE_TIMEOUT", "10"))
+
+
+def _build_session(pool_size: int) -> requests.Session:
+    """
+    Create a Session whose connection pool holds up to pool_size keep-alive sockets.
+    """
+    session = requests.Session()
+    # pool_block=False: extra concurrent callers get a throwaway connection
+    # instead of waiting for a pooled one to be released
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, pool_block=False)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+session = _build_session(POOL_SIZE)
+
+
+def get(url: str = BASE_URL, params: dict = None, timeout: float = DEFAULT_TIMEOUT,
+        stream: bool = False) -> requests.Response:
+    """
+    Send a GET request through the shared pooled session. With stream, the body is read by the caller
+    as it arrives; the connection returns to the pool once it has been read or the response closed.
+    """
+    return session.get(url, params=params, timeout=timeout, stream=stream)
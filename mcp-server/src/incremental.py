@@ -0,0 +1,315 @@
+import threading
+from collections import OrderedDict, deque
+from typing import Optional
+
+# Streaming versions of the most used indicators. Each object consumes one bar
+# at a time in O(1) and yields exactly what the batch functions in indicators.py
+# produce for the same bar, so a query after a new intraday bar only pays for
+# that bar instead of the whole history.
+#
+# A bar is a dict with open/high/low/close/volume floats; update() returns the
+# outputs for that bar, or None while the indicator is still warming up.
+
+MAX_STATES = 256  # (symbol, interval, indicator, params) states kept in memory
+
+
+class RunningEma:
+    """
+    TA-Lib EMA: the first value is the SMA of the first n inputs.
+    """
+
+    def __init__(self, n: int):
+        self.n = n
+        self.k = 2 / (n + 1)
+        self.count = 0
+        self.total = 0.0
+        self.value = None
+
+    def add(self, x: float) -> Optional[float]:
+        if self.value is None:
+            self.count += 1
+            self.total += x
+            if self.count == self.n:
+                self.value = self.total / self.n
+        else:
+            self.value += self.k * (x - self.value)
+        return self.value
+
+
+class RunningWilder:
+    """
+    Wilder average: the first value is the mean of the first n inputs.
+    """
+
+    def __init__(self, n: int):
+        self.n = n
+        self.count = 0
+        self.total = 0.0
+        self.value = None
+
+    def add(self, x: float) -> Optional[float]:
+        if self.value is None:
+            self.count += 1
+            self.total += x
+            if self.count == self.n:
+                self.value = self.total / self.n
+        else:
+            self.value = (self.value * (self.n - 1) + x) / self.n
+        return self.value
+
+
+class RollingMean:
+    def __init__(self, n: int):
+        self.window = deque(maxlen=n)
+        self.total = 0.0
+
+    def add(self, x: float) -> Optional[float]:
+        if len(self.window) == self.window.maxlen:
+            self.total -= self.window[0]
+        self.window.append(x)
+        self.total += x
+        return self.total / len(self.window) if len(self.window) == self.window.maxlen else None
+
+
+class RollingExtreme:
+    """
+    Max (or min) of the last n inputs with a monotonic deque: amortized O(1) per input.
+    """
+
+    def __init__(self, n: int, highest: bool = True):
+        self.n = n
+        self.sign = 1 if highest else -1
+        self.candidates = deque()  # (index, signed value), values decreasing
+        self.index = -1
+
+    def add(self, x: float) -> Optional[float]:
+        self.index += 1
+        value = self.sign * x
+        while self.candidates and self.candidates[-1][1] <= value:
+            self.candidates.pop()
+        self.candidates.append((self.index, value))
+        if self.candidates[0][0] <= self.index - self.n:
+            self.candidates.popleft()
+        return self.sign * self.candidates[0][1] if self.index >= self.n - 1 else None
+
+
+class Ema:
+    def __init__(self, time_period: int, series_type: str = "close"):
+        self.price = series_type
+        self.average = RunningEma(time_period)
+
+    def update(self, bar: dict) -> Optional[dict]:
+        value = self.average.add(bar[self.price])
+        return None if value is None else {"EMA": value}
+
+
+class Rsi:
+    def __init__(self, time_period: int, series_type: str = "close"):
+        self.price = series_type
+        self.previous = None
+        self.gain = RunningWilder(time_period)
+        self.loss = RunningWilder(time_period)
+
+    def update(self, bar: dict) -> Optional[dict]:
+        x = bar[self.price]
+        if self.previous is None:
+            self.previous = x
+            return None
+        change, self.previous = x - self.previous, x
+        gain, loss = self.gain.add(max(change, 0.0)), self.loss.add(max(-change, 0.0))
+        if gain is None:
+            return None
+        return {"RSI": 100 * gain / (gain + loss) if gain + loss else 0.0}
+
+
+class Macd:
+    def __init__(self, fastperiod: int, slowperiod: int, signalperiod: int, series_type: str = "close"):
+        fast, slow = sorted((fastperiod, slowperiod))
+        self.price = series_type
+        self.skip = slow - fast  # TA-Lib seeds the fast EMA at the bar where the slow one starts
+        self.fast = RunningEma(fast)
+        self.slow = RunningEma(slow)
+        self.signal = RunningEma(signalperiod)
+        self.count = 0
+
+    def update(self, bar: dict) -> Optional[dict]:
+        x = bar[self.price]
+        self.count += 1
+        slow = self.slow.add(x)
+        fast = self.fast.add(x) if self.count > self.skip else None
+        if slow is None:
+            return None
+        line = fast - slow
+        signal = self.signal.add(line)
+        if signal is None:
+            return None
+        return {"MACD": line, "MACD_Signal": signal, "MACD_Hist": line - signal}
+
+
+class Atr:
+    def __init__(self, time_period: int):
+        self.previous_close = None
+        self.average = RunningWilder(time_period)
+
+    def update(self, bar: dict) -> Optional[dict]:
+        previous, self.previous_close = self.previous_close, bar["close"]
+        if previous is None:
+            return None
+        true_range = max(bar["high"], previous) - min(bar["low"], previous)
+        value = self.average.add(true_range)
+        return None if value is None else {"ATR": value}
+
+
+class Obv:
+    def __init__(self):
+        self.previous_close = None
+        self.value = 0.0
+
+    def update(self, bar: dict) -> Optional[dict]:
+        if self.previous_close is None:
+            self.value = bar["volume"]
+        elif bar["close"] > self.previous_close:
+            self.value += bar["volume"]
+        elif bar["close"] < self.previous_close:
+            self.value -= bar["volume"]
+        self.previous_close = bar["close"]
+        return {"OBV": self.value}
+
+
+class Sar:
+    """
+    Parabolic SAR, same state machine as indicators.sar().
+    """
+
+    def __init__(self, acceleration: float = 0.02, maximum: float = 0.2):
+        self.acceleration = acceleration
+        self.maximum = maximum
+        self.first = None
+        self.started = False
+
+    def update(self, bar: dict) -> Optional[dict]:
+        high, low = bar["high"], bar["low"]
+        if self.first is None:
+            self.first = (high, low)
+            return None
+        if not self.started:
+            first_high, first_low = self.first
+            down, up = first_low - low, high - first_high
+            self.is_long = not (down > 0 and down > up)
+            self.factor = self.acceleration
+            if self.is_long:
+                self.extreme, self.value = high, first_low
+            else:
+                self.extreme, self.value = low, first_high
+            self.new_high, self.new_low = high, low
+            self.started = True
+        prev_high, prev_low = self.new_high, self.new_low
+        self.new_high, self.new_low = high, low
+        if self.is_long:
+            if low <= self.value:
+                self.is_long, self.value = False, max(self.extreme, prev_high, high)
+                result = self.value
+                self.factor, self.extreme = self.acceleration, low
+                self.value = max(self.value + self.factor * (self.extreme - self.value), prev_high, high)
+            else:
+                result = self.value
+                if high > self.extreme:
+                    self.extreme, self.factor = high, min(self.factor + self.acceleration, self.maximum)
+                self.value = min(self.value + self.factor * (self.extreme - self.value), prev_low, low)
+        else:
+            if high >= self.value:
+                self.is_long, self.value = True, min(self.extreme, prev_low, low)
+                result = self.value
+                self.factor, self.extreme = self.acceleration, high
+                self.value = min(self.value + self.factor * (self.extreme - self.value), prev_low, low)
+            else:
+                result = self.value
+                if low < self.extreme:
+                    self.extreme, self.factor = low, min(self.factor + self.acceleration, self.maximum)
+                self.value = max(self.value + self.factor * (self.extreme - self.value), prev_high, high)
+        return {"SAR": result}
+
+
+class Stoch:
+    def __init__(self, fastk_period: int, slowk_period: int, slowd_period: int):
+        self.highest = RollingExtreme(fastk_period, highest=True)
+        self.lowest = RollingExtreme(fastk_period, highest=False)
+        self.slow_k = RollingMean(slowk_period)
+        self.slow_d = RollingMean(slowd_period)
+
+    def update(self, bar: dict) -> Optional[dict]:
+        highest, lowest = self.highest.add(bar["high"]), self.lowest.add(bar["low"])
+        if highest is None:
+            return None
+        spread = highest - lowest
+        slow_k = self.slow_k.add(100 * (bar["close"] - lowest) / spread if spread else 0.0)
+        slow_d = None if slow_k is None else self.slow_d.add(slow_k)
+        return None if slow_d is None else {"SlowK": slow_k, "SlowD": slow_d}
+
+
+# Alpha Vantage function -> factory taking the bound tool arguments
+INCREMENTAL = {
+    "EMA": lambda a: Ema(int(a["time_period"]), a.get("series_type") or "close"),
+    "RSI": lambda a: Rsi(int(a["time_period"]), a.get("series_type") or "close"),
+    "MACD": lambda a: Macd(int(a["fastperiod"]), int(a["slowperiod"]), int(a["signalperiod"]),
+                           a.get("series_type") or "close"),
+    "ATR": lambda a: Atr(int(a["time_period"])),
+    "OBV": lambda a: Obv(),
+    "SAR": lambda a: Sar(float(a["acceleration"]), float(a["maximum"])),
+    "STOCH": lambda a: Stoch(int(a["fastk_period"]), int(a["slowk_period"]), int(a["slowd_period"])),
+}
+
+
+class IndicatorState:
+    """
+    One streaming indicator over one series, with the formatted output rows produced so far.
+    """
+
+    def __init__(self, function: str, arguments: dict):
+        self.function = function
+        self.arguments = arguments
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        self.indicator = INCREMENTAL[self.function](self.arguments)
+        self.rows = []          # (timestamp, formatted outputs), oldest first
+        self.last_stamp = None  # newest bar consumed
+        self.last_bar = None    # its raw upstream values, to notice revisions and adjustments
+        self.source = None      # upstream payload object consumed last
+        self.payload = None     # rows rendered newest first, built on demand after updates
+        self.bars = 0
+
+
+class IndicatorStates:
+    """
+    LRU map of (function, series and params key) -> IndicatorState.
+    """
+
+    def __init__(self, max_states: int = MAX_STATES):
+        self.max_states = max_states
+        self._states = OrderedDict()
+        self._lock = threading.Lock()
+        self.created = 0
+        self.evictions = 0
+
+    def get(self, function: str, key: tuple, arguments: dict) -> IndicatorState:
+        with self._lock:
+            state = self._states.get((function, key))
+            if state is None:
+                state = self._states[function, key] = IndicatorState(function, arguments)
+                self.created += 1
+                if len(self._states) > self.max_states:
+                    self._states.popitem(last=False)
+                    self.evictions += 1
+            else:
+                self._states.move_to_end((function, key))
+            return state
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"states": len(self._states), "created": self.created, "evictions": self.evictions,
+                    "bars": sum(state.bars for state in self._states.values())}
+
+
+indicator_states = IndicatorStates()
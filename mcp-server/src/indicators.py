@@ -0,0 +1,596 @@
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+# NumPy implementations of the Alpha Vantage technical indicators. Alpha Vantage
+# computes them with TA-Lib, so warm-up (lookback) lengths and seeding follow TA-Lib:
+# every function returns an array as long as its input, NaN until the first value.
+# Recursive smoothers (EMA, Wilder) need a sequential pass; everything else is vectorized.
+
+
+def _empty(length: int) -> np.ndarray:
+    return np.full(length, np.nan)
+
+
+def _first_valid(x: np.ndarray) -> int:
+    valid = np.flatnonzero(~np.isnan(x))
+    return int(valid[0]) if len(valid) else len(x)
+
+
+def _windows(x: np.ndarray, n: int) -> np.ndarray:
+    return sliding_window_view(x, n)
+
+
+def _divide(numerator, denominator) -> np.ndarray:
+    """
+    numerator / denominator with 0 where the denominator is 0 (TA-Lib's convention).
+    """
+    numerator, denominator = np.broadcast_arrays(np.asarray(numerator, float), np.asarray(denominator, float))
+    out = np.zeros(numerator.shape)
+    np.divide(numerator, denominator, out=out, where=denominator != 0)
+    return np.where(np.isnan(denominator) | np.isnan(numerator), np.nan, out)
+
+
+def _smooth(values: list, prev: float, k: float) -> list:
+    """
+    Exponential smoothing prev += k * (value - prev) over values, returning every step.
+    """
+    out = []
+    for value in values:
+        prev += k * (value - prev)
+        out.append(prev)
+    return out
+
+
+def _wilder(values: list, prev: float, n: int) -> list:
+    """
+    Wilder smoothing prev = (prev * (n - 1) + value) / n over values, returning every step.
+    """
+    out = []
+    for value in values:
+        prev = (prev * (n - 1) + value) / n
+        out.append(prev)
+    return out
+
+
+# Moving averages
+
+def sma(x: np.ndarray, n: int) -> np.ndarray:
+    out = _empty(len(x))
+    start = _first_valid(x)
+    if len(x) - start >= n:
+        sums = np.cumsum(np.concatenate(([0.0], x[start:])))
+        out[start + n - 1:] = (sums[n:] - sums[:-n]) / n
+    return out
+
+
+def ema(x: np.ndarray, n: int, k: float = None, seed_end: int = None) -> np.ndarray:
+    """
+    EMA seeded with the SMA of the n values ending at seed_end (default: the first n valid values).
+    """
+    out = _empty(len(x))
+    if seed_end is None:
+        seed_end = _first_valid(x) + n - 1
+    if seed_end >= len(x):
+        return out
+    prev = float(np.mean(x[seed_end - n + 1:seed_end + 1]))
+    out[seed_end] = prev
+    out[seed_end + 1:] = _smooth(x[seed_end + 1:].tolist(), prev, 2 / (n + 1) if k is None else k)
+    return out
+
+
+def wma(x: np.ndarray, n: int) -> np.ndarray:
+    out = _empty(len(x))
+    if len(x) >= n:
+        weights = np.arange(1, n + 1, dtype=float)
+        out[n - 1:] = _windows(x, n) @ weights / weights.sum()
+    return out
+
+
+def dema(x: np.ndarray, n: int) -> np.ndarray:
+    first = ema(x, n)
+    return 2 * first - ema(first, n)
+
+
+def tema(x: np.ndarray, n: int) -> np.ndarray:
+    first = ema(x, n)
+    second = ema(first, n)
+    return 3 * first - 3 * second + ema(second, n)
+
+
+def trima(x: np.ndarray, n: int) -> np.ndarray:
+    if n % 2:
+        return sma(sma(x, (n + 1) // 2), (n + 1) // 2)
+    return sma(sma(x, n // 2), n // 2 + 1)
+
+
+def kama(x: np.ndarray, n: int) -> np.ndarray:
+    out = _empty(len(x))
+    if len(x) <= n:
+        return out
+    fast, slow = 2 / 3, 2 / 31
+    direction = np.abs(x[n:] - x[:-n])
+    volatility = np.convolve(np.abs(np.diff(x)), np.ones(n), "valid")
+    efficiency = np.where((volatility == 0) | (volatility <= direction), 1.0, direction / np.where(volatility == 0, 1, volatility))
+    constants = (efficiency * (fast - slow) + slow) ** 2
+    prev = float(x[n - 1])
+    values = []
+    for value, constant in zip(x[n:].tolist(), constants.tolist()):
+        prev += constant * (value - prev)
+        values.append(prev)
+    out[n:] = values
+    return out
+
+
+def t3(x: np.ndarray, n: int, vfactor: float = 0.7) -> np.ndarray:
+    e1 = ema(x, n)
+    e2 = ema(e1, n)
+    e3 = ema(e2, n)
+    e4 = ema(e3, n)
+    e5 = ema(e4, n)
+    e6 = ema(e5, n)
+    a = vfactor
+    c1 = -a ** 3
+    c2 = 3 * a ** 2 + 3 * a ** 3
+    c3 = -6 * a ** 2 - 3 * a - 3 * a ** 3
+    c4 = 1 + 3 * a + a ** 3 + 3 * a ** 2
+    return c1 * e6 + c2 * e5 + c3 * e4 + c4 * e3
+
+
+# Momentum
+
+def macd(x: np.ndarray, fast: int, slow: int, signal: int) -> tuple:
+    if fast > slow:
+        fast, slow = slow, fast
+    # TA-Lib seeds both averages at the same bar, where the slow one becomes available
+    line = ema(x, fast, seed_end=slow - 1) - ema(x, slow)
+    trigger = ema(line, signal)
+    line = np.where(np.isnan(trigger), np.nan, line)
+    return line, trigger, line - trigger
+
+
+def _gains_losses(x: np.ndarray, n: int) -> tuple:
+    """
+    Wilder-smoothed average gain and loss, first value at index n.
+    """
+    gain, loss = _empty(len(x)), _empty(len(x))
+    if len(x) <= n:
+        return gain, loss
+    change = np.diff(x)
+    up, down = np.maximum(change, 0), np.maximum(-change, 0)
+    first_gain, first_loss = up[:n].mean(), down[:n].mean()
+    gain[n], loss[n] = first_gain, first_loss
+    gain[n + 1:] = _wilder(up[n:].tolist(), first_gain, n)
+    loss[n + 1:] = _wilder(down[n:].tolist(), first_loss, n)
+    return gain, loss
+
+
+def rsi(x: np.ndarray, n: int) -> np.ndarray:
+    gain, loss = _gains_losses(x, n)
+    return 100 * _divide(gain, gain + loss)
+
+
+def cmo(x: np.ndarray, n: int) -> np.ndarray:
+    gain, loss = _gains_losses(x, n)
+    return 100 * _divide(gain - loss, gain + loss)
+
+
+def mom(x: np.ndarray, n: int) -> np.ndarray:
+    out = _empty(len(x))
+    out[n:] = x[n:] - x[:-n]
+    return out
+
+
+def rocr(x: np.ndarray, n: int) -> np.ndarray:
+    out = _empty(len(x))
+    out[n:] = _divide(x[n:], x[:-n])
+    return out
+
+
+def roc(x: np.ndarray, n: int) -> np.ndarray:
+    out = _empty(len(x))
+    out[n:] = np.where(x[:-n] != 0, (rocr(x, n)[n:] - 1) * 100, 0.0)
+    return out
+
+
+def trix(x: np.ndarray, n: int) -> np.ndarray:
+    return roc(ema(ema(ema(x, n), n), n), 1)
+
+
+def apo(x: np.ndarray, fast: int, slow: int) -> np.ndarray:
+    return sma(x, fast) - sma(x, slow)
+
+
+def ppo(x: np.ndarray, fast: int, slow: int) -> np.ndarray:
+    slow_average = sma(x, slow)
+    return 100 * _divide(sma(x, fast) - slow_average, slow_average)
+
+
+def bop(open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+    return _divide(close - open_, high - low)
+
+
+def _extremes(high: np.ndarray, low: np.ndarray, n: int) -> tuple:
+    highest, lowest = _empty(len(high)), _empty(len(low))
+    if len(high) >= n:
+        highest[n - 1:] = _windows(high, n).max(axis=1)
+        lowest[n - 1:] = _windows(low, n).min(axis=1)
+    return highest, lowest
+
+
+def stochf(high: np.ndarray, low: np.ndarray, close: np.ndarray, fastk: int, fastd: int) -> tuple:
+    highest, lowest = _extremes(high, low, fastk)
+    k = 100 * _divide(close - lowest, highest - lowest)
+    d = sma(k, fastd)
+    return np.where(np.isnan(d), np.nan, k), d
+
+
+def stoch(high: np.ndarray, low: np.ndarray, close: np.ndarray, fastk: int, slowk: int, slowd: int) -> tuple:
+    highest, lowest = _extremes(high, low, fastk)
+    k = sma(100 * _divide(close - lowest, highest - lowest), slowk)
+    d = sma(k, slowd)
+    return np.where(np.isnan(d), np.nan, k), d
+
+
+def stochrsi(x: np.ndarray, n: int, fastk: int, fastd: int) -> tuple:
+    values = rsi(x, n)
+    return stochf(values, values, values, fastk, fastd)
+
+
+def willr(high: np.ndarray, low: np.ndarray, close: np.ndarray, n: int) -> np.ndarray:
+    highest, lowest = _extremes(high, low, n)
+    return -100 * _divide(highest - close, highest - lowest)
+
+
+def cci(high: np.ndarray, low: np.ndarray, close: np.ndarray, n: int) -> np.ndarray:
+    typical = (high + low + close) / 3
+    out = _empty(len(typical))
+    if len(typical) >= n:
+        windows = _windows(typical, n)
+        average = windows.mean(axis=1)
+        deviation = np.abs(windows - average[:, None]).mean(axis=1)
+        out[n - 1:] = _divide(typical[n - 1:] - average, 0.015 * deviation)
+    return out
+
+
+def aroon(high: np.ndarray, low: np.ndarray, n: int) -> tuple:
+    up, down = _empty(len(high)), _empty(len(low))
+    if len(high) > n:
+        # Bars since the extreme of the last n + 1 bars; ties go to the most recent bar
+        since_high = np.argmax(_windows(high, n + 1)[:, ::-1], axis=1)
+        since_low = np.argmin(_windows(low, n + 1)[:, ::-1], axis=1)
+        up[n:] = 100 * (n - since_high) / n
+        down[n:] = 100 * (n - since_low) / n
+    return down, up
+
+
+def aroonosc(high: np.ndarray, low: np.ndarray, n: int) -> np.ndarray:
+    down, up = aroon(high, low, n)
+    return up - down
+
+
+def mfi(high: np.ndarray, low: np.ndarray, close: np.ndarray, volume: np.ndarray, n: int) -> np.ndarray:
+    out = _empty(len(close))
+    if len(close) <= n:
+        return out
+    typical = (high + low + close) / 3
+    flow = typical * volume
+    change = np.diff(typical)
+    positive = np.convolve(np.where(change > 0, flow[1:], 0.0), np.ones(n), "valid")
+    negative = np.convolve(np.where(change < 0, flow[1:], 0.0), np.ones(n), "valid")
+    total = positive + negative
+    out[n:] = np.where(total < 1, 0.0, 100 * positive / np.where(total == 0, 1, total))
+    return out
+
+
+def ultosc(high: np.ndarray, low: np.ndarray, close: np.ndarray, period1: int, period2: int, period3: int) -> np.ndarray:
+    periods = sorted((period1, period2, period3))
+    out = _empty(len(close))
+    if len(close) <= periods[2]:
+        return out
+    floor = np.minimum(low[1:], close[:-1])
+    pressure = close[1:] - floor
+    ranges = np.maximum(high[1:], close[:-1]) - floor
+    averages = []
+    for period in periods:
+        pressure_sum = np.convolve(pressure, np.ones(period), "valid")[periods[2] - period:]
+        range_sum = np.convolve(ranges, np.ones(period), "valid")[periods[2] - period:]
+        averages.append(_divide(pressure_sum, range_sum))
+    out[periods[2]:] = 100 * (4 * averages[0] + 2 * averages[1] + averages[2]) / 7
+    return out
+
+
+# Directional movement
+
+def _directional(high: np.ndarray, low: np.ndarray) -> tuple:
+    """
+    +DM and -DM per bar (index i compares bar i with bar i - 1).
+    """
+    up = np.diff(high)
+    down = -np.diff(low)
+    plus = np.where((up > 0) & (up > down), up, 0.0)
+    minus = np.where((down > 0) & (down > up), down, 0.0)
+    return plus, minus
+
+
+def trange(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+    out = _empty(len(close))
+    out[1:] = np.maximum(high[1:], close[:-1]) - np.minimum(low[1:], close[:-1])
+    return out
+
+
+def _wilder_sum(values: np.ndarray, n: int) -> np.ndarray:
+    """
+    TA-Lib running sum of per-bar values (values[0] is bar 1): seeded with n - 1 bars,
+    then prev - prev / n + value. Result index i corresponds to bar i + 1.
+    """
+    out = _empty(len(values))
+    if len(values) < n - 1 or n < 2:
+        return out
+    seed = float(values[:n - 1].sum())
+    out[n - 2] = seed
+    out[n - 1:] = _running(values[n - 1:].tolist(), seed, n)
+    return out
+
+
+def _running(values: list, prev: float, n: int) -> list:
+    out = []
+    for value in values:
+        prev = prev - prev / n + value
+        out.append(prev)
+    return out
+
+
+def _dm(high: np.ndarray, low: np.ndarray, n: int) -> tuple:
+    plus, minus = _directional(high, low)
+    result = []
+    for values in (plus, minus):
+        out = _empty(len(high))
+        out[1:] = _wilder_sum(values, n)
+        result.append(out)
+    return tuple(result)
+
+
+def plus_dm(high: np.ndarray, low: np.ndarray, n: int) -> np.ndarray:
+    return _dm(high, low, n)[0]
+
+
+def minus_dm(high: np.ndarray, low: np.ndarray, n: int) -> np.ndarray:
+    return _dm(high, low, n)[1]
+
+
+def _di(high: np.ndarray, low: np.ndarray, close: np.ndarray, n: int) -> tuple:
+    plus, minus = _dm(high, low, n)
+    ranges = _empty(len(close))
+    ranges[1:] = _wilder_sum(trange(high, low, close)[1:], n)
+    # The first DI value comes one smoothing step after the DM/TR seed
+    plus[:n], minus[:n], ranges[:n] = np.nan, np.nan, np.nan
+    return 100 * _divide(plus, ranges), 100 * _divide(minus, ranges)
+
+
+def plus_di(high: np.ndarray, low: np.ndarray, close: np.ndarray, n: int) -> np.ndarray:
+    return _di(high, low, close, n)[0]
+
+
+def minus_di(high: np.ndarray, low: np.ndarray, close: np.ndarray, n: int) -> np.ndarray:
+    return _di(high, low, close, n)[1]
+
+
+def dx(high: np.ndarray, low: np.ndarray, close: np.ndarray, n: int) -> np.ndarray:
+    plus, minus = _di(high, low, close, n)
+    return 100 * _divide(np.abs(plus - minus), plus + minus)
+
+
+def adx(high: np.ndarray, low: np.ndarray, close: np.ndarray, n: int) -> np.ndarray:
+    index = dx(high, low, close, n)
+    out = _empty(len(index))
+    start = 2 * n - 1
+    if len(index) > start:
+        first = float(index[n:start + 1].mean())
+        out[start] = first
+        out[start + 1:] = _wilder(index[start + 1:].tolist(), first, n)
+    return out
+
+
+def adxr(high: np.ndarray, low: np.ndarray, close: np.ndarray, n: int) -> np.ndarray:
+    index = adx(high, low, close, n)
+    out = _empty(len(index))
+    out[n - 1:] = (index[n - 1:] + index[:len(index) - n + 1]) / 2
+    return out
+
+
+# Volatility
+
+def atr(high: np.ndarray, low: np.ndarray, close: np.ndarray, n: int) -> np.ndarray:
+    ranges = trange(high, low, close)
+    out = _empty(len(close))
+    if len(close) > n:
+        first = float(ranges[1:n + 1].mean())
+        out[n] = first
+        out[n + 1:] = _wilder(ranges[n + 1:].tolist(), first, n)
+    return out
+
+
+def natr(high: np.ndarray, low: np.ndarray, close: np.ndarray, n: int) -> np.ndarray:
+    return 100 * _divide(atr(high, low, close, n), close)
+
+
+def bbands(x: np.ndarray, n: int, up: float, down: float) -> tuple:
+    middle = sma(x, n)
+    deviation = _empty(len(x))
+    if len(x) >= n:
+        deviation[n - 1:] = _windows(x, n).std(axis=1)
+    return middle + up * deviation, middle, middle - down * deviation
+
+
+def midpoint(x: np.ndarray, n: int) -> np.ndarray:
+    highest, lowest = _extremes(x, x, n)
+    return (highest + lowest) / 2
+
+
+def midprice(high: np.ndarray, low: np.ndarray, n: int) -> np.ndarray:
+    highest, lowest = _extremes(high, low, n)
+    return (highest + lowest) / 2
+
+
+def sar(high: np.ndarray, low: np.ndarray, acceleration: float, maximum: float) -> np.ndarray:
+    """
+    Parabolic SAR, a direct port of TA-Lib's state machine.
+    """
+    out = _empty(len(high))
+    if len(high) < 2:
+        return out
+    high_values, low_values = high.tolist(), low.tolist()
+    # Start short if the first bar shows downward directional movement
+    down, up = low_values[0] - low_values[1], high_values[1] - high_values[0]
+    is_long = not (down > 0 and down > up)
+    factor = acceleration
+    if is_long:
+        extreme, value = high_values[1], low_values[0]
+    else:
+        extreme, value = low_values[1], high_values[0]
+    new_high, new_low = high_values[1], low_values[1]
+    result = []
+    for today in range(1, len(high_values)):
+        prev_high, prev_low = new_high, new_low
+        new_high, new_low = high_values[today], low_values[today]
+        if is_long:
+            if new_low <= value:
+                is_long, value = False, max(extreme, prev_high, new_high)
+                result.append(value)
+                factor, extreme = acceleration, new_low
+                value = max(value + factor * (extreme - value), prev_high, new_high)
+            else:
+                result.append(value)
+                if new_high > extreme:
+                    extreme, factor = new_high, min(factor + acceleration, maximum)
+                value = min(value + factor * (extreme - value), prev_low, new_low)
+        else:
+            if new_high >= value:
+                is_long, value = True, min(extreme, prev_low, new_low)
+                result.append(value)
+                factor, extreme = acceleration, new_high
+                value = min(value + factor * (extreme - value), prev_low, new_low)
+            else:
+                result.append(value)
+                if new_low < extreme:
+                    extreme, factor = new_low, min(factor + acceleration, maximum)
+                value = max(value + factor * (extreme - value), prev_high, new_high)
+    out[1:] = result
+    return out
+
+
+# Volume
+
+def obv(close: np.ndarray, volume: np.ndarray) -> np.ndarray:
+    signed = np.sign(np.diff(close)) * volume[1:]
+    return np.concatenate(([volume[0]], volume[0] + np.cumsum(signed))) if len(close) else _empty(0)
+
+
+def ad(high: np.ndarray, low: np.ndarray, close: np.ndarray, volume: np.ndarray) -> np.ndarray:
+    return np.cumsum(_divide((close - low) - (high - close), high - low) * volume)
+
+
+def adosc(high: np.ndarray, low: np.ndarray, close: np.ndarray, volume: np.ndarray, fast: int, slow: int) -> np.ndarray:
+    line = ad(high, low, close, volume)
+    out = _empty(len(line))
+    if len(line) >= max(fast, slow):
+        # TA-Lib seeds both averages with the first A/D value instead of an SMA
+        first = float(line[0])
+        fast_average = np.array([first] + _smooth(line[1:].tolist(), first, 2 / (fast + 1)))
+        slow_average = np.array([first] + _smooth(line[1:].tolist(), first, 2 / (slow + 1)))
+        start = max(fast, slow) - 1
+        out[start:] = (fast_average - slow_average)[start:]
+    return out
+
+
+# Alpha Vantage function -> outputs keyed like the "Technical Analysis: <FUNCTION>" payload.
+# Each entry takes the OHLCV columns and the bound tool arguments; it returns None for
+# argument combinations it does not reproduce (those are fetched from upstream instead).
+
+def _price(series: dict, arguments: dict, default: str = "close") -> np.ndarray:
+    return series[arguments.get("series_type") or default]
+
+
+def _hlc(series: dict) -> tuple:
+    return series["high"], series["low"], series["close"]
+
+
+def _bbands(series: dict, a: dict) -> dict:
+    if int(a.get("matype") or 0) != 0:
+        return None
+    upper, middle, lower = bbands(_price(series, a), int(a["time_period"]), float(a["nbdevup"]), float(a["nbdevdn"]))
+    return {"Real Upper Band": upper, "Real Middle Band": middle, "Real Lower Band": lower}
+
+
+def _pair(names: tuple, values: tuple) -> dict:
+    return dict(zip(names, values))
+
+
+COMPUTE = {
+    "SMA": lambda s, a: {"SMA": sma(_price(s, a), int(a["time_period"]))},
+    "EMA": lambda s, a: {"EMA": ema(_price(s, a), int(a["time_period"]))},
+    "WMA": lambda s, a: {"WMA": wma(_price(s, a), int(a["time_period"]))},
+    "DEMA": lambda s, a: {"DEMA": dema(_price(s, a), int(a["time_period"]))},
+    "TEMA": lambda s, a: {"TEMA": tema(_price(s, a), int(a["time_period"]))},
+    "TRIMA": lambda s, a: {"TRIMA": trima(_price(s, a), int(a["time_period"]))},
+    "KAMA": lambda s, a: {"KAMA": kama(_price(s, a), int(a["time_period"]))},
+    "T3": lambda s, a: {"T3": t3(_price(s, a), int(a["time_period"]))},
+    "MACD": lambda s, a: _pair(("MACD", "MACD_Signal", "MACD_Hist"), macd(
+        _price(s, a), int(a["fastperiod"]), int(a["slowperiod"]), int(a["signalperiod"]))),
+    "STOCH": lambda s, a: _pair(("SlowK", "SlowD"), stoch(
+        *_hlc(s), int(a["fastk_period"]), int(a["slowk_period"]), int(a["slowd_period"]))),
+    "STOCHF": lambda s, a: _pair(("FastK", "FastD"), stochf(*_hlc(s), int(a["fastk_period"]), int(a["fastdperiod"]))),
+    "RSI": lambda s, a: {"RSI": rsi(_price(s, a), int(a["time_period"]))},
+    "STOCHRSI": lambda s, a: _pair(("FastK", "FastD"), stochrsi(
+        _price(s, a), int(a["time_period"]), int(a["fastkperiod"]), int(a["fastdperiod"]))),
+    "WILLR": lambda s, a: {"WILLR": willr(*_hlc(s), int(a["time_period"]))},
+    "ADX": lambda s, a: {"ADX": adx(*_hlc(s), int(a["time_period"]))},
+    "ADXR": lambda s, a: {"ADXR": adxr(*_hlc(s), int(a["time_period"]))},
+    "APO": lambda s, a: {"APO": apo(_price(s, a), int(a["fastperiod"]), int(a["slowperiod"]))},
+    "PPO": lambda s, a: {"PPO": ppo(_price(s, a), int(a["fastperiod"]), int(a["slowperiod"]))},
+    "MOM": lambda s, a: {"MOM": mom(_price(s, a), int(a["time_period"]))},
+    "BOP": lambda s, a: {"BOP": bop(s["open"], *_hlc(s))},
+    "CCI": lambda s, a: {"CCI": cci(*_hlc(s), int(a["time_period"]))},
+    "CMO": lambda s, a: {"CMO": cmo(_price(s, a), int(a["time_period"]))},
+    "ROC": lambda s, a: {"ROC": roc(_price(s, a), int(a["time_period"]))},
+    "ROCR": lambda s, a: {"ROCR": rocr(_price(s, a), int(a["time_period"]))},
+    "AROON": lambda s, a: _pair(("Aroon Down", "Aroon Up"), aroon(s["high"], s["low"], int(a["time_period"]))),
+    "AROONOSC": lambda s, a: {"AROONOSC": aroonosc(s["high"], s["low"], int(a["time_period"]))},
+    "MFI": lambda s, a: {"MFI": mfi(*_hlc(s), s["volume"], int(a["time_period"]))},
+    "TRIX": lambda s, a: {"TRIX": trix(_price(s, a), int(a["time_period"]))},
+    "ULTOSC": lambda s, a: {"ULTOSC": ultosc(
+        *_hlc(s), int(a["timeperiod1"]), int(a["timeperiod2"]), int(a["timeperiod3"]))},
+    "DX": lambda s, a: {"DX": dx(*_hlc(s), int(a["time_period"]))},
+    "MINUS_DI": lambda s, a: {"MINUS_DI": minus_di(*_hlc(s), int(a["time_period"]))},
+    "PLUS_DI": lambda s, a: {"PLUS_DI": plus_di(*_hlc(s), int(a["time_period"]))},
+    "MINUS_DM": lambda s, a: {"MINUS_DM": minus_dm(s["high"], s["low"], int(a["time_period"]))},
+    "PLUS_DM": lambda s, a: {"PLUS_DM": plus_dm(s["high"], s["low"], int(a["time_period"]))},
+    "BBANDS": _bbands,
+    "MIDPOINT": lambda s, a: {"MIDPOINT": midpoint(_price(s, a), int(a["time_period"]))},
+    "MIDPRICE": lambda s, a: {"MIDPRICE": midprice(s["high"], s["low"], int(a["time_period"]))},
+    "SAR": lambda s, a: {"SAR": sar(s["high"], s["low"], float(a["acceleration"]), float(a["maximum"]))},
+    "TRANGE": lambda s, a: {"TRANGE": trange(*_hlc(s))},
+    "ATR": lambda s, a: {"ATR": atr(*_hlc(s), int(a["time_period"]))},
+    "NATR": lambda s, a: {"NATR": natr(*_hlc(s), int(a["time_period"]))},
+    "AD": lambda s, a: {"Chaikin A/D": ad(*_hlc(s), s["volume"])},
+    "ADOSC": lambda s, a: {"ADOSC": adosc(*_hlc(s), s["volume"], int(a["fastperiod"]), int(a["slowperiod"]))},
+    "OBV": lambda s, a: {"OBV": obv(s["close"], s["volume"])},
+}
+
+
+def computes(function: str, arguments: dict) -> bool:
+    """
+    Whether compute() reproduces an indicator for these arguments, so the price series is worth fetching.
+    """
+    if function == "BBANDS":
+        return int(arguments.get("matype") or 0) == 0
+    return function in COMPUTE
+
+
+def compute(function: str, series: dict, arguments: dict):
+    """
+    Outputs of an Alpha Vantage indicator for OHLCV columns, or None when it is not computed locally.
+    """
+    if function not in COMPUTE:
+        return None
+    return COMPUTE[function](series, arguments)
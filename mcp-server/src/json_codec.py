@@ -0,0 +1,36 @@
+import json
+import os
+from typing import Any
+
+# JSON encoding and decoding for upstream bodies, the disk cache and tool results.
+# orjson is optional: when it is installed (pip install orjson) it is used unless
+# ALPHA_VANTAGE_JSON=json; otherwise the standard library does the work.
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+BACKEND = "orjson" if orjson is not None and os.getenv("ALPHA_VANTAGE_JSON", "orjson").lower() != "json" else "json"
+
+
+def loads(data) -> Any:
+    """
+    Decode a JSON document from bytes or str.
+    """
+    if BACKEND == "orjson":
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(value: Any) -> bytes:
+    """
+    Compact UTF-8 JSON. Values JSON has no type for (dates, NumPy scalars) are written as strings.
+    """
+    if BACKEND == "orjson":
+        return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False, default=str).encode()
+
+
+def dumps_text(value: Any) -> str:
+    return dumps(value).decode()
@@ -0,0 +1,116 @@
+import os
+import time
+from typing import List
+
+# Pool of Alpha Vantage API keys. Each key carries its own per-minute and
+# per-day token buckets, so aggregate throughput grows with the number of keys.
+# Keys that get a throttle note anyway are quarantined for a while.
+#
+#   ALPHA_VANTAGE_API_KEYS=KEY1,KEY2,KEY3:75:0   (optional per-key per_minute[:per_day])
+#   ALPHA_VANTAGE_API_KEY=KEY                    (single key, used when the list is unset)
+
+QUARANTINE = {"per_minute": 60.0, "per_day": 60 * 60.0}  # seconds a throttled key sits out
+
+
+class TokenBucket:
+    """
+    capacity tokens refilled continuously over period seconds. Not thread-safe on its own.
+    """
+
+    def __init__(self, name: str, capacity: int, period: float):
+        self.name = name
+        self.capacity = capacity
+        self.rate = capacity / period
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def available(self, now: float) -> float:
+        self._refill(now)
+        return self.tokens
+
+    def time_for(self, count: int, now: float) -> float:
+        """
+        Seconds until count tokens are available.
+        """
+        self._refill(now)
+        return max(0.0, (count - self.tokens) / self.rate)
+
+    def take(self, now: float) -> None:
+        self._refill(now)
+        self.tokens -= 1
+
+    def drain(self, now: float) -> None:
+        self._refill(now)
+        self.tokens = min(self.tokens, 0.0)
+
+
+class ApiKey:
+    """
+    One API key with its quota buckets and usage counters. Guarded by the rate limiter's lock.
+    """
+
+    def __init__(self, key: str, per_minute: int, per_day: int):
+        self.key = key
+        self.label = f"...{key[-4:]}"  # never report the full key
+        buckets = [TokenBucket("per_minute", per_minute, 60), TokenBucket("per_day", per_day, 24 * 60 * 60)]
+        self.buckets = [bucket for bucket in buckets if bucket.capacity > 0]
+        self.quarantined_until = 0.0
+        self.requests = 0
+        self.throttled = 0
+
+    def time_for(self, count: int, now: float) -> float:
+        """
+        Seconds until this key can send count requests.
+        """
+        quarantine = max(0.0, self.quarantined_until - now)
+        return max([quarantine] + [bucket.time_for(count, now) for bucket in self.buckets])
+
+    def headroom(self, now: float) -> float:
+        """
+        Fraction of the tightest bucket still available; the pool prefers the key with the most.
+        """
+        return min((bucket.available(now) / bucket.capacity for bucket in self.buckets), default=1.0)
+
+    def take(self, now: float) -> None:
+        self.requests += 1
+        for bucket in self.buckets:
+            bucket.take(now)
+
+    def quarantine(self, quota: str, now: float) -> None:
+        """
+        Upstream throttled this key anyway (shared key, restarted process): empty the bucket and bench it.
+        """
+        self.throttled += 1
+        self.quarantined_until = max(self.quarantined_until, now + QUARANTINE.get(quota, QUARANTINE["per_minute"]))
+        for bucket in self.buckets:
+            if bucket.name == quota:
+                bucket.drain(now)
+
+    def stats(self, now: float) -> dict:
+        return {
+            "key": self.label,
+            "requests": self.requests,
+            "throttled": self.throttled,
+            "quarantined_s": round(max(0.0, self.quarantined_until - now)),
+            "available": {bucket.name: round(bucket.available(now), 2) for bucket in self.buckets},
+        }
+
+
+def load_keys(per_minute: int, per_day: int) -> List[ApiKey]:
+    """
+    Read the configured keys from the environment; per_minute/per_day are the defaults for each key.
+    """
+    raw = os.getenv("ALPHA_VANTAGE_API_KEYS") or os.getenv("ALPHA_VANTAGE_API_KEY") or ""
+    keys = []
+    for entry in raw.split(","):
+        parts = entry.strip().split(":")
+        if not parts[0]:
+            continue
+        minute = int(parts[1]) if len(parts) > 1 and parts[1] else per_minute
+        day = int(parts[2]) if len(parts) > 2 and parts[2] else per_day
+        keys.append(ApiKey(parts[0], minute, day))
+    return keys
@@ -0,0 +1,221 @@
+import difflib
+import heapq
+import re
+import threading
+import time
+from bisect import bisect_left
+from typing import Optional
+
+from cache import MISSING, make_key, response_cache
+from disk_cache import disk_cache
+
+# Local index of the LISTING_STATUS listing (active US stocks and ETFs): symbol
+# lookups and searches by symbol or company name answered from sorted arrays, and
+# a ticker check so a symbol that cannot exist is answered locally instead of
+# spending an upstream call on an "Invalid API call". Only the syntax is rejected:
+# the listing leaves out mutual funds, currencies and foreign tickers, so a
+# well-formed symbol it does not know goes upstream once and a refusal is
+# remembered by the negative cache. The index follows the cached LISTING_STATUS
+# response (refreshed daily); lookups never fetch it themselves.
+
+LISTING_KEY = make_key({"function": "LISTING_STATUS"})
+TICKER = re.compile(r"[A-Za-z0-9][A-Za-z0-9.\-^=:/]{0,19}")
+WORD = re.compile(r"[a-z0-9]+")
+DISK_RECHECK = 60.0  # seconds between two disk cache lookups while no listing is stored
+FUZZY_CUTOFF = 0.75
+
+
+class SymbolIndex:
+    """
+    Listed securities sorted by symbol, plus every word of their names sorted with the row it belongs to.
+    """
+
+    __slots__ = ("symbols", "rows", "lowered", "words", "word_rows")
+
+    def __init__(self, rows: list):
+        rows.sort()
+        self.symbols = [row[0] for row in rows]
+        self.rows = rows  # (symbol, name, exchange, assetType, ipoDate), by symbol
+        self.lowered = [row[1].lower() for row in rows]
+        pairs = sorted({(word, i) for i, name in enumerate(self.lowered) for word in WORD.findall(name)})
+        self.words = [word for word, _ in pairs]
+        self.word_rows = [i for _, i in pairs]
+
+    @classmethod
+    def from_table(cls, table: dict) -> "SymbolIndex":
+        """
+        Index of a parsed LISTING_STATUS table (symbol, name, exchange, assetType, ipoDate, delistingDate, status).
+        """
+        columns = table.get("columns", [])
+        if not {"symbol", "name", "exchange", "assetType", "ipoDate"} <= set(columns):
+            return cls([])
+        at = [columns.index(name) for name in ("symbol", "name", "exchange", "assetType", "ipoDate")]
+        return cls([(str(row[at[0]]).upper(), row[at[1]] or "", *(row[i] for i in at[2:]))
+                    for row in table["rows"] if row[at[0]]])
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def find(self, symbol: str) -> int:
+        """
+        Row of an exact symbol, or -1.
+        """
+        i = bisect_left(self.symbols, symbol)
+        return i if i < len(self.symbols) and self.symbols[i] == symbol else -1
+
+    def normalize(self, symbol: str) -> Optional[str]:
+        """
+        The listed spelling of symbol: upper case, with a class separator written as "-" (BRK.B -> BRK-B).
+        None when it is not listed.
+        """
+        symbol = symbol.strip().upper()
+        for candidate in (symbol, symbol.replace(".", "-").replace("/", "-")):
+            if self.find(candidate) >= 0:
+                return candidate
+        return None
+
+    def record(self, i: int, match: str) -> dict:
+        symbol, name, exchange, asset_type, ipo_date = self.rows[i]
+        return {"symbol": symbol, "name": name, "exchange": exchange, "assetType": asset_type,
+                "ipoDate": ipo_date, "match": match}
+
+    def _word_prefix(self, prefix: str, exact: bool = False) -> set:
+        """
+        Rows with a name word starting with prefix (or equal to it).
+        """
+        rows = set()
+        for k in range(bisect_left(self.words, prefix), len(self.words)):
+            word = self.words[k]
+            if word != prefix and (exact or not word.startswith(prefix)):
+                break
+            rows.add(self.word_rows[k])
+        return rows
+
+    def _close_words(self, word: str) -> list:
+        """
+        Name words spelled like word, most similar first. Only words with the same first letter
+        are compared, which keeps this to a small slice of the vocabulary.
+        """
+        lo = bisect_left(self.words, word[0])
+        hi = bisect_left(self.words, chr(ord(word[0]) + 1), lo)
+        candidates = sorted(set(self.words[lo:hi]))
+        return difflib.get_close_matches(word, candidates, n=3, cutoff=FUZZY_CUTOFF)
+
+    def search(self, query: str, limit: int = 10) -> list:
+        """
+        Listings matching query, best first: the exact symbol, symbols starting with it, then names with
+        a word starting with each query word. When none match, names with a word spelled like a query word.
+        """
+        found, seen = [], set()
+
+        def add(rows, match: str) -> None:
+            for i in rows:
+                if len(found) >= limit:
+                    return
+                if i not in seen:
+                    seen.add(i)
+                    found.append(self.record(i, match))
+
+        symbol = query.strip().upper()
+        if not symbol:
+            return found
+        # Match symbols by their listed spelling, so "brk.b" finds BRK-B
+        symbol = self.normalize(symbol) or symbol.replace(".", "-").replace("/", "-")
+        add([i for i in [self.find(symbol)] if i >= 0], "symbol")
+        prefixed = []
+        for i in range(bisect_left(self.symbols, symbol), len(self.symbols)):
+            if len(prefixed) > limit or not self.symbols[i].startswith(symbol):
+                break
+            prefixed.append(i)
+        add(prefixed, "symbol_prefix")
+
+        words = WORD.findall(query.lower())
+        if words and len(found) < limit:
+            rows = self._word_prefix(words[0])
+            for word in words[1:]:
+                rows &= self._word_prefix(word)
+            # Names starting with the query first, then shorter (closer) names
+            lowered = query.strip().lower()
+            add(heapq.nsmallest(limit, rows, key=lambda i: (not self.lowered[i].startswith(lowered),
+                                                            len(self.lowered[i]), i)), "name")
+        if words and not found:
+            # Nothing matched as typed: try the closest spellings of each query word
+            for word in words:
+                for close in self._close_words(word):
+                    add(heapq.nsmallest(limit, self._word_prefix(close, exact=True),
+                                        key=lambda i: (len(self.lowered[i]), i)), "fuzzy")
+        return found
+
+
+class SymbolCheck:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._source = None     # cached LISTING_STATUS response the index was built from
+        self._index = None
+        self._disk_checked = None
+        self.checked = 0
+        self.rejected = 0
+
+    def index(self, data: Optional[dict] = None) -> Optional[SymbolIndex]:
+        """
+        Index of a LISTING_STATUS response, by default the cached one; None when none is stored.
+        It is rebuilt only when the response changes.
+        """
+        if data is None:
+            data = response_cache.peek(LISTING_KEY)
+        if data is MISSING:
+            now = time.monotonic()
+            if self._disk_checked is not None and now - self._disk_checked < DISK_RECHECK:
+                return None
+            self._disk_checked = now
+            stored = disk_cache.get(LISTING_KEY)
+            if stored is MISSING:
+                return None
+            data, remaining, size = stored
+            response_cache.set(LISTING_KEY, data, remaining, size)
+        with self._lock:
+            if data is not self._source:
+                self._index = SymbolIndex.from_table(data)
+                self._source = data
+            return self._index if len(self._index) else None
+
+    def check(self, symbol: str) -> Optional[str]:
+        """
+        Why symbol (or one of comma-separated symbols) cannot be a valid ticker, or None when it may be.
+        """
+        self.checked += 1
+        for part in str(symbol).split(","):
+            part = part.strip()
+            if not TICKER.fullmatch(part):
+                self.rejected += 1
+                return f"Invalid symbol: {part!r}"
+        return None
+
+    def unlisted(self, symbol: str) -> Optional[str]:
+        """
+        The first of comma-separated symbols missing from the listing, or None. Symbols with an exchange
+        suffix (TSCO.LON) are outside the US listing and never reported, nor is anything while no listing
+        is stored.
+        """
+        index = self.index()
+        if index is None:
+            return None
+        for part in str(symbol).split(","):
+            part = part.strip()
+            if index.normalize(part) is None and "." not in part:
+                return part
+        return None
+
+    def normalize(self, symbol: str) -> str:
+        """
+        The listed spelling of symbol when the index knows it, else symbol unchanged.
+        """
+        index = self.index()
+        return (index.normalize(symbol) if index is not None else None) or symbol
+
+    def stats(self) -> dict:
+        return {"listed": len(self._index) if self._index is not None else 0,
+                "checked": self.checked, "rejected": self.rejected}
+
+
+symbol_check = SymbolCheck()
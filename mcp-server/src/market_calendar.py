@@ -0,0 +1,150 @@
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
+from zoneinfo import ZoneInfo
+
+# Local US equity exchange calendar (NYSE/NASDAQ): trading days, holidays,
+# early closes and session boundaries. Used to decide how long market data stays valid.
+
+EXCHANGE_TZ = ZoneInfo("America/New_York")
+
+REGULAR_OPEN = time(9, 30)
+REGULAR_CLOSE = time(16, 0)
+EARLY_CLOSE = time(13, 0)
+EXTENDED_OPEN = time(4, 0)    # pre-market, included in intraday bars
+EXTENDED_CLOSE = time(20, 0)  # after-hours, included in intraday bars
+
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    """
+    n-th given weekday (0=Monday) of a month; n=-1 is the last one.
+    """
+    if n > 0:
+        first = date(year, month, 1)
+        return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+    last = date(year + (month == 12), month % 12 + 1, 1) - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def _easter(year: int) -> date:
+    """
+    Gregorian Easter Sunday (anonymous Gregorian algorithm).
+    """
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+def _observed(day: date) -> date:
+    """
+    Saturday holidays are observed on Friday, Sunday holidays on Monday.
+    """
+    if day.weekday() == 5:
+        return day - timedelta(days=1)
+    if day.weekday() == 6:
+        return day + timedelta(days=1)
+    return day
+
+
+@lru_cache(maxsize=16)
+def holidays(year: int) -> frozenset:
+    """
+    Full-day exchange holidays of a year.
+    """
+    days = {
+        _nth_weekday(year, 1, 0, 3),           # Martin Luther King Jr. Day
+        _nth_weekday(year, 2, 0, 3),           # Washington's Birthday
+        _easter(year) - timedelta(days=2),     # Good Friday
+        _nth_weekday(year, 5, 0, -1),          # Memorial Day
+        _observed(date(year, 7, 4)),           # Independence Day
+        _nth_weekday(year, 9, 0, 1),           # Labor Day
+        _nth_weekday(year, 11, 3, 4),          # Thanksgiving Day
+        _observed(date(year, 12, 25)),         # Christmas Day
+    }
+    # New Year's Day on a Saturday is not observed on the previous Friday
+    new_year = date(year, 1, 1)
+    if new_year.weekday() != 5:
+        days.add(_observed(new_year))
+    if year >= 2022:
+        days.add(_observed(date(year, 6, 19)))  # Juneteenth
+    return frozenset(days)
+
+
+@lru_cache(maxsize=16)
+def early_closes(year: int) -> frozenset:
+    """
+    Days on which the regular session ends at 13:00.
+    """
+    days = {
+        _nth_weekday(year, 11, 3, 4) + timedelta(days=1),  # day after Thanksgiving
+        date(year, 12, 24),                                # Christmas Eve
+        date(year, 7, 3),                                  # day before Independence Day
+    }
+    return frozenset(day for day in days if is_trading_day(day))
+
+
+def is_trading_day(day: date) -> bool:
+    return day.weekday() < 5 and day not in holidays(day.year)
+
+
+def next_trading_day(day: date) -> date:
+    """
+    First trading day strictly after day.
+    """
+    day += timedelta(days=1)
+    while not is_trading_day(day):
+        day += timedelta(days=1)
+    return day
+
+
+def session(day: date, extended: bool = False) -> tuple:
+    """
+    (open, close) datetimes of a trading day in exchange time.
+    """
+    start = EXTENDED_OPEN if extended else REGULAR_OPEN
+    if extended:
+        end = EXTENDED_CLOSE
+    else:
+        end = EARLY_CLOSE if day in early_closes(day.year) else REGULAR_CLOSE
+    return (datetime.combine(day, start, EXCHANGE_TZ), datetime.combine(day, end, EXCHANGE_TZ))
+
+
+def now() -> datetime:
+    return datetime.now(EXCHANGE_TZ)
+
+
+def is_open(moment: datetime, extended: bool = False) -> bool:
+    moment = moment.astimezone(EXCHANGE_TZ)
+    if not is_trading_day(moment.date()):
+        return False
+    start, end = session(moment.date(), extended)
+    return start <= moment < end
+
+
+def next_open(moment: datetime, extended: bool = False) -> datetime:
+    """
+    Start of the next session that begins after moment.
+    """
+    moment = moment.astimezone(EXCHANGE_TZ)
+    day = moment.date()
+    if is_trading_day(day) and moment < session(day, extended)[0]:
+        return session(day, extended)[0]
+    return session(next_trading_day(day), extended)[0]
+
+
+def next_close(moment: datetime, extended: bool = False) -> datetime:
+    """
+    End of the current session, or of the next one when the market is closed.
+    """
+    moment = moment.astimezone(EXCHANGE_TZ)
+    day = moment.date()
+    if is_trading_day(day) and moment < session(day, extended)[1]:
+        return session(day, extended)[1]
+    return session(next_trading_day(day), extended)[1]
@@ -0,0 +1,96 @@
+from bisect import bisect_left, bisect_right
+from typing import Optional, Sequence
+
+from columnar import Series
+
+# Server-side trimming of time series and indicator payloads: a date range,
+# the last N bars and a subset of fields, applied to the cached data before it
+# is converted and serialized, so asking for 30 points costs 30 points.
+
+DOC = (
+    " Optional projection: start/end (inclusive dates or timestamps, e.g. 2024-01-02), "
+    "last_n (most recent bars only) and fields (comma-separated names such as close,volume)."
+)
+
+
+class Projection:
+    """
+    Requested window and fields of a time-series response. Timestamps compare as strings,
+    which orders upstream timestamps correctly ("2024-01-02" < "2024-01-02 09:30:00").
+    """
+
+    __slots__ = ("start", "end", "last_n", "fields")
+
+    def __init__(self, start: Optional[str] = None, end: Optional[str] = None, last_n: Optional[int] = None,
+                 fields=None):
+        # Minute precision, since indicator timestamps carry no seconds; an end date covers
+        # that whole day of intraday bars
+        self.start = start.replace("T", " ")[:16] if start else None
+        self.end = end.replace("T", " ")[:16] + "\x7f" if end else None
+        self.last_n = max(0, int(last_n)) if last_n is not None else None
+        if isinstance(fields, str):
+            fields = fields.split(",")
+        self.fields = {name.strip().lower() for name in fields if name.strip()} if fields else None
+
+    @classmethod
+    def from_arguments(cls, arguments: dict) -> Optional["Projection"]:
+        """
+        Projection of bound tool arguments, or None when none of its parameters is set.
+        """
+        values = [arguments.get(name) for name in ("start", "end", "last_n", "fields")]
+        if all(value is None for value in values):
+            return None
+        return cls(*values)
+
+    @property
+    def selects_bars(self) -> bool:
+        """
+        Whether a window or last_n is set, rather than fields only.
+        """
+        return self.start is not None or self.end is not None or self.last_n is not None
+
+    def window(self, stamps: Sequence, key=None) -> tuple:
+        """
+        (lo, hi) slice of the ascending stamps inside the requested window.
+        """
+        lo = bisect_left(stamps, self.start, key=key) if self.start else 0
+        hi = bisect_right(stamps, self.end, key=key) if self.end else len(stamps)
+        if self.last_n is not None:
+            lo = max(lo, hi - self.last_n)
+        return lo, min(max(lo, hi), len(stamps))
+
+    def keeps(self, field: str) -> bool:
+        """
+        Whether a field is selected, by its full upstream name ("4. close") or short name ("close").
+        """
+        return self.fields is None or field.lower() in self.fields or field.split(". ", 1)[-1].lower() in self.fields
+
+    def series(self, series: Series) -> Series:
+        lo, hi = self.window(series.stamps())
+        series = series.slice(lo, hi)
+        if self.fields is not None:
+            series = series.select([field for field in series.fields if self.keeps(field)])
+        return series
+
+    def rows(self, rows: dict) -> dict:
+        """
+        Project a {timestamp: {field: value}} payload; the result is newest first like upstream.
+        """
+        stamps = sorted(rows)
+        lo, hi = self.window(stamps)
+        return {stamp: self.values(rows[stamp]) for stamp in reversed(stamps[lo:hi])}
+
+    def values(self, values: dict) -> dict:
+        if self.fields is None:
+            return values
+        return {name: value for name, value in values.items() if self.keeps(name)}
+
+    def apply(self, payload):
+        """
+        Project a Series or a timestamp-keyed payload; anything else is returned unchanged.
+        """
+        if isinstance(payload, Series):
+            return self.series(payload)
+        if isinstance(payload, dict) and "error" not in payload:
+            return self.rows(payload)
+        return payload
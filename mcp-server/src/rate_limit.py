@@ -0,0 +1,188 @@
+import heapq
+import os
+import threading
+import time
+from collections import deque
+from typing import List, Optional
+
+from key_pool import ApiKey, load_keys
+
+# Client-side scheduler for the Alpha Vantage quota. Every upstream request
+# takes one token from each bucket (per minute, per day) of one API key of the
+# pool; when no key has budget left callers queue by priority class instead of
+# receiving a throttle note.
+
+PER_MINUTE = int(os.getenv("ALPHA_VANTAGE_RATE_PER_MINUTE", "5"))   # per key, 0 disables the bucket
+PER_DAY = int(os.getenv("ALPHA_VANTAGE_RATE_PER_DAY", "25"))        # per key, 0 disables the bucket
+MAX_WAIT_MS = os.getenv("ALPHA_VANTAGE_MAX_WAIT_MS")                # unset: queue as long as needed
+DEFAULT_MAX_WAIT = float(MAX_WAIT_MS) / 1000 if MAX_WAIT_MS else None
+
+
+# Priority classes, highest first. Interactive calls (a user waiting on a chat
+# answer) overtake queued normal and background work.
+INTERACTIVE = "interactive"
+NORMAL = "normal"
+BACKGROUND = "background"
+PRIORITIES = (INTERACTIVE, NORMAL, BACKGROUND)
+
+LATENCY_WINDOW = 256    # recent queue waits kept per class for percentiles
+
+
+class RateLimitExceeded(Exception):
+    def __init__(self, wait: float):
+        super().__init__(f"Rate limit reached: estimated wait {wait * 1000:.0f} ms")
+        self.wait = wait
+
+
+class ClassStats:
+    """
+    Queue wait metrics of one priority class. Guarded by the limiter's lock.
+    """
+
+    def __init__(self):
+        self.granted = 0
+        self.rejected = 0
+        self.waited = 0.0
+        self.max_wait = 0.0
+        self.recent = deque(maxlen=LATENCY_WINDOW)
+
+    def record(self, waited: float) -> None:
+        self.granted += 1
+        self.waited += waited
+        self.max_wait = max(self.max_wait, waited)
+        self.recent.append(waited)
+
+    def summary(self, queued: int) -> dict:
+        recent = sorted(self.recent)
+        percentile = lambda p: round(recent[min(len(recent) - 1, int(p * len(recent)))] * 1000) if recent else 0
+        return {
+            "queued": queued,
+            "granted": self.granted,
+            "rejected": self.rejected,
+            "average_wait_ms": round(self.waited / self.granted * 1000) if self.granted else 0,
+            "p50_wait_ms": percentile(0.5),
+            "p95_wait_ms": percentile(0.95),
+            "max_wait_ms": round(self.max_wait * 1000),
+        }
+
+
+class RateLimiter:
+    """
+    Hands out bucket tokens to queued callers. Higher priority classes are always
+    served first, so a queued background call is overtaken by every interactive one;
+    within a class, clients are served in fair-queuing order so one busy client
+    cannot starve the others.
+    """
+
+    def __init__(self, per_minute: int = PER_MINUTE, per_day: int = PER_DAY):
+        self.per_minute = per_minute
+        self.per_day = per_day
+        self._keys = None  # read from the environment on first use, after .env has been loaded
+        self._cond = threading.Condition()
+        self._queue = []         # heap of (class rank, finish tag, seq, ticket); the head is served first
+        self._seq = 0
+        self._virtual_time = {}  # class -> finish tag of the last served call
+        self._finish = {}        # (class, client) -> finish tag of that client's last queued call
+        self.classes = {priority: ClassStats() for priority in PRIORITIES}
+        self.rejected = 0
+
+    def keys(self) -> List[ApiKey]:
+        with self._cond:
+            return self._pool()
+
+    def _pool(self) -> List[ApiKey]:
+        if self._keys is None:
+            self._keys = load_keys(self.per_minute, self.per_day)
+        return self._keys
+
+    def _wait_for(self, count: int, now: float) -> float:
+        """
+        Seconds until the pool as a whole can send count more requests.
+        """
+        keys = self._pool()
+        if not keys:
+            return 0.0
+        slots = sorted(key.time_for(n, now) for key in keys for n in range(1, count + 1))
+        return slots[count - 1]
+
+    def _ahead(self, priority: str) -> int:
+        rank = PRIORITIES.index(priority)
+        return sum(1 for entry in self._queue if entry[0] <= rank)
+
+    def estimated_wait(self, priority: str = NORMAL) -> float:
+        """
+        Seconds a call of the given class arriving now would queue before being sent.
+        """
+        with self._cond:
+            return self._wait_for(self._ahead(priority) + 1, time.monotonic())
+
+    def acquire(self, max_wait: Optional[float] = None, priority: str = NORMAL, client: str = "default") -> ApiKey:
+        """
+        Block until a request may be sent and return the key to send it with: among the keys
+        with budget left, the one with the most headroom.
+        Raises RateLimitExceeded right away if the estimated wait is above max_wait seconds.
+        """
+        start = time.monotonic()
+        rank = PRIORITIES.index(priority)
+        with self._cond:
+            if not self._pool():
+                raise ValueError("No Alpha Vantage API key configured")
+            wait = self._wait_for(self._ahead(priority) + 1, start)
+            if max_wait is not None and wait > max_wait:
+                self.rejected += 1
+                self.classes[priority].rejected += 1
+                raise RateLimitExceeded(wait)
+            finish = max(self._virtual_time.get(priority, 0), self._finish.get((priority, client), 0)) + 1
+            self._finish[priority, client] = finish
+            self._seq += 1
+            entry = (rank, finish, self._seq, object())
+            heapq.heappush(self._queue, entry)
+            try:
+                while True:
+                    now = time.monotonic()
+                    delay = None
+                    if self._queue[0] is entry:
+                        ready = [key for key in self._pool() if key.time_for(1, now) <= 0]
+                        if ready:
+                            break
+                        delay = self._wait_for(1, now)
+                    self._cond.wait(delay)
+                key = max(ready, key=lambda key: key.headroom(now))
+                key.take(now)
+                self._virtual_time[priority] = finish
+            finally:
+                self._queue.remove(entry)
+                heapq.heapify(self._queue)
+                if not any(queued[0] == rank for queued in self._queue):
+                    # Class is idle: forget finish tags so the table does not grow with every client seen
+                    self._virtual_time.pop(priority, None)
+                    self._finish = {key: tag for key, tag in self._finish.items() if key[0] != priority}
+                self._cond.notify_all()
+            self.classes[priority].record(time.monotonic() - start)
+        return key
+
+    def quarantine(self, key: ApiKey, quota: str) -> None:
+        """
+        Bench a key upstream throttled anyway; quota is the bucket the throttle message refers to.
+        """
+        with self._cond:
+            key.quarantine(quota, time.monotonic())
+
+    def stats(self) -> dict:
+        with self._cond:
+            now = time.monotonic()
+            return {
+                "queue_depth": len(self._queue),
+                "estimated_wait_ms": {
+                    priority: round(self._wait_for(self._ahead(priority) + 1, now) * 1000) for priority in PRIORITIES
+                },
+                "keys": [key.stats(now) for key in self._pool()],
+                "rejected": self.rejected,
+                "classes": {
+                    priority: stats.summary(sum(1 for entry in self._queue if entry[0] == rank))
+                    for rank, (priority, stats) in enumerate(self.classes.items())
+                },
+            }
+
+
+rate_limiter = RateLimiter()
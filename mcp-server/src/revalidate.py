@@ -0,0 +1,63 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Hashable
+
+# Background refreshes for stale-while-revalidate: a caller served an expired
+# response from its grace window returns right away and the upstream call that
+# replaces it runs here, at most once per key at a time.
+
+MAX_WORKERS = 2  # refreshes run at background priority, mostly waiting on the rate limiter
+
+
+class Revalidator:
+    def __init__(self, max_workers: int = MAX_WORKERS):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="alpha-vantage-revalidate")
+        self._pending = set()  # keys queued or being refreshed
+        self._lock = threading.Lock()
+        self.refreshed = 0
+        self.failed = 0
+        self.skipped = 0
+        self.latency = 0.0
+        self.max_latency = 0.0
+
+    def submit(self, key: Hashable, refresh: Callable[[], bool]) -> None:
+        """
+        Run refresh() in the background unless a refresh of key is already pending.
+        refresh returns whether it stored a new value; latency counts from submission.
+        """
+        with self._lock:
+            if key in self._pending:
+                self.skipped += 1
+                return
+            self._pending.add(key)
+        self._executor.submit(self._run, key, refresh, time.monotonic())
+
+    def _run(self, key: Hashable, refresh: Callable[[], bool], submitted: float) -> None:
+        try:
+            ok = refresh()
+        except Exception:
+            ok = False
+        latency = time.monotonic() - submitted
+        with self._lock:
+            self._pending.discard(key)
+            if ok:
+                self.refreshed += 1
+                self.latency += latency
+                self.max_latency = max(self.max_latency, latency)
+            else:
+                self.failed += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "pending": len(self._pending),
+                "refreshed": self.refreshed,
+                "failed": self.failed,
+                "skipped": self.skipped,
+                "mean_latency_ms": round(self.latency / self.refreshed * 1000) if self.refreshed else 0,
+                "max_latency_ms": round(self.max_latency * 1000),
+            }
+
+
+revalidator = Revalidator()
@@ -0,0 +1,179 @@
+import os
+import threading
+import time
+from typing import Callable, Optional, Union
+
+import numpy as np
+
+from cache import MISSING, Refusal, make_key, response_cache
+from columnar import Series
+from disk_cache import disk_cache
+
+# Long price histories built from one outputsize=full call. After that a stale
+# series is refreshed with outputsize=compact (the latest ~100 bars) and the new
+# bars are merged into the stored history, so keeping 20 years of daily bars up
+# to date costs a small payload per refresh. Histories live in the memory cache
+# and are persisted to the disk cache, and the full series is fetched again once
+# HISTORY_TTL has passed in case upstream revised older bars. When upstream refuses
+# outputsize=full (premium-only), the history starts from a compact series and
+# grows with every refresh instead.
+
+HISTORY_TTL = float(os.getenv("ALPHA_VANTAGE_HISTORY_TTL", str(7 * 24 * 60 * 60)))
+COMPACT_BARS = 100  # bars in an outputsize=compact response
+
+
+def merge(history: Series, recent: Series) -> Optional[Series]:
+    """
+    history followed by the bars of recent, whose values win where both have a bar. If the adjusted
+    close of the oldest shared bar changed (a split or dividend since the last refresh), the older
+    bars are rescaled by the same factor. Series without an adjusted close (intraday, FX) cannot be
+    rescaled, so a change in the prices of that bar returns None, as does a pair of series that
+    do not overlap or have different fields.
+    """
+    if not len(recent):
+        return history
+    if recent.fields != history.fields or not len(history) or history.timestamps[-1] < recent.timestamps[0]:
+        return None
+    cut = int(np.searchsorted(history.timestamps, recent.timestamps[0]))
+    older = history.values[:cut]
+    names = history.names
+    if "adjusted close" in names:
+        j = names.index("adjusted close")
+        if history.timestamps[cut] != recent.timestamps[0] or not history.values[cut, j]:
+            return None
+        factor = recent.values[0, j] / history.values[cut, j]
+        if factor != 1:
+            older = older.copy()
+            older[:, j] *= factor
+    else:
+        prices = [names.index(name) for name in ("open", "high", "low", "close") if name in names]
+        if history.timestamps[cut] != recent.timestamps[0] or not np.array_equal(
+                history.values[cut, prices], recent.values[0, prices], equal_nan=True):
+            return None
+    series = Series(np.concatenate([history.timestamps[:cut], recent.timestamps]), recent.fields,
+                    np.asfortranarray(np.concatenate([older, recent.values])), recent.decimals, recent.intraday)
+    if history._stamps is not None and recent._stamps is not None:
+        series._stamps = history._stamps[:cut] + recent._stamps
+    return series
+
+
+class History:
+    """
+    Merged history of one series, with wall-clock times of its last full fetch and freshness.
+    """
+
+    __slots__ = ("series", "full_at", "fresh_until", "lock")
+
+    def __init__(self, series: Optional[Series] = None, full_at: float = 0.0, fresh_until: float = 0.0):
+        self.series = series
+        self.full_at = full_at
+        self.fresh_until = fresh_until
+        self.lock = threading.Lock()  # one refresh at a time per series
+
+
+class SeriesStore:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.full_fetches = 0
+        self.compact_fetches = 0
+        self.full_refusals = 0
+        self.lock_timeouts = 0
+
+    def get(self, query: dict, ttl: float, load: Callable[[str], Union[Series, dict]],
+            max_wait: Optional[float] = None) -> Union[Series, dict]:
+        """
+        History of the series answered by query (upstream parameters without outputsize), or {"error": ...}.
+        load(outputsize) fetches the "full" or "compact" series. While the history is fresh (ttl seconds
+        since the last refresh) the same Series object is returned. A caller finding a refresh of the
+        same series under way waits for it at most max_wait seconds (None: as long as it takes).
+        """
+        key = make_key({**query, "outputsize": "history"})
+        history = self._history(key)
+        series = history.series
+        if series is not None and time.time() < history.fresh_until:
+            return series
+        if not history.lock.acquire(timeout=-1 if max_wait is None else max_wait):
+            self.lock_timeouts += 1
+            return {"error": f"Series refresh in progress: still running after {max_wait * 1000:.0f} ms"}
+        try:
+            return self._refresh(key, history, ttl, load)
+        finally:
+            history.lock.release()
+
+    def _refresh(self, key: tuple, history: History, ttl: float,
+                 load: Callable[[str], Union[Series, dict]]) -> Union[Series, dict]:
+        """
+        Bring history up to date, holding its lock: a compact fetch merged into it, or a full fetch.
+        """
+        now = time.time()
+        if history.series is not None and now < history.fresh_until:
+            return history.series  # refreshed by the caller we waited for
+        series = recent = None
+        if history.series is not None and now < history.full_at + HISTORY_TTL:
+            recent = load("compact")
+            if isinstance(recent, dict):
+                return recent
+            self.compact_fetches += 1
+            series = merge(history.series, recent)
+        if series is None:
+            full = load("full")
+            if isinstance(full, Refusal):
+                # Full histories are premium-only for this key: start from the latest bars,
+                # which later compact refreshes merge into
+                self.full_refusals += 1
+                if recent is None:
+                    recent = load("compact")
+                    if isinstance(recent, dict):
+                        return recent
+                    self.compact_fetches += 1
+                    series = merge(history.series, recent) if history.series is not None else None
+                full = recent if series is None else series
+            elif isinstance(full, dict):
+                return full
+            else:
+                self.full_fetches += 1
+            series = full
+            history.full_at = now
+        # The series is published before fresh_until, which callers check without the lock
+        history.series = series
+        history.fresh_until = now + ttl
+        remaining = history.full_at + HISTORY_TTL - now
+        response_cache.set(key, history, remaining, series.nbytes)
+        disk_cache.set(key, {"Time Series": series, "full_at": history.full_at,
+                             "fresh_until": history.fresh_until}, remaining)
+        return series
+
+    def _history(self, key: tuple) -> History:
+        """
+        The history kept under key: from memory, else from the disk cache, else a new empty one.
+        """
+        with self._lock:
+            data = response_cache.get(key)
+            if isinstance(data, History):
+                return data
+            remaining = None
+            if data is MISSING:
+                stored = disk_cache.get(key)
+                if stored is not MISSING:
+                    data, remaining, _ = stored
+            # The stored form, from the disk cache or loaded into memory by a warm start
+            if isinstance(data, dict) and isinstance(data.get("Time Series"), Series):
+                history = History(data["Time Series"], data["full_at"], data["fresh_until"])
+                remaining = remaining or history.full_at + HISTORY_TTL - time.time()
+                response_cache.set(key, history, remaining, history.series.nbytes)
+            else:
+                history = History()
+                response_cache.set(key, history, HISTORY_TTL, 0)
+            return history
+
+    def stats(self) -> dict:
+        return {
+            "history_ttl": HISTORY_TTL,
+            "full_fetches": self.full_fetches,
+            "compact_fetches": self.compact_fetches,
+            "full_refusals": self.full_refusals,
+            "lock_timeouts": self.lock_timeouts,
+        }
+
+
+series_store = SeriesStore()
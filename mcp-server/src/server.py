@@ -1,6 +1,23 @@
 # Functions from the mcp python sdk 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial, wraps
+from typing import Dict, List, Optional, Union
 from mcp.server.fastmcp import FastMCP
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
+from cache import negative_cache, response_cache
+from disk_cache import WARM_START, disk_cache
+from earnings import earnings_calendar
+from endpoints import ENDPOINTS, Endpoint
+from http_client import POOL_SIZE
+import json_codec
+from singleflight import single_flight
+from incremental import indicator_states
+from listing import symbol_check
+from revalidate import revalidator
+from series_store import series_store
+from rate_limit import INTERACTIVE, NORMAL, PRIORITIES, rate_limiter
+import tools
 from tools import *
 
 # Creating our MCP server
@@ -14,1404 +31,198 @@ mcp = FastMCP(
 
 app = FastAPI()
 
-@mcp.tool()
-@app.get("/get_current_price/{symbol}")
-async def get_current_price_tool(symbol: str) -> str:
-    """
-    Gets the current price of a stock from Alpha Vantage API.
-    """
-    try:
-        return get_current_price(symbol)
-    except Exception as e:
-        return f"Error getting current price for {symbol}: {str(e)}"
-
-@mcp.tool()
-@app.get("/get_stock_price/{symbol}")
-async def get_stock_price_tool(symbol: str) -> dict:
-    """
-    Get the latest intraday stock price.
-    """
-    try:
-        return get_stock_price(symbol)
-    except Exception as e:
-        return f"Error getting stock price for {symbol}: {str(e)}"
-
-@mcp.tool()
-@app.get("/get_intraday/{symbol}")
-async def get_intraday_tool(symbol: str, interval: Optional[str] = "1min") -> dict:
-    """
-    Fetch intraday time series for a given stock symbol.
-    """
-    try:
-        return get_intraday(symbol, interval)
-    except Exception as e:
-        return f"Error getting intraday data for {symbol} with interval {interval}: {str(e)}"
-
-@mcp.tool()
-@app.get("/get_daily_adjusted/{symbol}")
-async def get_daily_adjusted_tool(symbol: str) -> dict:
-    """
-    Fetch daily adjusted time series data for a given symbol.
-    """
-    try:
-        return get_daily_adjusted(symbol)
-    except Exception as e:
-        return f"Error getting daily adjusted data for {symbol}: {str(e)}"
-
-@mcp.tool()
-@app.get("/get_weekly/{symbol}")
-async def get_weekly_tool(symbol: str) -> dict:
-    """
-    Fetch weekly time series data for a given symbol.
-    """
-    try:
-        return get_weekly(symbol)
-    except Exception as e:
-        return f"Error getting weekly data for {symbol}: {str(e)}"
-
-@mcp.tool()
-@app.get("/get_weekly_adjusted/{symbol}")
-async def get_weekly_adjusted_tool(symbol: str) -> dict:
-    """
-    Fetch weekly adjusted time series data for a given symbol.
-    """
-    try:
-        return get_weekly_adjusted(symbol)
-    except Exception as e:
-        return f"Error getting weekly adjusted data for {symbol}: {str(e)}"
-
-@mcp.tool()
-@app.get("/get_monthly/{symbol}")
-async def get_monthly_tool(symbol: str) -> dict:
-    """
-    Fetch monthly time series data for a given symbol.
-    """
-    try:
-        return get_monthly(symbol)
-    except Exception as e:
-        return f"Error getting monthly data for {symbol}: {str(e)}"
-
-@mcp.tool()
-@app.get("/get_monthly_adjusted/{symbol}")
-async def get_monthly_adjusted_tool(symbol: str) -> dict:
-    """
-    Fetch monthly adjusted time series data for a given symbol.
-    """
-    try:
-        return get_monthly_adjusted(symbol)
-    except Exception as e:
-        return f"Error getting monthly adjusted data for {symbol}: {str(e)}"
-
-@mcp.tool()
-@app.get("/get_quote/{symbol}")
-async def get_quote_tool(symbol: str) -> dict:
-    """
-    Fetch the current global quote for a given stock symbol.
-    """
-    try:
-        return get_quote(symbol)
-    except Exception as e:
-        return f"Error getting quote for {symbol}: {str(e)}"
-
-@mcp.tool()
-@app.get("/get_market_status")
-async def get_market_status_tool() -> dict:
-    """
-    Fetch the current global market status.
-    """
-    try:
-        return get_market_status()
-    except Exception as e:
-        return f"Error getting market status: {str(e)}"
-
-@mcp.tool()
-@app.get("/get_historical_options/{symbol}")
-async def get_historical_options_tool(symbol: str, date: Optional[str] = None, datatype: str = "json") -> dict:
-    """
-    Fetch historical options data for a symbol, optionally for a specific date.
-    """
-    try:
-        return get_historical_options_simple(symbol, date, datatype)
-    except Exception as e:
-        return f"Error getting historical options for {symbol}: {str(e)}"
-
-@mcp.tool()
-@app.get("/get_news_sentiment/{symbol}")
-async def get_news_sentiment_tool(symbol: str) -> dict:
-    """
-    Fetch news and sentiment trending data for a symbol.
-    """
-    try:
-        return get_news_sentiment(symbol)
-    except Exception as e:
-        return f"Error getting news sentiment for {symbol}: {str(e)}"
+# The fetchers in tools.py block on network I/O. Running them on a worker pool
+# sized like the HTTP connection pool lets concurrent tool calls overlap their
+# upstream waits instead of stalling the event loop one after another.
+# One pool per priority class: background calls parked in the rate limiter
+# queue must not occupy the workers an interactive call needs.
+_executors = {
+    priority: ThreadPoolExecutor(max_workers=POOL_SIZE, thread_name_prefix=f"alpha-vantage-{priority}")
+    for priority in PRIORITIES
+}
 
-@mcp.tool()
-@app.get("/get_earnings_transcript/{symbol}")
-async def get_earnings_transcript_tool(symbol: str) -> dict:
+async def run_blocking(func, *args, priority: str = INTERACTIVE, **kwargs):
     """
-    Fetch earnings call transcript for a symbol.
+    Await a blocking tools.py function without blocking the event loop.
     """
-    try:
-        return get_earnings_transcript(symbol)
-    except Exception as e:
-        return f"Error getting earnings transcript for {symbol}: {str(e)}"
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executors[priority], partial(func, *args, **kwargs))
 
-@mcp.tool()
-@app.get("/get_top_gainers_losers")
-async def get_top_gainers_losers_tool() -> dict:
+def current_client() -> str:
     """
-    Fetch top gainers and losers data.
+    Identity of the MCP session issuing the current tool call, used for fair queuing.
     """
     try:
-        return get_top_gainers_losers()
-    except Exception as e:
-        return f"Error getting top gainers and losers: {str(e)}"
+        context = mcp.get_context()
+        return context.client_id or f"session-{id(context.session)}"
+    except ValueError:
+        return "http"
 
 @mcp.tool()
-@app.get("/get_insider_transactions/{symbol}")
-async def get_insider_transactions_tool(symbol: str) -> dict:
+@app.get("/get_current_price/{symbol}")
+async def get_current_price_tool(symbol: str) -> str:
     """
-    Fetch insider transactions trending data for a symbol.
+    Gets the current price of a stock from Alpha Vantage API.
     """
     try:
-        return get_insider_transactions(symbol)
+        return await run_blocking(get_current_price, symbol)
     except Exception as e:
-        return f"Error getting insider transactions for {symbol}: {str(e)}"
+        return f"Error getting current price for {symbol}: {str(e)}"
 
-@mcp.tool()
-@app.get("/get_analytics_fixed/{symbol}/{function_name}")
-async def get_analytics_fixed_tool(symbol: str, function_name: str, interval: str = "daily", time_period: int = 10, series_type: str = "close") -> dict:
+def make_tool(endpoint: Endpoint):
     """
-    Fetch fixed window technical indicator data (e.g., SMA, EMA, RSI).
+    Build the async MCP tool for a registry endpoint around its tools.py fetcher.
     """
-    try:
-        return get_analytics_fixed(symbol, function_name, interval, time_period, series_type)
-    except Exception as e:
-        return f"Error getting analytics fixed for {symbol} function {function_name}: {str(e)}"
+    fetcher = getattr(tools, endpoint.name)
 
-@mcp.tool()
-@app.get("/get_analytics_sliding/{symbol}/{function_name}")
-async def get_analytics_sliding_tool(symbol: str, function_name: str, interval: str = "daily", time_period: int = 10, series_type: str = "close") -> dict:
-    """
-    Fetch sliding window technical indicator data (requires premium API).
-    """
-    try:
-        return get_analytics_sliding(symbol, function_name, interval, time_period, series_type)
-    except Exception as e:
-        return f"Error getting analytics sliding for {symbol} function {function_name}: {str(e)}"
+    async def tool(**kwargs) -> dict:
+        call = partial(fetcher, priority=endpoint.priority, client=current_client())
+        try:
+            return await run_blocking(call, priority=endpoint.priority, **kwargs)
+        except Exception as e:
+            return {"error": f"Error getting {endpoint.function or endpoint.name} data: {str(e)}"}
 
-@mcp.tool()
-@app.get("/get_fundamental_data/{symbol}")
-async def get_fundamental_data_tool(symbol: str) -> dict:
-    """
-    Fetch fundamental data for a symbol.
-    """
-    try:
-        return get_fundamental_data(symbol)
-    except Exception as e:
-        return f"Error getting fundamental data for {symbol}: {str(e)}"
+    tool.__name__ = tool.__qualname__ = endpoint.tool
+    tool.__doc__ = endpoint.description
+    tool.__signature__ = endpoint.signature()
+    return tool
 
-@mcp.tool()
-@app.get("/get_company_overview_trending")
-async def get_company_overview_trending_tool() -> dict:
+def register(tool, path: str, method: str = "get") -> None:
     """
-    Fetch trending company overview data.
+    Expose a dict-returning tool as an MCP tool and an HTTP route with its result encoded by
+    json_codec: FastMCP receives the JSON text as is and FastAPI a ready response, so large
+    payloads are serialized once by the fast backend instead of walked again by each framework.
     """
-    try:
-        return get_company_overview_trending()
-    except Exception as e:
-        return f"Error getting company overview trending data: {str(e)}"
+    @wraps(tool)
+    async def as_text(**kwargs):
+        return json_codec.dumps_text(await tool(**kwargs))
 
-@mcp.tool()
-@app.get("/get_etf_profile_and_holdings/{symbol}")
-async def get_etf_profile_and_holdings_tool(symbol: str) -> dict:
-    """
-    Fetch ETF profile and holdings for a symbol.
-    """
-    try:
-        return get_etf_profile_and_holdings(symbol)
-    except Exception as e:
-        return f"Error getting ETF profile and holdings for {symbol}: {str(e)}"
+    @wraps(tool)
+    async def as_response(**kwargs):
+        return Response(json_codec.dumps(await tool(**kwargs)), media_type="application/json")
 
-@mcp.tool()
-@app.get("/get_corporate_action_dividends/{symbol}")
-async def get_corporate_action_dividends_tool(symbol: str) -> dict:
-    """
-    Fetch corporate action dividend data for a symbol.
-    """
-    try:
-        return get_corporate_action_dividends(symbol)
-    except Exception as e:
-        return f"Error getting corporate action dividends for {symbol}: {str(e)}"
+    mcp.tool(name=tool.__name__)(as_text)
+    getattr(app, method)(path)(as_response)
 
-@mcp.tool()
-@app.get("/get_corporate_action_splits/{symbol}")
-async def get_corporate_action_splits_tool(symbol: str) -> dict:
-    """
-    Fetch corporate action splits data for a symbol.
-    """
-    try:
-        return get_corporate_action_splits(symbol)
-    except Exception as e:
-        return f"Error getting corporate action splits for {symbol}: {str(e)}"
+# One MCP tool and one HTTP route per registry endpoint (get_intraday_tool, get_sma_data_tool, ...)
+for _endpoint in ENDPOINTS:
+    register(make_tool(_endpoint), _endpoint.path)
 
 @mcp.tool()
-@app.get("/get_income_statement/{symbol}")
-async def get_income_statement_tool(symbol: str) -> dict:
+@app.get("/get_cache_stats")
+async def get_cache_stats_tool() -> dict:
     """
-    Fetch income statement data for a company symbol.
+    Report entries, size and hit/miss counters of the Alpha Vantage memory and disk caches,
+    how many concurrent identical calls were coalesced into one upstream request, the
+    incremental indicator states kept in memory, the full/compact fetches of stored histories,
+    the background refreshes of stale responses with their latency, the remembered upstream
+    refusals, the symbols rejected locally and the earnings calendar indexes.
     """
-    try:
-        return get_income_statement(symbol)
-    except Exception as e:
-        return f"Error getting income statement for {symbol}: {str(e)}"
+    return {"memory": response_cache.stats(), "disk": disk_cache.stats(), "single_flight": single_flight.stats(),
+            "indicator_states": indicator_states.stats(), "series_store": series_store.stats(),
+            "revalidation": revalidator.stats(), "negative": negative_cache.stats(),
+            "symbol_check": symbol_check.stats(), "earnings": earnings_calendar.stats()}
 
-@mcp.tool()
-@app.get("/get_balance_sheet/{symbol}")
-async def get_balance_sheet_tool(symbol: str) -> dict:
+async def get_indicator_bundle_tool(symbol: str, indicators: List[Union[str, dict]], interval: str = "daily",
+                                    start: Optional[str] = None, end: Optional[str] = None,
+                                    last_n: Optional[int] = None) -> dict:
     """
-    Fetch the balance sheet data for a company symbol.
+    Fetch several technical indicators of a symbol in one call, aligned on shared timestamps.
+    indicators lists function names or specs with parameters, e.g.
+    ["RSI", {"function": "SMA", "time_period": 20}, {"function": "MACD", "name": "macd"}].
+    start/end (inclusive dates) and last_n limit the timestamps returned.
     """
     try:
-        return get_balance_sheet(symbol)
+        return await run_blocking(get_indicator_bundle, symbol, indicators, interval, start, end, last_n,
+                                  priority=NORMAL, client=current_client())
     except Exception as e:
-        return f"Error getting balance sheet for {symbol}: {str(e)}"
+        return {"error": f"Error getting indicator bundle for {symbol}: {str(e)}"}
 
-@mcp.tool()
-@app.get("/get_cash_flow/{symbol}")
-async def get_cash_flow_tool(symbol: str) -> dict:
-    """
-    Fetch the cash flow statement for a company symbol.
-    """
-    try:
-        return get_cash_flow(symbol)
-    except Exception as e:
-        return f"Error getting cash flow for {symbol}: {str(e)}"
+register(get_indicator_bundle_tool, "/get_indicator_bundle/{symbol}", method="post")
 
-@mcp.tool()
-@app.get("/get_earnings_trending")
-async def get_earnings_trending_tool() -> dict:
+async def get_indicator_sweep_tool(symbol: str, function: str, grid: Dict[str, List[Union[int, float]]],
+                                   interval: str = "daily", params: Optional[dict] = None, start: Optional[str] = None,
+                                   end: Optional[str] = None, last_n: Optional[int] = None) -> dict:
     """
-    Fetch trending earnings data.
+    Compute one technical indicator over a grid of parameters from a single price series, e.g.
+    function="SMA", grid={"time_period": [5, 10, 20, 50, 100, 200]} or function="MACD",
+    grid={"fastperiod": [8, 12], "slowperiod": [21, 26]}. params fixes other arguments
+    (series_type, signalperiod, ...). Returns one column per combination and one row per timestamp;
+    start/end (inclusive dates) and last_n limit the rows returned.
     """
     try:
-        return get_earnings_trending()
+        return await run_blocking(get_indicator_sweep, symbol, function, grid, interval, params, start, end, last_n,
+                                  priority=NORMAL, client=current_client())
     except Exception as e:
-        return f"Error getting earnings trending data: {str(e)}"
+        return {"error": f"Error computing {function} sweep for {symbol}: {str(e)}"}
 
-@mcp.tool()
-@app.get("/get_listing_delisting_status")
-async def get_listing_delisting_status_tool() -> dict:
-    """
-    Fetch listing and delisting status data.
-    """
-    try:
-        return get_listing_delisting_status()
-    except Exception as e:
-        return f"Error getting listing/delisting status data: {str(e)}"
+register(get_indicator_sweep_tool, "/get_indicator_sweep/{symbol}/{function}", method="post")
 
-@mcp.tool()
-@app.get("/get_earnings_calendar")
-async def get_earnings_calendar_tool() -> dict:
+async def search_symbol_tool(query: str, limit: int = 10) -> dict:
     """
-    Fetch earnings calendar data.
+    Search listed US stocks and ETFs by ticker or company name (e.g. "AAPL", "micro", "berkshire hath").
+    Matches are ranked exact symbol, symbol prefix, name words, then close spellings.
     """
     try:
-        return get_earnings_calendar()
+        return await run_blocking(search_symbol, query, limit, client=current_client())
     except Exception as e:
-        return f"Error getting earnings calendar data: {str(e)}"
+        return {"error": f"Error searching symbols for {query}: {str(e)}"}
 
-@mcp.tool()
-@app.get("/get_ipo_calendar")
-async def get_ipo_calendar_tool() -> dict:
-    """
-    Fetch IPO calendar data.
-    """
-    try:
-        return get_ipo_calendar()
-    except Exception as e:
-        return f"Error getting IPO calendar data: {str(e)}"
+register(search_symbol_tool, "/search_symbol/{query}")
 
-@app.get("/get_currency_exchange_rate/{from_currency}/{to_currency}")
-async def get_currency_exchange_rate_tool(from_currency: str, to_currency: str) -> dict:
-    """
-    Gets the current exchange rate between two currencies from Alpha Vantage API.
-    
-    Args:
-        from_currency: Source currency (e.g.: USD, EUR)
-    """
-    try:
-        return get_currency_exchange_rate(from_currency, to_currency)
-    except Exception as e:
-        return f"Error getting exchange rate for {from_currency} to {to_currency}: {str(e)}"
-    
-@mcp.tool()
-@app.get("/get_fx_daily_data/{from_symbol}/{to_symbol}")
-async def get_fx_daily_data_tool(from_symbol: str, to_symbol: str) -> dict:
-    """
-    Gets the daily time series (timestamp, open, high, low, close) of the FX currency pair from Alpha Vantage API.
-    """
-    try:
-        return get_fx_daily_data(from_symbol, to_symbol)
-    except Exception as e:
-        return f"Error getting FX daily data for {from_symbol} to {to_symbol}: {str(e)}"
-    
-@mcp.tool()
-@app.get("/get_fx_weekly_data/{from_symbol}/{to_symbol}")
-async def get_fx_weekly_data_tool(from_symbol: str, to_symbol: str) -> dict:
-    """
-    Gets the weekly time series (timestamp, open, high, low, close) of the FX currency pair from Alpha Vantage API.
-    """
-    try:
-        return get_fx_weekly_data(from_symbol, to_symbol)
-    except Exception as e:
-        return f"Error getting FX weekly data for {from_symbol} to {to_symbol}: {str(e)}"
-    
-@mcp.tool()
-@app.get("/get_fx_monthly_data/{from_symbol}/{to_symbol}")
-async def get_fx_monthly_data_tool(from_symbol: str, to_symbol: str) -> dict:
-    """
-    Gets the monthly time series (timestamp, open, high, low, close) of the FX currency pair from Alpha Vantage API.
-    """
-    try:
-        return get_fx_monthly_data(from_symbol, to_symbol)
-    except Exception as e:
-        return f"Error getting FX monthly data for {from_symbol} to {to_symbol}: {str(e)}"
-    
-@mcp.tool()
-@app.get("/get_digital_currency_daily_data/{symbol}/{market}")
-async def get_digital_currency_daily_data_tool(symbol: str, market: str) -> dict:
-    """
-    Gets the daily historical time series for a digital currency traded on a specific market from Alpha Vantage API.
-    """
-    try:
-        return get_digital_currency_daily_data(symbol, market)
-    except Exception as e:
-        return f"Error getting digital currency daily data for {symbol} on {market}: {str(e)}"
-    
-@mcp.tool()
-@app.get("/get_digital_currency_weekly_data/{symbol}/{market}")
-async def get_digital_currency_weekly_data_tool(symbol: str, market: str) -> dict:
+async def get_earnings_tool(start: Optional[str] = None, end: Optional[str] = None,
+                            symbol: Optional[str] = None) -> dict:
     """
-    Gets the weekly historical time series for a digital currency traded on a specific market from Alpha Vantage API.
+    List upcoming earnings reports between start and end (inclusive dates, e.g. 2024-01-02; by default
+    the coming week), optionally for one symbol. Answered from the earnings calendar, refreshed daily.
     """
     try:
-        return get_digital_currency_weekly_data(symbol, market)
+        return await run_blocking(get_earnings, start, end, symbol, client=current_client())
     except Exception as e:
-        return f"Error getting digital currency weekly data for {symbol} on {market}: {str(e)}"
+        return {"error": f"Error getting earnings calendar: {str(e)}"}
 
-@mcp.tool()
-@app.get("/get_digital_currency_monthly_data/{symbol}/{market}")
-async def get_digital_currency_monthly_data_tool(symbol: str, market: str) -> dict:
-    """
-    Gets the monthly historical time series for a digital currency traded on a specific market from Alpha Vantage API.
-    """
-    try:
-        return get_digital_currency_monthly_data(symbol, market)
-    except Exception as e:
-        return f"Error getting digital currency monthly data for {symbol} on {market}: {str(e)}"
-    
-@mcp.tool()
-@app.get("/get_crude_oil_wti_data/")
-async def get_crude_oil_wti_data_tool(interval: str) -> dict:
-    """
-    Gets the daily, weekly, or monthly historical time series for the West Texas Intermediate (WTI) crude oil prices from Alpha Vantage API.
-    """
-    try:
-        return get_crude_oil_wti_data(interval)
-    except Exception as e:
-        return f"Error getting crude oil WTI data for {interval}: {str(e)}"
-    
-@mcp.tool()
-@app.get("/get_crude_oil_brent_data/{interval}")
-async def get_crude_oil_brent_data_tool(interval: str) -> dict:
-    """
-    Gets the daily, weekly, or monthly historical time series for the Brent crude oil prices from Alpha Vantage API.
-    """
-    try:
-        return get_crude_oil_brent_data(interval)
-    except Exception as e:
-        return f"Error getting crude oil Brent data for {interval}: {str(e)}"
-    
-@mcp.tool()
-@app.get("/get_natural_gas_data/{interval}")
-async def get_natural_gas_data_tool(interval: str) -> dict:
-    """
-    Gets the daily, weekly, or monthly historical time series for the natural gas prices from Alpha Vantage API.
-    """
-    try:
-        return get_natural_gas_data(interval)
-    except Exception as e:
-        return f"Error getting natural gas data for {interval}: {str(e)}"
-    
-@mcp.tool()
-@app.get("/get_copper_data/{interval}")
-async def get_copper_data_tool(interval: str) -> dict:
-    """
-    Gets the monthly, quarterly and annual global price of copper from Alpha Vantage API.
-    """
-    try:
-        return get_copper_data(interval)
-    except Exception as e:
-        return f"Error getting copper data for {interval}: {str(e)}"
+register(get_earnings_tool, "/get_earnings")
 
-@mcp.tool()
-@app.get("/get_aluminum_data/{interval}")
-async def get_aluminum_data_tool(interval: str) -> dict:
+async def get_quotes_tool(symbols: List[str], max_wait_ms: Optional[float] = None) -> dict:
     """
-    Gets the monthly, quarterly and annual global price of aluminum from Alpha Vantage API.
+    Fetch the global quotes of several symbols (e.g. a watchlist) in one call. Cached quotes are
+    returned immediately and the rest fetched concurrently within the API rate limit. Each symbol
+    has a status (cached, fetched or error); with max_wait_ms, symbols that would wait longer for
+    the rate limit come back as errors instead of delaying the others.
     """
     try:
-        return get_aluminum_data(interval)
+        return await run_blocking(get_quotes, symbols, max_wait_ms, priority=NORMAL, client=current_client())
     except Exception as e:
-        return f"Error getting aluminum data for {interval}: {str(e)}"
+        return {"error": f"Error getting quotes: {str(e)}"}
 
-@mcp.tool()
-@app.get("get_wheat_data/{interval}")
-async def get_wheat_data_tool(interval: str) -> dict:
-    """
-    Gets the monthly, quarterly and annual global price of wheat from Alpha Vantage API.
-    """
-    try:
-        return get_wheat_data(interval)
-    except Exception as e:
-        return f"Error getting wheat data for {interval}: {str(e)}"
+register(get_quotes_tool, "/get_quotes", method="post")
 
 @mcp.tool()
-@app.get("/get_corn_data/{interval}")
-async def get_corn_data_tool(interval: str) -> dict:
-    """
-    Gets the monthly, quarterly and annual global price of corn from Alpha Vantage API.
-    """
-    try:
-        return get_corn_data(interval)
-    except Exception as e:
-        return f"Error getting corn data for {interval}: {str(e)}"
-    
-@mcp.tool()
-@app.get("/get_cotton_data/{interval}")
-async def get_cotton_data_tool(interval: str) -> dict:
-    """
-    Gets the monthly, quarterly and annual global price of cotton from Alpha Vantage API.
-    """
-    try:
-        return get_cotton_data(interval)
-    except Exception as e:
-        return f"Error getting cotton data for {interval}: {str(e)}"
-    
-@mcp.tool()
-@app.get("/get_sugar_data/{interval}")
-async def get_sugar_data_tool(interval: str) -> dict:
-    """
-    Gets the monthly, quarterly and annual global price of sugar from Alpha Vantage API.
-    """
-    try:
-        return get_sugar_data(interval)
-    except Exception as e:
-        return f"Error getting sugar data for {interval}: {str(e)}"
-    
-@mcp.tool()
-@app.get("/get_coffee_data/{interval}")
-async def get_coffee_data_tool(interval: str) -> dict:
-    """
-    Gets the monthly, quarterly and annual global price of coffee from Alpha Vantage API.
-    """
-    try:
-        return get_coffee_data(interval)
-    except Exception as e:
-        return f"Error getting coffee data for {interval}: {str(e)}"
-    
-@mcp.tool()
-@app.get("/get_all_commodities_data/{interval}")
-async def get_all_commodities_data_tool(interval: str) -> dict:
-    """
-    Gets the global price index of all commodities in monthly, quarterly, and annual temporal dimensions.
-    """
-    try:
-        return get_all_commodities_data(interval)
-    except Exception as e:
-        return f"Error getting all commodities data for {interval}: {str(e)}"
-    
-@mcp.tool()
-@app.get("/get_real_gdp_data/{interval}")
-async def get_real_gdp_data_tool(interval: str) -> dict:
-    """
-    Gets the real GDP data of the US economy in quarterly and annual temporal dimensions.
-    """
-    try:
-        return get_real_gdp(interval)
-    except Exception as e:
-        return f"Error getting real GDP data for {interval}: {str(e)}"
-    
-@mcp.tool()
-@app.get("/get_real_gdp_per_capita_data/")
-async def get_real_gdp_per_capita_data_tool() -> dict:
-    """
-    Gets the real GDP per capita data quaterly of the US economy.
-    """
-    try:
-        return get_real_gdp_per_capita()
-    except Exception as e:
-        return f"Error getting real GDP per capita data: {str(e)}"
-    
-@mcp.tool()
-@app.get("get_treasury_yield/{interval}-{maturity}")
-async def get_treasury_yield_tool(interval: str, maturity: str) -> dict:
-    """
-    Gets the US Treasury yield data for a specific maturity and interval.
-    
-    Args:
-        interval: Interval of the data (e.g.: daily, weekly, monthly)
-        maturity: Maturity of the treasury yield (e.g.: 10Y, 30Y)
-    
-    Returns:
-        Treasury yield data
-    """
-    try:
-        return get_treasury_yield(interval, maturity)
-    except Exception as e:
-        return f"Error getting treasury yield data for {maturity} at {interval} interval: {str(e)}"
-    
-@mcp.tool()
-@app.get("/get_federal_funds_rate/{interval}")
-async def get_federal_funds_rate_tool(interval: str) -> dict:
-    """
-    Gets the Federal Funds Rate in the US data for a specific interval.
-    
-    Args:
-        interval: Interval of the data (e.g.: daily, weekly, monthly)
-    
-    Returns:
-        Federal Funds Rate data
-    """
-    try:
-        return get_federal_funds_rate(interval)
-    except Exception as e:
-        return f"Error getting Federal Funds Rate data at {interval} interval: {str(e)}"
-    
-@mcp.tool()
-@app.get("/get_cpi_data/{interval}")
-async def get_cpi_data_tool(interval: str) -> dict:
-    """
-    Gets the Consumer Price Index (CPI) data in the US for a specific interval.
-    
-    Args:
-        interval: Interval of the data (monthly and semi-annual)
-    
-    Returns:
-        CPI data
-    """
-    try:
-        return get_cpi_data(interval)
-    except Exception as e:
-        return f"Error getting CPI data at {interval} interval: {str(e)}"
-    
-@mcp.tool()
-@app.get("/get_inflation_data")
-async def get_inflation_data_tool() -> dict:
+@app.get("/get_rate_limit_stats")
+async def get_rate_limit_stats_tool() -> dict:
     """
-    Gets the inflation rate data in the US.
+    Report the Alpha Vantage request queue: depth, estimated wait per priority class, usage and
+    remaining budget per API key, and queue latency per class.
     """
-    try:
-        return get_inflation()
-    except Exception as e:
-        return f"Error getting inflation data: {str(e)}"
+    return rate_limiter.stats()
 
 @mcp.tool()
-@app.get("/get_retail_sales")
-async def get_retail_sales_tool() -> dict:
-    """
-    Gets the monthly retail sales data in the US.
-    """
-    try:
-        return get_retail_sales()
-    except Exception as e:
-        return f"Error getting retail sales data: {str(e)}"
-    
-@mcp.tool()
-@app.get("/get_durables")
-async def get_durables_tool() -> dict:
-    """
-    Gets the monthly manufacturers' new orders of durable goods in the US.
-    """
-    try:
-        return get_durables()
-    except Exception as e:
-        return f"Error getting durable goods data: {str(e)}"
-    
-@mcp.tool()
-@app.get("get_monthly_unemployment_rate")
-async def get_monthly_unemployment_rate_tool() -> dict:
+@app.get("/chat_with_gpt/{prompt}")
+async def chat_with_gpt_tool(prompt: str) -> str:
     """
-    Gets the monthly unemployment rate in the US.
+    Chat with GPT to generate responses.
     """
     try:
-        return get_monthly_unemployment()
-    except Exception as e:
-        return f"Error getting monthly unemployment rate data: {str(e)}"
-    
-@mcp.tool()
-@app.get("/get_nonfarm_payrolls")
-async def get_nonfarm_payrolls_tool() -> dict:
-    """
-    Gets the monthly US All Employees: Total Nonfarm (commonly known as Total Nonfarm Payroll), 
-    a measure of the number of U.S. workers in the economy that excludes proprietors, private household employees,
-    unpaid volunteers, farm employees, and the unincorporated self-employed.
-    """
-    try:
-        return get_nonfarm_payroll()
-    except Exception as e:
-        return f"Error getting non-farm payrolls data: {str(e)}"
-    
-@mcp.tool()
-@app.get("/get_sma_data/{symbol}/{series_type}")
-async def get_sma_data_tool(symbol: str, interval: str = "daily", time_period: int = 60, series_type: str = "close") -> dict:
-    """
-    Gets the Simple Moving Average (SMA) data for a given symbol and series type.
-    
-    Args:
-        symbol: Stock symbol (e.g.: AAPL, MSFT)
-        series_type: Type of the series (e.g.: close, open, high, low)
-        interval: Time interval for the data (e.g.: daily, weekly, monthly)
-    
-    Returns:
-        SMA data
-    """
-    try:
-        return get_sma_values(symbol, interval, time_period, series_type)
-    except Exception as e:
-        return f"Error getting SMA data for {symbol} with series type {series_type}: {str(e)}"
-    
-@mcp.tool()
-@app.get("/get_ema_data/{symbol}/{series_type}")
-async def get_ema_data_tool(symbol: str, interval: str = "daily", time_period: int = 60, series_type: str = "close") -> dict:
-    """
-    Gets the Exponential Moving Average (EMA) data for a given symbol and series type.
-    
-    Args:
-        symbol: Stock symbol (e.g.: AAPL, MSFT)
-        series_type: Type of the series (e.g.: close, open, high, low)
-        interval: Time interval for the data (e.g.: daily, weekly, monthly)
-    
-    Returns:
-        EMA data
-    """
-    try:
-        return get_ema_values(symbol, interval, time_period, series_type)
-    except Exception as e:
-        return f"Error getting EMA data for {symbol} with series type {series_type}: {str(e)}"
-    
-@mcp.tool()
-@app.get("/get_wma_data/{symbol}/{series_type}")
-async def get_wma_data_tool(symbol: str, interval: str = "daily", time_period: int = 60, series_type: str = "close") -> dict:
-    """
-    Gets the Weighted Moving Average (WMA) data for a given symbol and series type.
-    
-    Args:
-        symbol: Stock symbol (e.g.: AAPL, MSFT)
-        series_type: Type of the series (e.g.: close, open, high, low)
-        interval: Time interval for the data (e.g.: daily, weekly, monthly)
-    
-    Returns:
-        WMA data
-    """
-    try:
-        return get_wma_values(symbol, interval, time_period, series_type)
-    except Exception as e:
-        return f"Error getting WMA data for {symbol} with series type {series_type}: {str(e)}"
-    
-@mcp.tool()
-@app.get("/get_dema_data/{symbol}/{series_type}")
-async def get_dema_data_tool(symbol: str, interval: str = "daily", time_period: int = 60, series_type: str = "close") -> dict:
-    """
-    Gets the Double Exponential Moving Average (DEMA) data for a given symbol and series type.
-    
-    Args:
-        symbol: Stock symbol (e.g.: AAPL, MSFT)
-        series_type: Type of the series (e.g.: close, open, high, low)
-        interval: Time interval for the data (e.g.: daily, weekly, monthly)
-    
-    Returns:
-        DEMA data
-    """
-    try:
-        return get_dema_values(symbol, interval, time_period, series_type)
-    except Exception as e:
-        return f"Error getting DEMA data for {symbol} with series type {series_type}: {str(e)}"
-    
-@mcp.tool()
-@app.get("/get_tema_data/{symbol}/{series_type}")
-async def get_tema_data_tool(symbol: str, interval: str = "daily", time_period: int = 60, series_type: str = "close") -> dict:
-    """
-    Gets the Triple Exponential Moving Average (TEMA) data for a given symbol and series type.
-    
-    Args:
-        symbol: Stock symbol (e.g.: AAPL, MSFT)
-        series_type: Type of the series (e.g.: close, open, high, low)
-        interval: Time interval for the data (e.g.: daily, weekly, monthly)
-    
-    Returns:
-        TEMA data
-    """
-    try:
-        return get_tema_values(symbol, interval, time_period, series_type)
-    except Exception as e:
-        return f"Error getting DEMA data for {symbol} with series type {series_type}: {str(e)}"
-    
-@mcp.tool()
-@app.get("/get_trima_data/{symbol}/{series_type}")
-async def get_trima_data_tool(symbol: str, interval: str = "daily", time_period: int = 60, series_type: str = "close") -> dict:
-    """
-    Gets the Triangular Moving Average (TRIMA) data for a given symbol and series type.
-    
-    Args:
-        symbol: Stock symbol (e.g.: AAPL, MSFT)
-        series_type: Type of the series (e.g.: close, open, high, low)
-        interval: Time interval for the data (e.g.: daily, weekly, monthly)
-    
-    Returns:
-        TRIMA data
-    """
-    try:
-        return get_trima_values(symbol, interval, time_period, series_type)
-    except Exception as e:
-        return f"Error getting TRIMA data for {symbol} with series type {series_type}: {str(e)}"
-    
-@mcp.tool()
-@app.get("/get_kama_data/{symbol}/{series_type}")
-async def get_kama_data_tool(symbol: str, interval: str = "daily", time_period: int = 60, series_type: str = "close") -> dict:
-    """
-    Gets the Kaufman Adaptive Moving Average (KAMA) data for a given symbol and series type.
-    
-    Args:
-        symbol: Stock symbol (e.g.: AAPL, MSFT)
-        series_type: Type of the series (e.g.: close, open, high, low)
-        interval: Time interval for the data (e.g.: daily, weekly, monthly)
-    
-    Returns:
-        KAMA data
-    """
-    try:
-        return get_kama_values(symbol, interval, time_period, series_type)
-    except Exception as e:
-        return f"Error getting KAMA data for {symbol} with series type {series_type}: {str(e)}"
-    
-@mcp.tool()
-@app.get("/get_mama_data/{symbol}/{series_type}")
-async def get_mama_data_tool(symbol: str, interval: str = "daily", time_period: int = 60, series_type: str = "close") -> dict:
-    """
-    Gets the MESA Adaptive Moving Average (MAMA) data for a given symbol and series type.
-    
-    Args:
-        symbol: Stock symbol (e.g.: AAPL, MSFT)
-        series_type: Type of the series (e.g.: close, open, high, low)
-        interval: Time interval for the data (e.g.: daily, weekly, monthly)
-    
-    Returns:
-        MAMA data
-    """
-    try:
-        return get_kama_values(symbol, interval, time_period, series_type)
-    except Exception as e:
-        return f"Error getting MAMA data for {symbol} with series type {series_type}: {str(e)}"
-    
-@mcp.tool()
-@app.get("/get_vwap_data/{symbol}")
-async def get_vwap_data_tool(symbol: str, interval: str = "daily") -> dict:
-    """
-    Gets the Volume Weighted Average Price (VWAP) data for a given symbol.
-    
-    Args:
-        symbol: Stock symbol (e.g.: AAPL, MSFT)
-        interval: Time interval for the data (e.g.: daily, weekly, monthly)
-    
-    Returns:
-        VWAP data
-    """
-    try:
-        return get_vwap_values(symbol, interval)
-    except Exception as e:
-        return f"Error getting VWAP data for {symbol}: {str(e)}"
-
-@mcp.tool()
-@app.get("/get_tthree_data/{symbol}/{series_type}")
-async def get_tthree_data_tool(symbol: str, interval: str = "daily", time_period: int = 60, series_type: str = "close") -> dict:
-    """
-    Gets the Triple Exponential Moving Average (T3) values for a given symbol and series type.
-    
-    Args:
-        symbol: Stock symbol (e.g.: AAPL, MSFT)
-        series_type: Type of the series (e.g.: close, open, high, low)
-        interval: Time interval for the data (e.g.: daily, weekly, monthly)
-    
-    Returns:
-        MAMA data
-    """
-    try:
-        return get_tthree_values(symbol, interval, time_period, series_type)
-    except Exception as e:
-        return f"Error getting MAMA data for {symbol} with series type {series_type}: {str(e)}"
-    
-@mcp.tool()
-@app.get("/get_macd_data/{symbol}/{series_type}")
-async def get_macd_data_tool(symbol: str, interval: str = "daily", series_type: str = "open", fastperiod: int = 12,
-                    slowperiod: int = 26, signalperiod: int = 9) -> dict:
-    """
-    Gets the Moving Average Convergence Divergence (MACD) values for a given symbol and series type.
-    Args:
-        symbol: Stock symbol (e.g.: AAPL, MSFT)
-        series_type: Type of the series (e.g.: close, open, high, low)
-        interval: Time interval for the data (e.g.: daily, weekly, monthly)
-        fastperiod: Fast period for MACD
-        slowperiod: Slow period for MACD
-        signalperiod: Signal period for MACD
-    Returns:
-        MACD data
-    """
-    try: 
-        return get_macd_values(symbol, interval, series_type, fastperiod, slowperiod, signalperiod)
-    except Exception as e:
-        return f"Error getting MACD data for {symbol} with series type {series_type}: {str(e)}"
-    
-@mcp.tool()
-@app.get("/get_macdext_data/{symbol}/{series_type}")
-async def get_macdext_data_tool(symbol: str, interval: str = "daily", series_type: str = "open", fastperiod: int = 12,
-                    slowperiod: int = 26, signalperiod: int = 9) -> dict:
-    """
-    Gets the Moving Average Convergence Divergence (MACDEXT) values for a given symbol and series type.
-    Args:
-        symbol: Stock symbol (e.g.: AAPL, MSFT)
-        series_type: Type of the series (e.g.: close, open, high, low)
-        interval: Time interval for the data (e.g.: daily, weekly, monthly)
-        fastperiod: Fast period for MACDEXT
-        slowperiod: Slow period for MACDEXT
-        signalperiod: Signal period for MACDEXT
-    Returns:
-        MACD data
-    """
-    try: 
-        return get_macdext_values(symbol, interval, series_type, fastperiod, slowperiod, signalperiod)
-    except Exception as e:
-        return f"Error getting MACDEXT data for {symbol} with series type {series_type}: {str(e)}"
-    
-@mcp.tool()
-@app.get("/get_stoch_data/{symbol}/{series_type}")
-async def get_stoch_data_tool(symbol: str, interval: str = "daily", fastk_period: int = 14, slowk_period: int = 3,
-                                slowd_period: int = 3, series_type: str = "close") -> dict:
-    """
-    Gets the Stochastic Oscillator (STOCH) values for a given symbol and series type.
-    Args:
-        symbol: Stock symbol (e.g.: AAPL, MSFT)
-        series_type: Type of the series (e.g.: close, open, high, low)
-        interval: Time interval for the data (e.g.: daily, weekly, monthly)
-        fastk_period: Fast period for STOCH
-        slowk_period: Slow period for STOCH
-    Returns:
-        MACD data
-    """
-    try: 
-        return get_stoch_oscillator_values(symbol, interval, series_type, fastk_period, slowk_period, slowd_period)
-    except Exception as e:
-        return f"Error getting STOCH data for {symbol} with series type {series_type}: {str(e)}"
-
-@mcp.tool()
-@app.get("/get_stochfast_data/{symbol}")
-async def get_stochf_data_tool(symbol: str, interval: str = "daily", fastk_period: int = 5, fastdperiod: int = 3) -> dict:
-    """
-    Gets the Stochastic Fast Oscillator (STOCHF) values for a given symbol.
-    
-    Args:
-        symbol: Stock symbol (e.g.: AAPL, MSFT)
-        interval: Time interval for the data (e.g.: daily, weekly, monthly)
-    Returns:
-        STOCHF data
-    """
-    try: 
-        return get_stochf_oscillator_values(symbol, interval, fastk_period, fastdperiod)
-    except Exception as e:
-        return f"Error getting STOCHF data for {symbol}: {str(e)}"
-    
-@mcp.tool()
-@app.get("/get_rsi_data/{symbol}/{series_type}")
-async def get_rsi_data_tool(symbol: str, interval: str = "daily", time_period: int = 60, series_type: str = "close") -> dict:
-    """
-    Gets the Relative Strength Index (RSI) values for a given symbol and series type.
-    
-    Args:
-        symbol: Stock symbol (e.g.: AAPL, MSFT)
-        series_type: Type of the series (e.g.: close, open, high, low)
-        interval: Time interval for the data (e.g.: daily, weekly, monthly)
-    
-    Returns:
-        RSI data
-    """
-    try:
-        return get_rsi_values(symbol, interval, time_period, series_type)
-    except Exception as e:
-        return f"Error getting RSI data for {symbol} with series type {series_type}: {str(e)}"
-    
-@mcp.tool()
-@app.get("/get_stochrsi_data/{symbol}/{series_type}")
-async def get_stochrsi_data_tool(symbol: str, interval: str = "daily", time_period: int = 60, series_type: str = "close",
-                        fastkperiod: int = 5, fastdperiod: int = 3) -> dict:
-    """
-    Gets the Stochastic Relative Strength Index (STOCHRSI) values for a given symbol and series type.
-    Args:
-        symbol: Stock symbol (e.g.: AAPL, MSFT)
-        series_type: Type of the series (e.g.: close, open, high, low)
-        interval: Time interval for the data (e.g.: daily, weekly, monthly)
-    Returns:
-        STOCHRSI data
-    """
-    try:
-        return get_stochrsi_values(symbol, interval, time_period, series_type, fastkperiod, fastdperiod)
-    except Exception as e:
-        return f"Error getting STOCHRSI data for {symbol} with series type {series_type}: {str(e)}"
-    
-@mcp.tool()
-@app.get("/get_willr_data/{symbol}")
-async def get_wilrr_data_tool(symbol: str, interval: str = "daily", time_period: int = 60) -> dict:
-    """
-    Gets the Williams %R (WILLR) values for a given symbol.
-    
-    Args:
-        symbol: Stock symbol (e.g.: AAPL, MSFT)
-        interval: Time interval for the data (e.g.: daily, weekly, monthly)
-    
-    Returns:
-        WILLR data
-    """
-    try:
-        return get_willr_values(symbol, interval, time_period)
-    except Exception as e:
-        return f"Error getting WILLR data for {symbol}: {str(e)}"
-    
-@mcp.tool()
-@app.get("/get_adx_data/{symbol}/{series_type}")
-async def get_adx_data_tool(symbol: str, interval: str = "daily", time_period: int = 60, series_type: str = "close") -> dict:
-    """
-    Fetch Average Directional Movement Index (ADX) values for a given symbol.
-    """
-    try:
-        return get_adx_values(symbol, interval, time_period, series_type)
-    except Exception as e:
-        return f"Error getting ADX data for {symbol} with series type {series_type}: {str(e)}"
-    
-@mcp.tool()
-@app.get("/get_adxr_data/{symbol}/{series_type}")
-async def get_adxr_data_tool(symbol: str, interval: str = "daily", time_period: int = 60, series_type: str = "close") -> dict:
-    """
-    Fetch Average Directional Movement Rating Index (ADX) values for a given symbol.
-    """
-    try:
-        return get_adxr_values(symbol, interval, time_period, series_type)
-    except Exception as e:
-        return f"Error getting ADXR data for {symbol} with series type {series_type}: {str(e)}"
-    
-@mcp.tool()
-@app.get("/get_apo_data/{symbol}/{series_type}")
-async def get_apo_data_tool(symbol: str, interval: str = "daily", series_type: str = "close", fastperiod: int = 12,
-                   slowperiod: int = 26) -> dict:
-    """
-    Fetch Absolute Price Oscillator (APO) values for a given symbol.
-    """
-    try:
-        return get_apo_values(symbol, interval, series_type, fastperiod, slowperiod)
-    except Exception as e:
-        return f"Error getting APO data for {symbol} with series type {series_type}: {str(e)}"
-    
-@mcp.tool()
-@app.get("/get_ppo_data/{symbol}/{series_type}")
-async def get_ppo_data_tool(symbol: str, interval: str = "daily", series_type: str = "close", fastperiod: int = 12,
-                   slowperiod: int = 26) -> dict:
-    """
-    Fetch Percentage Price Oscillator (PPO) values for a given symbol.
-    """
-    try:
-        return get_ppo_values(symbol, interval, series_type, fastperiod, slowperiod)
-    except Exception as e:
-        return f"Error getting PPO data for {symbol} with series type {series_type}: {str(e)}"
-    
-@mcp.tool()
-@app.get("/get_mom_data/{symbol}/{series_type}")
-async def get_mom_data_tool(symbol: str, interval: str = "daily", time_period: int = 60, series_type: str = "close") -> dict:
-    """
-    Fetch Momentum (MOM) values for a given symbol.
-    """
-    try:
-        return get_mom_values(symbol, interval, time_period, series_type)
-    except Exception as e:
-        return f"Error getting MOM data for {symbol} with series type {series_type}: {str(e)}"
-    
-@mcp.tool()
-@app.get("/get_bop_data/{symbol}")
-async def get_bop_data_tool(symbol: str, interval: str = "daily") -> dict:
-    """
-    Fetch Balance of Power (BOP) values for a given symbol.
-    """
-    try:
-        return get_bop_values(symbol, interval)
-    except Exception as e:
-        return f"Error getting BOP data for {symbol}: {str(e)}"
-    
-@mcp.tool()
-@app.get("/get_cci_data/{symbol}")
-async def get_cci_data_tool(symbol: str, interval: str = "daily", time_period: int = 60) -> dict:
-    """
-    Fetch Commodity Channel Index (CCI) values for a given symbol.
-    """
-    try:
-        return get_cci_values(symbol, interval, time_period)
-    except Exception as e:
-        return f"Error getting CCI data for {symbol}: {str(e)}"
-
-@mcp.tool()
-@app.get("/get_cmo_data/{symbol}/{series_type}")
-async def get_cmo_data_tool(symbol: str, interval: str = "daily", time_period: int = 60, series_type: str = "close") -> dict:
-    """
-    Fetch Chande momentum oscillator (CMO) values for a given symbol.
-    """
-    try:
-        return get_cmo_values(symbol, interval, time_period, series_type)
-    except Exception as e:
-        return f"Error getting CMO data for {symbol} with series type {series_type}: {str(e)}"
-    
-@mcp.tool()
-@app.get("/get_roc_data/{symbol}/{series_type}")
-async def get_roc_data_tool(symbol: str, interval: str = "daily", time_period: int = 60, series_type: str = "close") -> dict:
-    """
-    Fetch rate of change (ROC) values for a given symbol.
-    """
-    try:
-        return get_roc_values(symbol, interval, time_period, series_type)
-    except Exception as e:
-        return f"Error getting ROC data for {symbol} with series type {series_type}: {str(e)}"
-    
-@mcp.tool()
-@app.get("/get_rocr_data/{symbol}/{series_type}")
-async def get_rocr_data_tool(symbol: str, interval: str = "daily", time_period: int = 60, series_type: str = "close") -> dict:
-    """
-    Fetch rate of change ratio (ROCR) values for a given symbol.
-    """
-    try:
-        return get_rocr_values(symbol, interval, time_period, series_type)
-    except Exception as e:
-        return f"Error getting ROCR data for {symbol} with series type {series_type}: {str(e)}"
-
-@mcp.tool()
-@app.get("/get_mama_data/{symbol}/{series_type}")
-async def get_mama_data_tool(symbol: str, interval: str = "daily", time_period: int = 60, series_type: str = "close") -> dict:
-    """
-    Gets the MESA Adaptive Moving Average (MAMA) data for a given symbol and series type.
-    """
-    try:
-        return get_mama_values(symbol, interval, time_period, series_type)
-    except Exception as e:
-        return f"Error getting MAMA data for {symbol} with series type {series_type}: {str(e)}"
-    
-@mcp.tool()
-@app.get("/chat_with_gpt/{prompt}")
-async def chat_with_gpt_tool(prompt: str) -> str:
-    """
-    Chat with GPT to generate responses.
-    """
-    try:
-        return chat_with_gpt(prompt)
+        return await run_blocking(chat_with_gpt, prompt)
     except Exception as e:
         return f"Error: {str(e)}"
 
-@mcp.tool()
-@app.get("/get_aroon_data/{symbol}")
-async def get_aroon_data_tool(symbol: str, interval: str = "daily", time_period: int = 14) -> dict:
-    try:
-        return get_aroon_values(symbol, interval, time_period)
-    except Exception as e:
-        return {"error": f"Error getting AROON data for {symbol}: {str(e)}"}
-
-@mcp.tool()
-@app.get("/get_aroonosc_data/{symbol}")
-async def get_aroonosc_data_tool(symbol: str, interval: str = "daily", time_period: int = 14) -> dict:
-    try:
-        return get_aroonosc_values(symbol, interval, time_period)
-    except Exception as e:
-        return {"error": f"Error getting AROONOSC data for {symbol}: {str(e)}"}
-
-@mcp.tool()
-@app.get("/get_mfi_data/{symbol}")
-async def get_mfi_data_tool(symbol: str, interval: str = "daily", time_period: int = 14) -> dict:
-    try:
-        return get_mfi_values(symbol, interval, time_period)
-    except Exception as e:
-        return {"error": f"Error getting MFI data for {symbol}: {str(e)}"}
-
-@mcp.tool()
-@app.get("/get_trix_data/{symbol}/{series_type}")
-async def get_trix_data_tool(symbol: str, interval: str = "daily", time_period: int = 15, series_type: str = "close") -> dict:
-    try:
-        return get_trix_values(symbol, interval, time_period, series_type)
-    except Exception as e:
-        return {"error": f"Error getting TRIX data for {symbol} with series type {series_type}: {str(e)}"}
-
-@mcp.tool()
-@app.get("/get_ultosc_data/{symbol}")
-async def get_ultosc_data_tool(symbol: str, interval: str = "daily", timeperiod1: int = 7, timeperiod2: int = 14, timeperiod3: int = 28) -> dict:
-    try:
-        return get_ultosc_values(symbol, interval, timeperiod1, timeperiod2, timeperiod3)
-    except Exception as e:
-        return {"error": f"Error getting ULTOSC data for {symbol}: {str(e)}"}
-
-@mcp.tool()
-@app.get("/get_dx_data/{symbol}")
-async def get_dx_data_tool(symbol: str, interval: str = "daily", time_period: int = 14) -> dict:
-    try:
-        return get_dx_values(symbol, interval, time_period)
-    except Exception as e:
-        return {"error": f"Error getting DX data for {symbol}: {str(e)}"}
-
-@mcp.tool()
-@app.get("/get_minus_di_data/{symbol}")
-async def get_minus_di_data_tool(symbol: str, interval: str = "daily", time_period: int = 14) -> dict:
-    try:
-        return get_minus_di_values(symbol, interval, time_period)
-    except Exception as e:
-        return {"error": f"Error getting MINUS_DI data for {symbol}: {str(e)}"}
-
-@mcp.tool()
-@app.get("/get_plus_di_data/{symbol}")
-async def get_plus_di_data_tool(symbol: str, interval: str = "daily", time_period: int = 14) -> dict:
-    try:
-        return get_plus_di_values(symbol, interval, time_period)
-    except Exception as e:
-        return {"error": f"Error getting PLUS_DI data for {symbol}: {str(e)}"}
-
-@mcp.tool()
-@app.get("/get_minus_dm_data/{symbol}")
-async def get_minus_dm_data_tool(symbol: str, interval: str = "daily", time_period: int = 14) -> dict:
-    try:
-        return get_minus_dm_values(symbol, interval, time_period)
-    except Exception as e:
-        return {"error": f"Error getting MINUS_DM data for {symbol}: {str(e)}"}
-
-@mcp.tool()
-@app.get("/get_plus_dm_data/{symbol}")
-async def get_plus_dm_data_tool(symbol: str, interval: str = "daily", time_period: int = 14) -> dict:
-    try:
-        return get_plus_dm_values(symbol, interval, time_period)
-    except Exception as e:
-        return {"error": f"Error getting PLUS_DM data for {symbol}: {str(e)}"}
-
-@mcp.tool()
-@app.get("/get_aroon_data/{symbol}")
-async def get_aroon_data_tool(symbol: str, interval: str = "daily", time_period: int = 14) -> dict:
-    try:
-        return get_aroon_values(symbol, interval, time_period)
-    except Exception as e:
-        return {"error": f"Error getting AROON data for {symbol}: {str(e)}"}
-
-@mcp.tool()
-@app.get("/get_aroonosc_data/{symbol}")
-async def get_aroonosc_data_tool(symbol: str, interval: str = "daily", time_period: int = 14) -> dict:
-    try:
-        return get_aroonosc_values(symbol, interval, time_period)
-    except Exception as e:
-        return {"error": f"Error getting AROONOSC data for {symbol}: {str(e)}"}
-
-@mcp.tool()
-@app.get("/get_mfi_data/{symbol}")
-async def get_mfi_data_tool(symbol: str, interval: str = "daily", time_period: int = 14) -> dict:
-    try:
-        return get_mfi_values(symbol, interval, time_period)
-    except Exception as e:
-        return {"error": f"Error getting MFI data for {symbol}: {str(e)}"}
-
-@mcp.tool()
-@app.get("/get_trix_data/{symbol}/{series_type}")
-async def get_trix_data_tool(symbol: str, interval: str = "daily", time_period: int = 15, series_type: str = "close") -> dict:
-    try:
-        return get_trix_values(symbol, interval, time_period, series_type)
-    except Exception as e:
-        return {"error": f"Error getting TRIX data for {symbol} with series type {series_type}: {str(e)}"}
-
-@mcp.tool()
-@app.get("/get_ultosc_data/{symbol}")
-async def get_ultosc_data_tool(symbol: str, interval: str = "daily", timeperiod1: int = 7, timeperiod2: int = 14, timeperiod3: int = 28) -> dict:
-    try:
-        return get_ultosc_values(symbol, interval, timeperiod1, timeperiod2, timeperiod3)
-    except Exception as e:
-        return {"error": f"Error getting ULTOSC data for {symbol}: {str(e)}"}
-
-@mcp.tool()
-@app.get("/get_dx_data/{symbol}")
-async def get_dx_data_tool(symbol: str, interval: str = "daily", time_period: int = 14) -> dict:
-    try:
-        return get_dx_values(symbol, interval, time_period)
-    except Exception as e:
-        return {"error": f"Error getting DX data for {symbol}: {str(e)}"}
-
-@mcp.tool()
-@app.get("/get_minus_di_data/{symbol}")
-async def get_minus_di_data_tool(symbol: str, interval: str = "daily", time_period: int = 14) -> dict:
-    try:
-        return get_minus_di_values(symbol, interval, time_period)
-    except Exception as e:
-        return {"error": f"Error getting MINUS_DI data for {symbol}: {str(e)}"}
-
-@mcp.tool()
-@app.get("/get_plus_di_data/{symbol}")
-async def get_plus_di_data_tool(symbol: str, interval: str = "daily", time_period: int = 14) -> dict:
-    try:
-        return get_plus_di_values(symbol, interval, time_period)
-    except Exception as e:
-        return {"error": f"Error getting PLUS_DI data for {symbol}: {str(e)}"}
-
-@mcp.tool()
-@app.get("/get_minus_dm_data/{symbol}")
-async def get_minus_dm_data_tool(symbol: str, interval: str = "daily", time_period: int = 14) -> dict:
-    try:
-        return get_minus_dm_values(symbol, interval, time_period)
-    except Exception as e:
-        return {"error": f"Error getting MINUS_DM data for {symbol}: {str(e)}"}
-
-@mcp.tool()
-@app.get("/get_plus_dm_data/{symbol}")
-async def get_plus_dm_data_tool(symbol: str, interval: str = "daily", time_period: int = 14) -> dict:
-    try:
-        return get_plus_dm_values(symbol, interval, time_period)
-    except Exception as e:
-        return {"error": f"Error getting PLUS_DM data for {symbol}: {str(e)}"}
-
-@mcp.tool()
-@app.get("/get_bbands_data/{symbol}/{series_type}")
-async def get_bbands_data_tool(symbol: str, interval: str = "daily", time_period: int = 5, series_type: str = "close", nbdevup: float = 2, nbdevdn: float = 2, matype: int = 0) -> dict:
-    try:
-        return get_bbands_values(symbol, interval, time_period, series_type, nbdevup, nbdevdn, matype)
-    except Exception as e:
-        return {"error": f"Error getting BBANDS data for {symbol}: {str(e)}"}
-
-@mcp.tool()
-@app.get("/get_midpoint_data/{symbol}")
-async def get_midpoint_data_tool(symbol: str, interval: str = "daily", time_period: int = 14) -> dict:
-    try:
-        return get_midpoint_values(symbol, interval, time_period)
-    except Exception as e:
-        return {"error": f"Error getting MIDPOINT data for {symbol}: {str(e)}"}
-
-@mcp.tool()
-@app.get("/get_midprice_data/{symbol}")
-async def get_midprice_data_tool(symbol: str, interval: str = "daily", time_period: int = 14) -> dict:
-    try:
-        return get_midprice_values(symbol, interval, time_period)
-    except Exception as e:
-        return {"error": f"Error getting MIDPRICE data for {symbol}: {str(e)}"}
-
-@mcp.tool()
-@app.get("/get_sar_data/{symbol}")
-async def get_sar_data_tool(symbol: str, interval: str = "daily", acceleration: float = 0.02, maximum: float = 0.2) -> dict:
-    try:
-        return get_sar_values(symbol, interval, acceleration, maximum)
-    except Exception as e:
-        return {"error": f"Error getting SAR data for {symbol}: {str(e)}"}
-
-@mcp.tool()
-@app.get("/get_trange_data/{symbol}")
-async def get_trange_data_tool(symbol: str, interval: str = "daily") -> dict:
-    try:
-        return get_trange_values(symbol, interval)
-    except Exception as e:
-        return {"error": f"Error getting TRANGE data for {symbol}: {str(e)}"}
-
-@mcp.tool()
-@app.get("/get_atr_data/{symbol}")
-async def get_atr_data_tool(symbol: str, interval: str = "daily", time_period: int = 14) -> dict:
-    try:
-        return get_atr_values(symbol, interval, time_period)
-    except Exception as e:
-        return {"error": f"Error getting ATR data for {symbol}: {str(e)}"}
-
-@mcp.tool()
-@app.get("/get_natr_data/{symbol}")
-async def get_natr_data_tool(symbol: str, interval: str = "daily", time_period: int = 14) -> dict:
-    try:
-        return get_natr_values(symbol, interval, time_period)
-    except Exception as e:
-        return {"error": f"Error getting NATR data for {symbol}: {str(e)}"}
-
-@mcp.tool()
-@app.get("/get_ad_data/{symbol}")
-async def get_ad_data_tool(symbol: str, interval: str = "daily") -> dict:
-    try:
-        return get_ad_values(symbol, interval)
-    except Exception as e:
-        return {"error": f"Error getting AD data for {symbol}: {str(e)}"}
-
-@mcp.tool()
-@app.get("/get_adosc_data/{symbol}")
-async def get_adosc_data_tool(symbol: str, interval: str = "daily", fastperiod: int = 3, slowperiod: int = 10) -> dict:
-    try:
-        return get_adosc_values(symbol, interval, fastperiod, slowperiod)
-    except Exception as e:
-        return {"error": f"Error getting ADOSC data for {symbol}: {str(e)}"}
-
-@mcp.tool()
-@app.get("/get_obv_values/{symbol}")
-async def get_obv_data_tool(symbol: str, interval: str = "daily") -> dict:
-    try:
-        return get_obv_values(symbol, interval)
-    except Exception as e:
-        return {"error": f"Error getting OBV data for {symbol}: {str(e)}"}
-
-@mcp.tool()
-@app.get("/get_ht_trendline_data/{symbol}")
-async def get_ht_trendline_data_tool(symbol: str, interval: str = "daily") -> dict:
-    try:
-        return get_ht_trendline_values(symbol, interval)
-    except Exception as e:
-        return {"error": f"Error getting HT_TRENDLINE data for {symbol}: {str(e)}"}
-
-@mcp.tool()
-@app.get("/get_ht_sine_data/{symbol}")
-async def get_ht_sine_data_tool(symbol: str, interval: str = "daily") -> dict:
-    try:
-        return get_ht_sine_values(symbol, interval)
-    except Exception as e:
-        return {"error": f"Error getting HT_SINE data for {symbol}: {str(e)}"}
-
-@mcp.tool()
-@app.get("/get_ht_trendmode_data/{symbol}")
-async def get_ht_trendmode_data_tool(symbol: str, interval: str = "daily") -> dict:
-    try:
-        return get_ht_trendmode_values(symbol, interval)
-    except Exception as e:
-        return {"error": f"Error getting HT_TRENDMODE data for {symbol}: {str(e)}"}
-
-@mcp.tool()
-@app.get("/get_ht_dcperiod_data/{symbol}")
-async def get_ht_dcperiod_data_tool(symbol: str, interval: str = "daily") -> dict:
-    try:
-        return get_ht_dcperiod_values(symbol, interval)
-    except Exception as e:
-        return {"error": f"Error getting HT_DCPERIOD data for {symbol}: {str(e)}"}
-
-@mcp.tool()
-@app.get("/get_ht_dcphase_data/{symbol}")
-async def get_ht_dcphase_data_tool(symbol: str, interval: str = "daily") -> dict:
-    try:
-        return get_ht_dcphase_values(symbol, interval)
-    except Exception as e:
-        return {"error": f"Error getting HT_DCPHASE data for {symbol}: {str(e)}"}
-
-@mcp.tool()
-@app.get("/get_ht_phasor_data/{symbol}")
-async def get_ht_phasor_data_tool(symbol: str, interval: str = "daily") -> dict:
-    try:
-        return get_ht_phasor_values(symbol, interval)
-    except Exception as e:
-        return {"error": f"Error getting HT_PHASOR data for {symbol}: {str(e)}"}
-
 
 # Run the server
 if __name__ == "__main__":
+    disk_cache.compact()
+    if WARM_START:
+        disk_cache.warm(response_cache)
     transport = "stdio"
     if transport == "stdio":
         print("Running mcp server with stdio transport")
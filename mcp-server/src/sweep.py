@@ -0,0 +1,210 @@
+import numpy as np
+
+import indicators
+from indicators import _divide
+
+# Parameter sweeps: one indicator over a grid of parameter combinations of one
+# price series, returned as (bars x combinations) matrices. Window indicators
+# (SMA, APO, PPO) are a single 2-D NumPy expression; recursive ones (EMA, RSI,
+# MACD, SAR) advance every combination together in one pass over time, which
+# beats separate per-combination loops once the grid is large.
+
+MAX_COMBINATIONS = 256
+COLUMN_LOOP = 16  # below this many combinations, per-column loops are cheaper than a 2-D pass
+SAR_COLUMN_LOOP = 64  # the SAR state machine costs ~20 vector ops per bar
+
+
+def _column(values: np.ndarray, j: int) -> np.ndarray:
+    return values[:, j] if values.ndim == 2 else values
+
+
+def _smooth_grid(values: np.ndarray, k: np.ndarray, seed: np.ndarray, start: np.ndarray) -> np.ndarray:
+    """
+    Column j is seed[j] at row start[j], then prev += k[j] * (value - prev); NaN before start.
+    values is one series shared by every column, or a matrix with one series per column.
+    """
+    length, count = len(values), len(k)
+    out = np.full((length, count), np.nan)
+    if count < COLUMN_LOOP:
+        for j in range(count):
+            if start[j] < length:
+                out[start[j], j] = seed[j]
+                out[start[j] + 1:, j] = indicators._smooth(_column(values, j)[start[j] + 1:].tolist(), seed[j], k[j])
+        return out
+    rows = np.arange(length)[:, None]
+    step = np.where(rows > start, k, 0.0)  # columns sit on their seed until they start
+    if values.ndim == 2:
+        values = np.where(rows > start, values, 0.0)  # warm-up NaNs would leak through 0 * NaN
+    prev = np.array(seed, dtype=float)
+    for t in range(int(start.min()), length):
+        prev += step[t] * (values[t] - prev)
+        out[t] = prev
+    out[rows < start] = np.nan
+    return out
+
+
+def sma_grid(x: np.ndarray, periods: np.ndarray) -> np.ndarray:
+    sums = np.cumsum(np.concatenate(([0.0], x)))
+    end = np.arange(1, len(x) + 1)[:, None]
+    begin = end - periods
+    out = (sums[end] - sums[np.maximum(begin, 0)]) / periods
+    out[begin < 0] = np.nan
+    return out
+
+
+def ema_grid(x: np.ndarray, periods: np.ndarray, seed_end: np.ndarray = None) -> np.ndarray:
+    """
+    One EMA column per period, seeded like indicators.ema (x may hold one series per column).
+    """
+    if seed_end is None:
+        seed_end = np.array([indicators._first_valid(_column(x, j)) for j in range(len(periods))]) + periods - 1
+    seed = np.array([
+        np.mean(_column(x, j)[end - n + 1:end + 1]) if end < len(x) else np.nan
+        for j, (n, end) in enumerate(zip(periods.tolist(), seed_end.tolist()))
+    ])
+    return _smooth_grid(x, 2 / (periods + 1), seed, seed_end)
+
+
+def rsi_grid(x: np.ndarray, periods: np.ndarray) -> np.ndarray:
+    out = np.full((len(x), len(periods)), np.nan)
+    if len(x) < 2:
+        return out
+    change = np.diff(x)
+    up, down = np.maximum(change, 0), np.maximum(-change, 0)
+    # Wilder smoothing is an EMA with k = 1/n seeded with the mean of the first n changes
+    start = periods - 1
+    gain = _smooth_grid(up, 1 / periods, np.array([up[:n].mean() if n <= len(up) else np.nan for n in periods]), start)
+    loss = _smooth_grid(down, 1 / periods, np.array([down[:n].mean() if n <= len(down) else np.nan for n in periods]), start)
+    out[1:] = 100 * _divide(gain, gain + loss)
+    return out
+
+
+def macd_grid(x: np.ndarray, fast: np.ndarray, slow: np.ndarray, signal: np.ndarray) -> tuple:
+    fast, slow = np.minimum(fast, slow), np.maximum(fast, slow)
+    slows, which = np.unique(slow, return_inverse=True)
+    line = ema_grid(x, fast, seed_end=slow - 1) - ema_grid(x, slows)[:, which]
+    trigger = ema_grid(line, signal)
+    line = np.where(np.isnan(trigger), np.nan, line)
+    return line, trigger, line - trigger
+
+
+def _sma_pair(x: np.ndarray, fast: np.ndarray, slow: np.ndarray) -> tuple:
+    periods, which = np.unique(np.concatenate((fast, slow)), return_inverse=True)
+    averages = sma_grid(x, periods)
+    return averages[:, which[:len(fast)]], averages[:, which[len(fast):]]
+
+
+def sar_grid(high: np.ndarray, low: np.ndarray, acceleration: np.ndarray, maximum: np.ndarray) -> np.ndarray:
+    """
+    indicators.sar() for every (acceleration, maximum) column, with the state machine run on vectors.
+    """
+    count = len(acceleration)
+    out = np.full((len(high), count), np.nan)
+    if count < SAR_COLUMN_LOOP:
+        for j in range(count):
+            out[:, j] = indicators.sar(high, low, float(acceleration[j]), float(maximum[j]))
+        return out
+    if len(high) < 2:
+        return out
+    high_values, low_values = high.tolist(), low.tolist()
+    down, up = low_values[0] - low_values[1], high_values[1] - high_values[0]
+    is_long = np.full(count, not (down > 0 and down > up))
+    factor = np.array(acceleration, dtype=float)
+    extreme = np.full(count, high_values[1] if is_long[0] else low_values[1])
+    value = np.full(count, low_values[0] if is_long[0] else high_values[0])
+    new_high, new_low = high_values[1], low_values[1]
+    for today in range(1, len(high_values)):
+        prev_high, prev_low = new_high, new_low
+        new_high, new_low = high_values[today], low_values[today]
+        to_short = is_long & (new_low <= value)
+        to_long = ~is_long & (new_high >= value)
+        result = np.where(to_short, np.maximum(extreme, max(prev_high, new_high)),
+                          np.where(to_long, np.minimum(extreme, min(prev_low, new_low)), value))
+        out[today] = result
+        higher = is_long & ~to_short & (new_high > extreme)
+        lower = ~is_long & ~to_long & (new_low < extreme)
+        stepped = higher | lower
+        extreme = np.where(higher | to_long, new_high, np.where(lower | to_short, new_low, extreme))
+        factor = np.where(to_short | to_long, acceleration,
+                          np.where(stepped, np.minimum(factor + acceleration, maximum), factor))
+        is_long = (is_long & ~to_short) | to_long
+        value = result + factor * (extreme - result)
+        value = np.where(is_long, np.minimum(value, min(prev_low, new_low)), np.maximum(value, max(prev_high, new_high)))
+    return out
+
+
+def _values(combinations: list, name: str, kind=int) -> np.ndarray:
+    return np.array([kind(arguments[name]) for arguments in combinations])
+
+
+def _apo(x: np.ndarray, combinations: list) -> dict:
+    fast, slow = _sma_pair(x, _values(combinations, "fastperiod"), _values(combinations, "slowperiod"))
+    return {"APO": fast - slow}
+
+
+def _ppo(x: np.ndarray, combinations: list) -> dict:
+    fast, slow = _sma_pair(x, _values(combinations, "fastperiod"), _values(combinations, "slowperiod"))
+    return {"PPO": 100 * _divide(fast - slow, slow)}
+
+
+def _macd(x: np.ndarray, combinations: list) -> dict:
+    line, trigger, histogram = macd_grid(x, _values(combinations, "fastperiod"), _values(combinations, "slowperiod"),
+                                         _values(combinations, "signalperiod"))
+    return {"MACD": line, "MACD_Signal": trigger, "MACD_Hist": histogram}
+
+
+def _price(series: dict, combinations: list) -> np.ndarray:
+    # Every combination has the same series_type, see sweep()
+    return indicators._price(series, combinations[0])
+
+
+# Alpha Vantage function -> sweep over the OHLCV columns for a list of bound arguments
+SWEEPS = {
+    "SMA": lambda s, c: {"SMA": sma_grid(_price(s, c), _values(c, "time_period"))},
+    "EMA": lambda s, c: {"EMA": ema_grid(_price(s, c), _values(c, "time_period"))},
+    "RSI": lambda s, c: {"RSI": rsi_grid(_price(s, c), _values(c, "time_period"))},
+    "MACD": lambda s, c: _macd(_price(s, c), c),
+    "APO": lambda s, c: _apo(_price(s, c), c),
+    "PPO": lambda s, c: _ppo(_price(s, c), c),
+    "SAR": lambda s, c: {"SAR": sar_grid(s["high"], s["low"], _values(c, "acceleration", float),
+                                         _values(c, "maximum", float))},
+}
+
+
+def sweepable(function: str, combinations: list) -> bool:
+    """
+    Whether sweep() computes an indicator for every argument combination.
+    """
+    return function in SWEEPS or all(indicators.computes(function, arguments) for arguments in combinations)
+
+
+def sweep(function: str, series: dict, combinations: list):
+    """
+    Outputs of an indicator for every argument combination as (bars x combinations) matrices,
+    or None when the indicator is not computed locally. Indicators without a dedicated sweep
+    are computed once per combination on the shared series.
+    """
+    if function in SWEEPS:
+        groups = {}
+        for j, arguments in enumerate(combinations):
+            groups.setdefault(arguments.get("series_type"), []).append(j)
+        if len(groups) == 1:
+            return SWEEPS[function](series, combinations)
+        # The vectorized sweeps read one price column: sweep each series_type apart, then put
+        # the columns back in the order of the combinations
+        columns = {}
+        for positions in groups.values():
+            outputs = SWEEPS[function](series, [combinations[j] for j in positions])
+            for name, values in outputs.items():
+                columns.setdefault(name, np.empty((len(values), len(combinations))))[:, positions] = values
+        return columns
+    if function not in indicators.COMPUTE:
+        return None
+    columns = {}
+    for arguments in combinations:
+        outputs = indicators.compute(function, series, arguments)
+        if outputs is None:
+            return None
+        for name, values in outputs.items():
+            columns.setdefault(name, []).append(values)
+    return {name: np.column_stack(values) for name, values in columns.items()}
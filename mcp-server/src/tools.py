@@ -1,2820 +1,628 @@
+import itertools
+from datetime import date, timedelta
+from concurrent.futures import ThreadPoolExecutor
 import os
+import numpy as np
 import requests
+import http_client
+import json_codec
+from http_client import POOL_SIZE
 from dotenv import load_dotenv
 from typing import Optional
+import indicators
+from endpoints import ENDPOINTS, ENDPOINTS_BY_NAME, INDICATORS, Endpoint
+from cache import (MISSING, NEGATIVE_TTL_INVALID, NEGATIVE_TTL_PREMIUM, Refusal, make_key, negative_cache,
+                   response_cache)
+import csv_stream
+import earnings
+import market_calendar
+from earnings import earnings_calendar
+from columnar import Series, to_columnar, to_legacy
+from listing import symbol_check
+from projection import Projection
+from series_store import COMPACT_BARS, series_store
+from disk_cache import disk_cache
+from sweep import MAX_COMBINATIONS, sweep, sweepable
+from incremental import INCREMENTAL, indicator_states
+from revalidate import revalidator
+from singleflight import single_flight
+from rate_limit import BACKGROUND, DEFAULT_MAX_WAIT, INTERACTIVE, NORMAL, RateLimitExceeded, rate_limiter
+from ttl_policy import cache_ttl
 from openai import OpenAI
 
 # Load environment variables
 
 load_dotenv()
 
+# Compute technical indicators from the price series instead of one upstream call each
+LOCAL_INDICATORS = os.getenv("ALPHA_VANTAGE_LOCAL_INDICATORS", "1").lower() not in ("0", "false", "no")
+
 def get_current_price(symbol: str) -> str:
     """
     Gets the current price of a stock from Alpha Vantage API.
+    Reads the newest bar of the stored 5min series, which is only refreshed once the next bar is due.
     """
-    apikey = os.getenv("ALPHA_VANTAGE_API_KEY")
-    if not apikey:
-        return "Error: ALPHA_VANTAGE_API_KEY not configured"
-    
-    url = (
-        "https://www.alphavantage.co/query"
-        f"?function=TIME_SERIES_INTRADAY&symbol={symbol}&interval=5min&apikey={apikey}"
-    )
-    
     try:
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        data = response.json()
-        
-        # Check if there's an error in the response
-        if "Error Message" in data:
-            return f"Error: Symbol {symbol} is not valid"
-        
-        if "Note" in data:
-            return "Error: API limit reached. Try again later."
-        
-        if "Time Series (5min)" not in data:
+        series = ohlcv_series(symbol, "5min", priority=INTERACTIVE)
+        if isinstance(series, dict):
+            return f"Error: {series['error']}"
+
+        # Bars are ordered by timestamp, so the most recent one is the last
+        close = series.column("close")
+        if close is None:
             return f"Error: Could not get data for {symbol}"
-        
-        # Get most recent price
-        time_series = data["Time Series (5min)"]
-        latest_time = sorted(time_series.keys())[-1]
-        latest_data = time_series[latest_time]
-        latest_price = latest_data["4. close"]
-        
-        return f"{symbol}: ${latest_price} (updated: {latest_time})"
-        
+        decimals = series.decimals[series.names.index("close")]
+        return f"{symbol}: ${close[-1]:.{decimals}f} (updated: {series.stamp(-1)})"
+
     except requests.RequestException as e:
         return f"Connection error: {str(e)}"
     except Exception as e:
         return f"Data processing error: {str(e)}"
 
-def get_stock_price(symbol: str) -> dict:
-    """
-    Get the latest intraday stock price.
-    """
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "TIME_SERIES_INTRADAY",
-        "symbol": symbol,
-        "interval": "1min",
-        "apikey": API_KEY
-    }
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        if "Time Series (1min)" in data:
-            return data["Time Series (1min)"]
-        return {"error": "Missing intraday data"}
-    return {"error": "Failed to fetch data"}
-
-def get_intraday(symbol: str, interval: Optional[str] = "1min") -> dict:
-    """
-    Fetch intraday time series for a given stock symbol.
-    """
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "TIME_SERIES_INTRADAY",
-        "symbol": symbol,
-        "interval": interval,
-        "apikey": API_KEY
-    }
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        if "Time Series ({})".format(interval) in data:
-            return data["Time Series ({})".format(interval)]
-        return {"error": "Missing intraday data"}
-    return {"error": "Failed to fetch data"}
-
-def get_daily_adjusted(symbol: str) -> dict:
-    """
-    Fetch daily adjusted time series data for a given symbol.
-    """
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "TIME_SERIES_DAILY_ADJUSTED",
-        "symbol": symbol,
-        "apikey": API_KEY
-    }
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        if "Time Series (Daily)" in data:
-            return data["Time Series (Daily)"]
-        return {"error": "Missing daily adjusted data"}
-    return {"error": "Failed to fetch data"}
-
-def get_weekly(symbol: str) -> dict:
-    """
-    Fetch weekly time series data for a given symbol.
-    """
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "TIME_SERIES_WEEKLY",
-        "symbol": symbol,
-        "apikey": API_KEY
-    }
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        if "Weekly Time Series" in data:
-            return data["Weekly Time Series"]
-        return {"error": "Missing weekly data"}
-    return {"error": "Failed to fetch data"}
-
-def get_weekly_adjusted(symbol: str) -> dict:
-    """
-    Fetch weekly adjusted time series data for a given symbol.
-    """
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "TIME_SERIES_WEEKLY_ADJUSTED",
-        "symbol": symbol,
-        "apikey": API_KEY
-    }
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        if "Weekly Adjusted Time Series" in data:
-            return data["Weekly Adjusted Time Series"]
-        return {"error": "Missing weekly adjusted data"}
-    return {"error": "Failed to fetch data"}
-
-def get_monthly(symbol: str) -> dict:
-    """
-    Fetch monthly time series data for a given symbol.
-    """
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "TIME_SERIES_MONTHLY",
-        "symbol": symbol,
-        "apikey": API_KEY
-    }
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        if "Monthly Time Series" in data:
-            return data["Monthly Time Series"]
-        return {"error": "Missing monthly data"}
-    return {"error": "Failed to fetch data"}
-
-def get_monthly_adjusted(symbol: str) -> dict:
-    """
-    Fetch monthly adjusted time series data for a given symbol.
-    """
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "TIME_SERIES_MONTHLY_ADJUSTED",
-        "symbol": symbol,
-        "apikey": API_KEY
-    }
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        if "Monthly Adjusted Time Series" in data:
-            return data["Monthly Adjusted Time Series"]
-        return {"error": "Missing monthly adjusted data"}
-    return {"error": "Failed to fetch data"}
-
-def get_quote(symbol: str) -> dict:
-    """
-    Fetch the current global quote for a given stock symbol.
-    """
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "GLOBAL_QUOTE",
-        "symbol": symbol,
-        "apikey": API_KEY
-    }
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        if "Global Quote" in data:
-            return data["Global Quote"]
-        return {"error": "Missing global quote data"}
-    return {"error": "Failed to fetch data"}
-
-def get_market_status() -> dict:
-    """
-    Fetch the current global market status.
-    """
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "MARKET_STATUS",
-        "apikey": API_KEY
-    }
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        return response.json()
-    return {"error": "Failed to fetch market status"}
-
-def get_historical_options_simple(symbol: str, date: Optional[str] = None, datatype: str = "json") -> dict:
-    if not API_KEY:
-        return {"error": "API key not configured"}
-    url = "https://www.alphavantage.co/query"
-    params = {"function": "HISTORICAL_OPTIONS", "symbol": symbol, "apikey": API_KEY, "datatype": datatype}
-    if date:
-        params["date"] = date
-    response = requests.get(url, params=params, timeout=10)
-    response.raise_for_status()
-    if datatype == "json":
-        return response.json()
-    else:
-        return {"csv": response.text}
-
-def get_news_sentiment(symbol: str) -> dict:
-    """
-    Fetch news and sentiment trending data for a symbol.
-    """
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "NEWS_SENTIMENT",
-        "tickers": symbol,
-        "apikey": API_KEY
-    }
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-    if data:
-        return data
-    else:
-        return {"error": "Failed to fetch data"}
-
-def get_earnings_transcript(symbol: str) -> dict:
-    """
-    Fetch earnings call transcript for a symbol.
-    """
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "EARNINGS_CALL_TRANSCRIPT",
-        "symbol": symbol,
-        "apikey": API_KEY
-    }
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-    if data:
-        return data
-    else:
-        return {"error": "Failed to fetch data"}
-
-def get_top_gainers_losers() -> dict:
-    """
-    Fetch top gainers and losers data.
-    """
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "TOP_GAINERS_LOSERS",
-        "apikey": API_KEY
-    }
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-    if data:
-        return data
-    else:
-        return {"error": "Failed to fetch data"}
-
-def get_insider_transactions(symbol: str) -> dict:
-    """
-    Fetch insider transactions trending data for a symbol.
-    """
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "INSIDER_TRADING",
-        "symbol": symbol,
-        "apikey": API_KEY
-    }
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-    if data:
-        return data
-    else:
-        return {"error": "Failed to fetch data"}
-
-def get_analytics_fixed(symbol: str, function: str,
-                        interval: str = "daily", time_period: int = 10,
-                        series_type: str = "close") -> dict:
-    """
-    Fetch fixed window technical indicator (e.g., SMA, EMA, RSI) data.
-    """
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": function,
-        "symbol": symbol,
-        "interval": interval,
-        "time_period": time_period,
-        "series_type": series_type,
-        "apikey": API_KEY
-    }
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-    if data:
-        return data
-    else:
-        return {"error": "Failed to fetch data"}
-
-def get_analytics_sliding(symbol: str, function: str,
-                          interval: str = "daily", time_period: int = 10,
-                          series_type: str = "close") -> dict:
-    """
-    Fetch sliding window technical indicator data (requires premium API).
-    """
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": function,
-        "symbol": symbol,
-        "interval": interval,
-        "time_period": time_period,
-        "series_type": series_type,
-        "apikey": API_KEY
-    }
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-    if data:
-        return data
-    else:
-        return {"error": "Failed to fetch data"}
-    
-def get_fundamental_data(symbol: str) -> dict:
-    """
-    Fetch fundamental data for a symbol.
-    """
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "OVERVIEW",
-        "symbol": symbol,
-        "apikey": API_KEY
-    }
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-    if data:
-        return data
-    else:
-        return {"error": "Failed to fetch fundamental data"}
-
-def get_company_overview_trending() -> dict:
-    """
-    Fetch trending company overview data (e.g., most active companies).
-    """
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "TRENDING_COMPANY_OVERVIEW",
-        "apikey": API_KEY
-    }
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-    if data:
-        return data
-    else:
-        return {"error": "Failed to fetch trending company overview"}
-
-def get_etf_profile_and_holdings(symbol: str) -> dict:
-    """
-    Fetch ETF profile and holdings for a symbol.
-    """
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "ETF_HOLDINGS",
-        "symbol": symbol,
-        "apikey": API_KEY
-    }
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-    if data:
-        return data
-    else:
-        return {"error": "Failed to fetch ETF profile and holdings"}
-
-def get_corporate_action_dividends(symbol: str) -> dict:
-    """
-    Fetch corporate action dividend data for a symbol.
-    """
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "DIVIDEND_HISTORY",
-        "symbol": symbol,
-        "apikey": API_KEY
-    }
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-    if data:
-        return data
-    else:
-        return {"error": "Failed to fetch dividend data"}
-
-def get_corporate_action_splits(symbol: str) -> dict:
-    """
-    Fetch corporate action splits data for a symbol.
-    """
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "SPLIT_HISTORY",
-        "symbol": symbol,
-        "apikey": API_KEY
-    }
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-    if data:
-        return data
-    else:
-        return {"error": "Failed to fetch split data"}
-
-def get_income_statement(symbol: str) -> dict:
-    """
-    Fetch income statement data for a company symbol.
-    """
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "INCOME_STATEMENT",
-        "symbol": symbol,
-        "apikey": API_KEY
-    }
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-    if data:
-        return data
-    else:
-        return {"error": "Failed to fetch income statement data"}
-
-def get_balance_sheet(symbol: str) -> dict:
-    """
-    Fetch the balance sheet data for a company symbol.
-    """
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "BALANCE_SHEET",
-        "symbol": symbol,
-        "apikey": API_KEY
-    }
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-    if data:
-        return data
-    else:
-        return {"error": "Failed to fetch balance sheet data"}
-
-def get_cash_flow(symbol: str) -> dict:
-    """
-    Fetch the cash flow statement for a company symbol.
-    """
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "CASH_FLOW",
-        "symbol": symbol,
-        "apikey": API_KEY
-    }
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-    if data:
-        return data
-    else:
-        return {"error": "Failed to fetch cash flow data"}
-
-def get_earnings_trending() -> dict:
-    """
-    Fetch trending earnings data.
-    """
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "EARNINGS_TRENDING",
-        "apikey": API_KEY
-    }
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-    if data:
-        return data
-    else:
-        return {"error": "Failed to fetch earnings trending data"}
-
-def get_listing_delisting_status() -> dict:
-    """
-    Fetch listing and delisting status data.
-    """
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "LISTING_STATUS",
-        "apikey": API_KEY
-    }
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-    if data:
-        return data
-    else:
-        return {"error": "Failed to fetch listing/delisting status"}
-
-def get_earnings_calendar() -> dict:
-    """
-    Fetch earnings calendar data.
-    """
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "EARNINGS_CALENDAR",
-        "apikey": API_KEY
-    }
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-    if data:
-        return data
-    else:
-        return {"error": "Failed to fetch earnings calendar"}
-
-def get_ipo_calendar() -> dict:
-    """
-    Fetch IPO calendar data.
-    """
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "IPO_CALENDAR",
-        "apikey": API_KEY
-    }
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-    if data:
-        return data
-    else:
-        return {"error": "Failed to fetch IPO calendar"}
-
-def get_currency_exchange_rate(from_currency: str, to_currency: str) -> dict:
-    """Fetch exchange rate between two currencies from Alpha Vantage."""
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "CURRENCY_EXCHANGE_RATE",
-        "from_currency": from_currency,
-        "to_currency": to_currency,
-        "apikey": api_key
-    }
-    response = requests.get(url, params=params)
-    
-    if response.status_code == 200:
-        data = response.json()
-        
-        # Check if the data contains the required information
-        if "Realtime Currency Exchange Rate" in data:
-            return data["Realtime Currency Exchange Rate"]
-        else:
-            return {"error": "Invalid data returned"}
-    else:
-        return {"error": "Failed to fetch data"}
-    
-def get_fx_daily_data(from_symbol: str, to_symbol: str) -> dict:
-    """Fetch daily time series (timestamp, open, high, low, close) of the FX currency pair from Alpha Vantage."""
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "FX_DAILY",
-        "from_symbol": from_symbol,
-        "to_symbol": to_symbol,
-        "apikey": api_key
-    }
-    response = requests.get(url, params=params)
-    
-    if response.status_code == 200:
-        data = response.json()
-        
-        # Check if the data contains the required information
-        if "Time Series FX (Daily)" in data:
-            return data["Time Series FX (Daily)"]
+def upstream_error(data: dict) -> Optional[str]:
+    """
+    Return the message Alpha Vantage sends instead of data (invalid call, throttling, premium), if any.
+    """
+    for key in ("Error Message", "Note", "Information"):
+        if key in data:
+            return data[key]
+    return None
+
+def fetch(params: dict, datatype: str = "json", ttl: float = 0, max_wait: Optional[float] = DEFAULT_MAX_WAIT,
+          priority: str = NORMAL, client: str = "default", grace: float = 0.0):
+    """
+    Send one query to Alpha Vantage. Every registry endpoint goes through here.
+    Successful responses are kept in the memory and disk caches for ttl seconds,
+    and concurrent identical queries share a single upstream request.
+    Requests queue for the rate limiter in their priority class, fairly shared between
+    clients; with max_wait (seconds) set, a call whose estimated wait is longer fails
+    right away instead.
+    For grace seconds after it expires, a response in the memory cache is still returned
+    at once while a background call refreshes it (stale-while-revalidate).
+    Invalid calls and premium-only refusals are remembered for their own TTL (see refusal_ttl).
+    """
+    key = make_key(params)
+    refused = negative_cache.get(key)
+    if refused is not MISSING:
+        return refused
+    if ttl > 0:
+        cached = response_cache.get(key)
+        if cached is not MISSING:
+            return cached
+        if grace > 0:
+            stale = response_cache.stale(key)
+            if stale is not MISSING:
+                revalidator.submit(key, lambda: revalidate(key, params, datatype, ttl, grace))
+                return stale
+        stored = disk_cache.get(key)
+        if stored is not MISSING:
+            data, remaining, size = stored
+            response_cache.set(key, data, remaining, size, grace)
+            return data
+    return single_flight.do(key, lambda: fetch_upstream(key, params, datatype, ttl, max_wait, priority, client, grace))
+
+def revalidate(key: tuple, params: dict, datatype: str, ttl: float, grace: float) -> bool:
+    """
+    Background refresh of a stale response, at background priority. True if a new response was stored.
+    """
+    data = single_flight.do(key, lambda: fetch_upstream(key, params, datatype, ttl, DEFAULT_MAX_WAIT, BACKGROUND,
+                                                        "revalidate", grace))
+    return "error" not in data and not upstream_error(data)
+
+def exhausted_quota(data: dict) -> Optional[str]:
+    """
+    Rate limiter bucket ("per_minute" or "per_day") an Alpha Vantage throttle message refers to, if any.
+    """
+    message = str(data.get("Note") or data.get("Information") or "").lower()
+    if "per day" in message and "per minute" not in message:
+        return "per_day"
+    if "Note" in data or "rate limit" in message or "per minute" in message:
+        return "per_minute"
+    return None
+
+def refusal_ttl(data: dict) -> float:
+    """
+    How long to remember an upstream refusal: invalid calls and premium-only functions. Throttle
+    notes are never remembered, they depend on the quota left rather than on the query.
+    """
+    if exhausted_quota(data):
+        return 0
+    if "Error Message" in data:
+        return NEGATIVE_TTL_INVALID
+    if "premium" in str(data.get("Information", "")).lower():
+        return NEGATIVE_TTL_PREMIUM
+    return 0
+
+def fetch_upstream(key: tuple, params: dict, datatype: str, ttl: float, max_wait: Optional[float],
+                   priority: str, client: str, grace: float = 0.0):
+    """
+    The actual HTTP round trip behind fetch(), run once per in-flight key.
+    """
+    # A call for the same key may have completed between our cache miss and taking the lead
+    if ttl > 0:
+        cached = response_cache.peek(key)
+        if cached is not MISSING:
+            return cached
+
+    keys = rate_limiter.keys()
+    if not keys:
+        return {"error": "ALPHA_VANTAGE_API_KEY not configured"}
+
+    # A throttled key is quarantined and the query retried once per key on the others
+    for _ in keys:
+        try:
+            apikey = rate_limiter.acquire(max_wait, priority, client)
+        except RateLimitExceeded as e:
+            return {"error": str(e)}
+
+        response = http_client.get(params={**params, "apikey": apikey.key}, stream=datatype == "csv")
+        if response.status_code != 200:
+            response.close()
+            return {"error": "Failed to fetch data"}
+        if datatype == "csv":
+            data, size = csv_stream.read(response)
         else:
-            return {"error": "Invalid data returned"}
-    else:
-        return {"error": "Failed to fetch data"}
-    
-def get_fx_weekly_data(from_symbol: str, to_symbol: str) -> dict:
-    """Fetch weekly time series (timestamp, open, high, low, close) of the FX currency pair from Alpha Vantage."""
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "FX_WEEKLY",
-        "from_symbol": from_symbol,
-        "to_symbol": to_symbol,
-        "apikey": api_key
-    }
-    response = requests.get(url, params=params)
-
-    if response.status_code == 200:
-        data = response.json()
-        
-        # Check if the data contains the required information
-        if "Time Series FX (Weekly)" in data:
-            return data["Time Series FX (Weekly)"]
-        else:
-            return {"error": "Invalid data returned"}
-    else:
-        return {"error": "Failed to fetch data"}
-    
-def get_fx_monthly_data(from_symbol: str, to_symbol: str) -> dict:
-    """Fetch monthly time series (timestamp, open, high, low, close) of the FX currency pair from Alpha Vantage."""
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "FX_MONTHLY",
-        "from_symbol": from_symbol,
-        "to_symbol": to_symbol,
-        "apikey": api_key
-    }
-    response = requests.get(url, params=params)
-
-    if response.status_code == 200:
-        data = response.json()
-        
-        # Check if the data contains the required information
-        if "Time Series FX (Monthly)" in data:
-            return data["Time Series FX (Monthly)"]
-        else:
-            return {"error": "Invalid data returned"}
-    else:
-        return {"error": "Failed to fetch data"}
-    
-def get_digital_currency_daily_data(symbol: str, market: str) -> dict:
-    """
-    Fetch daily historical time series for a digital currency (e.g., BTC)
-    traded on a specific market (e.g., EUR/Euro), refreshed daily at midnight (UTC).
-    """
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "DIGITAL_CURRENCY_DAILY",
-        "symbol": symbol,
-        "market": market,
-        "apikey": api_key
-    }
-    response = requests.get(url, params=params)
-
-    if response.status_code == 200:
-        data = response.json()
-        
-        # Check if the data contains the required information
-        if "Time Series (Digital Currency Daily)" in data:
-            return data["Time Series (Digital Currency Daily)"]
+            data, size = to_columnar(json_codec.loads(response.content)), len(response.content)
+        quota = exhausted_quota(data)
+        if not quota:
+            break
+        rate_limiter.quarantine(apikey, quota)
+
+    # Throttle notes and invalid-call messages must not be served from cache
+    if ttl > 0 and not upstream_error(data):
+        response_cache.set(key, data, ttl, size, grace)
+        disk_cache.set(key, data, ttl)
+    else:
+        negative_cache.set(key, data, refusal_ttl(data), size)
+    return data
+
+def call_endpoint(endpoint: Endpoint, arguments: dict, max_wait: Optional[float] = DEFAULT_MAX_WAIT,
+                  priority: Optional[str] = None, client: str = "default") -> dict:
+    """
+    Fetch a registry endpoint for bound arguments and extract its payload.
+    """
+    if endpoint.checks_symbol:
+        invalid = symbol_check.check(arguments["symbol"])
+        if invalid:
+            return {"error": invalid}
+        if endpoint.listed:
+            arguments = {**arguments, "symbol": symbol_check.normalize(arguments["symbol"])}
+    projection = Projection.from_arguments(arguments) if endpoint.projectable else None
+    if LOCAL_INDICATORS and endpoint.function in indicators.COMPUTE:
+        data = local_indicator(endpoint, arguments, max_wait, priority or endpoint.priority, client, projection)
+        if data is not None:
+            return data
+
+    if endpoint.history:
+        series = stored_series(endpoint, arguments, max_wait, priority or endpoint.priority, client)
+        if isinstance(series, dict):
+            return series
+        # A window or last_n selects from the whole stored history; otherwise compact keeps the latest bars
+        if arguments.get("outputsize") != "full" and not (projection and projection.selects_bars):
+            series = series.slice(-COMPACT_BARS)
+        return to_legacy(projection.apply(series) if projection else series)
+
+    params = endpoint.query(arguments)
+    datatype = params.get("datatype", endpoint.datatype)
+    data = fetch(params, datatype, cache_ttl(endpoint, arguments), max_wait, priority or endpoint.priority, client,
+                 endpoint.stale_grace)
+    if "error" in data:
+        return data
+    if datatype == "csv":
+        if "rows" not in data:
+            return {"error": upstream_error(data) or "Invalid data returned or no data available"}
+        if endpoint.filterable:
+            return csv_stream.select(data, endpoint.function, arguments.get("symbol"), arguments.get("start"),
+                                     arguments.get("end"))
+        return data
+
+    # The caches keep time series as columnar Series; callers get the upstream shape
+    key = endpoint.payload(arguments)
+    if key is None:
+        return to_legacy(data) if data else {"error": "Failed to fetch data"}
+    if key in data:
+        return to_legacy(projection.apply(data[key]) if projection else data[key])
+    return {"error": upstream_error(data) or "Invalid data returned or no data available"}
+
+def series_error(data: dict) -> dict:
+    """
+    {"error": ...} for a response without the expected time series, a Refusal when upstream refused the query.
+    """
+    error = {"error": upstream_error(data) or "Invalid data returned or no data available"}
+    if ("Error Message" in data or "Information" in data) and not exhausted_quota(data):
+        return Refusal(error)
+    return error
+
+def stored_series(endpoint: Endpoint, arguments: dict, max_wait: Optional[float] = DEFAULT_MAX_WAIT,
+                  priority: str = NORMAL, client: str = "default"):
+    """
+    Merged full history of a time series endpoint as a Series (see series_store.py), or {"error": ...}.
+    The first call fetches outputsize=full, later refreshes only outputsize=compact.
+    """
+    query = {name: value for name, value in endpoint.query(arguments).items() if name != "outputsize"}
+    key = endpoint.payload(arguments)
+
+    def load(outputsize: str):
+        # Not cached on its own: the store keeps the merged history instead
+        data = fetch({**query, "outputsize": outputsize}, endpoint.datatype, 0, max_wait, priority, client)
+        if "error" in data:
+            return data
+        series = data.get(key)
+        if not isinstance(series, Series):
+            return series_error(data)
+        return series
+
+    return series_store.get(query, cache_ttl(endpoint, arguments), load, max_wait)
+
+def series_endpoint(interval: str) -> Optional[Endpoint]:
+    """
+    Registry time series that indicators at this interval are computed from.
+    """
+    if interval.endswith("min"):
+        return ENDPOINTS_BY_NAME["get_intraday"]
+    return ENDPOINTS_BY_NAME.get(f"get_{interval}_adjusted")
+
+def ohlcv_columns(series: Series) -> dict:
+    """
+    OHLCV columns of a Series plus its timestamps, as used by the indicator functions.
+    Adjusted series are rescaled so open/high/low/close are all split and dividend adjusted.
+    """
+    columns = {"timestamp": series.stamps()}
+    for column in ("open", "high", "low", "close", "volume"):
+        values = series.column(column)
+        if values is not None:
+            columns[column] = values
+    adjusted = series.column("adjusted close")
+    if adjusted is not None:
+        ratio = adjusted / columns["close"]
+        for column in ("open", "high", "low", "close"):
+            columns[column] = columns[column] * ratio
+    return columns
+
+def ohlcv_series(symbol: str, interval: str, max_wait: Optional[float] = DEFAULT_MAX_WAIT,
+                 priority: str = NORMAL, client: str = "default"):
+    """
+    Full time series of symbol at interval as a cached Series, or {"error": ...}.
+    Repeated calls return the same object until the series is refreshed.
+    """
+    endpoint = series_endpoint(interval)
+    if endpoint is None:
+        return {"error": f"Unsupported interval: {interval}"}
+    invalid = symbol_check.check(symbol)
+    if invalid:
+        return {"error": invalid}
+    arguments = {"symbol": symbol_check.normalize(symbol), "interval": interval}
+    if endpoint.history:
+        return stored_series(endpoint, arguments, max_wait, priority, client)
+    params = {**endpoint.query(arguments), "outputsize": "full"}
+    data = fetch(params, endpoint.datatype, cache_ttl(endpoint, arguments), max_wait, priority, client)
+    if "error" in data:
+        return data
+    series = data.get(endpoint.payload(arguments))
+    if not isinstance(series, Series):
+        return series_error(data)
+    return series
+
+def price_series(symbol: str, interval: str, max_wait: Optional[float] = DEFAULT_MAX_WAIT,
+                 priority: str = NORMAL, client: str = "default") -> dict:
+    """
+    Full OHLCV history of symbol at interval (see ohlcv_columns), or {"error": ...}.
+    """
+    series = ohlcv_series(symbol, interval, max_wait, priority, client)
+    if isinstance(series, dict):
+        return series
+    return ohlcv_columns(series)
+
+def indicator_payload(timestamps: list, outputs: dict, projection: Optional[Projection] = None) -> dict:
+    """
+    Format indicator columns like Alpha Vantage: newest first, 4 decimals, warm-up bars left out.
+    Only the bars and outputs selected by projection are formatted.
+    """
+    names = [name for name in outputs if projection is None or projection.keeps(name)]
+    if not names:
+        return {}
+    matrix = np.column_stack([outputs[name] for name in names])
+    valid = np.flatnonzero(~np.isnan(matrix).any(axis=1)).tolist()
+    if projection is not None:
+        lo, hi = projection.window(valid, key=lambda index: timestamps[index])
+        valid = valid[lo:hi]
+    payload = {}
+    for index in reversed(valid):
+        # Intraday indicator timestamps carry no seconds ("2024-01-02 19:55")
+        payload[timestamps[index][:16]] = {name: f"{value:.4f}" for name, value in zip(names, matrix[index].tolist())}
+    return payload
+
+def streaming_indicator(endpoint: Endpoint, arguments: dict, series: Series,
+                        projection: Optional[Projection] = None) -> dict:
+    """
+    Bring the kept incremental state of this indicator up to date with series and return its payload.
+    Only bars newer than the last one consumed are processed; if that bar was revised upstream
+    (a split or dividend re-adjusts the history) the state is rebuilt from scratch.
+    """
+    state = indicator_states.get(endpoint.function, make_key(endpoint.query(arguments)), arguments)
+    with state.lock:
+        if state.source is not series:
+            start = 0
+            if state.last_stamp is not None:
+                index = series.index(state.last_stamp)
+                if index >= 0 and series.values[index].tolist() == state.last_bar:
+                    start = index + 1
+                else:
+                    state.reset()
+            new = series.slice(start)
+            if len(new):
+                columns = ohlcv_columns(new)
+                names = [name for name in columns if name != "timestamp"]
+                for stamp, values in zip(columns["timestamp"], zip(*(columns[name].tolist() for name in names))):
+                    outputs = state.indicator.update(dict(zip(names, values)))
+                    if outputs is not None:
+                        state.rows.append((stamp[:16], {name: f"{value:.4f}" for name, value in outputs.items()}))
+                state.bars += len(new)
+                state.last_stamp = columns["timestamp"][-1]
+                state.last_bar = series.values[-1].tolist()
+                state.payload = None
+            state.source = series
+        if projection is None:
+            # The whole history, rendered once per update and shared by later calls
+            if state.payload is None:
+                state.payload = dict(reversed(state.rows))
+            return state.payload
+        lo, hi = projection.window(state.rows, key=lambda row: row[0])
+        return {stamp: projection.values(values) for stamp, values in reversed(state.rows[lo:hi])}
+
+def local_indicator(endpoint: Endpoint, arguments: dict, max_wait: Optional[float], priority: str,
+                    client: str, projection: Optional[Projection] = None) -> Optional[dict]:
+    """
+    Compute an indicator from the (cached) price series, so one upstream call serves every
+    indicator of a symbol and interval. None when it has to be fetched from upstream instead,
+    including when upstream refuses the price series (premium-only, or a symbol such as a currency pair).
+    """
+    interval = arguments.get("interval") or "daily"
+    if series_endpoint(interval) is None or not indicators.computes(endpoint.function, arguments):
+        return None
+    if symbol_check.unlisted(arguments["symbol"]) is not None:
+        return None  # likely not a stock (e.g. a currency pair): no price series, ask the indicator endpoint
+    series = ohlcv_series(arguments["symbol"], interval, max_wait, priority, client)
+    if isinstance(series, dict):
+        return None if isinstance(series, Refusal) else series
+    if endpoint.function in INCREMENTAL:
+        return streaming_indicator(endpoint, arguments, series, projection)
+    columns = ohlcv_columns(series)
+    outputs = indicators.compute(endpoint.function, columns, arguments)
+    if outputs is None:
+        return None
+    return indicator_payload(columns["timestamp"], outputs, projection)
+
+def make_fetcher(endpoint: Endpoint):
+    """
+    Build the plain Python fetcher (e.g. get_sma_values) for a registry endpoint.
+    Python callers may pass max_wait_ms to fail fast instead of queueing for the rate limiter,
+    and priority/client to schedule the call (e.g. priority="background" for bulk jobs).
+    """
+    signature = endpoint.signature()
+
+    def fetcher(*args, max_wait_ms: Optional[float] = None, priority: Optional[str] = None,
+                client: str = "default", **kwargs) -> dict:
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        max_wait = max_wait_ms / 1000 if max_wait_ms is not None else DEFAULT_MAX_WAIT
+        return call_endpoint(endpoint, bound.arguments, max_wait, priority, client)
+
+    fetcher.__name__ = fetcher.__qualname__ = endpoint.name
+    fetcher.__doc__ = endpoint.description
+    fetcher.__signature__ = signature
+    return fetcher
+
+# get_intraday, get_sma_values, get_fx_daily_data, ... one fetcher per registry entry
+for _endpoint in ENDPOINTS:
+    globals()[_endpoint.name] = make_fetcher(_endpoint)
+
+MAX_BUNDLE = 20  # indicator specs per get_indicator_bundle call
+
+def bundle_label(function: str, params: dict) -> str:
+    """
+    Default column name of a bundle spec: the function followed by its explicit parameter values (e.g. SMA_20).
+    """
+    return "_".join([function] + [str(value) for value in params.values()])
+
+def get_indicator_bundle(symbol: str, specs: list, interval: str = "daily", start: Optional[str] = None,
+                         end: Optional[str] = None, last_n: Optional[int] = None, max_wait_ms: Optional[float] = None,
+                         priority: str = NORMAL, client: str = "default") -> dict:
+    """
+    Several technical indicators of one symbol and interval in one call, aligned on a shared
+    timestamp index (newest first). Each spec is a function name ("RSI") or a dict such as
+    {"function": "SMA", "time_period": 20, "name": "sma20"}; unset parameters keep the defaults
+    of the matching get_<function>_values fetcher. Locally computed indicators all share the
+    single fetched price series, so the bundle usually costs one upstream call.
+    start, end and last_n project every indicator (a spec may override them).
+    """
+    if len(specs) > MAX_BUNDLE:
+        return {"error": f"At most {MAX_BUNDLE} indicators per bundle"}
+    max_wait = max_wait_ms / 1000 if max_wait_ms is not None else DEFAULT_MAX_WAIT
+    window = {name: value for name, value in (("start", start), ("end", end), ("last_n", last_n)) if value is not None}
+    columns, errors = {}, {}
+    for spec in specs:
+        params = {"function": spec} if isinstance(spec, str) else dict(spec)
+        function = str(params.pop("function", "")).upper()
+        label = str(params.pop("name", None) or bundle_label(function, params))
+        endpoint = INDICATORS.get(function)
+        if endpoint is None:
+            errors[label] = f"Unknown indicator function: {function or '(missing)'}"
+            continue
+        if label in columns or label in errors:
+            errors[label] = "Duplicate indicator name"
+            continue
+        try:
+            bound = endpoint.signature().bind(symbol=symbol, interval=interval, **{**window, **params})
+        except TypeError as e:
+            errors[label] = f"Invalid parameters for {function}: {e}"
+            continue
+        bound.apply_defaults()
+        data = call_endpoint(endpoint, bound.arguments, max_wait, priority, client)
+        if "error" in data:
+            errors[label] = data["error"]
         else:
-            return {"error": "Invalid data returned"}
-    else:
-        return {"error": "Failed to fetch data"}
-    
-def get_digital_currency_weekly_data(symbol: str, market: str) -> dict:
-    """
-    Fetch weekly historical time series for a digital currency (e.g., BTC)
-    traded on a specific market (e.g., EUR/Euro), refreshed daily at midnight (UTC).
-    """
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "DIGITAL_CURRENCY_WEEKLY",
+            columns[label] = data
+
+    stamps = sorted(set().union(*columns.values()), reverse=True)
+    result = {
+        "symbol": symbol,
+        "interval": interval,
+        "indicators": list(columns),
+        "data": {stamp: {label: column.get(stamp) for label, column in columns.items()} for stamp in stamps},
+    }
+    if errors:
+        result["errors"] = errors
+    return result
+
+def get_indicator_sweep(symbol: str, function: str, grid: dict, interval: str = "daily", params: Optional[dict] = None,
+                        start: Optional[str] = None, end: Optional[str] = None, last_n: Optional[int] = None,
+                        max_wait_ms: Optional[float] = None, priority: str = NORMAL, client: str = "default") -> dict:
+    """
+    Compute one indicator over the cartesian product of parameter values in grid (e.g.
+    {"time_period": [5, 10, 20, 50]} or {"fastperiod": [8, 12], "slowperiod": [21, 26]}) from a
+    single fetched price series. params fixes other arguments (e.g. series_type, signalperiod).
+    Returns a compact matrix: one column per combination and output, one row per timestamp
+    (newest first), null during warm-up. start, end and last_n select the rows returned.
+    """
+    function = function.upper()
+    endpoint = INDICATORS.get(function)
+    if endpoint is None:
+        return {"error": f"Unknown indicator function: {function}"}
+    names = list(grid)
+    choices = [value if isinstance(value, (list, tuple)) else [value] for value in grid.values()]
+    if not names or any(not values for values in choices):
+        return {"error": "grid needs at least one value per parameter"}
+    if np.prod([len(values) for values in choices]) > MAX_COMBINATIONS:
+        return {"error": f"At most {MAX_COMBINATIONS} parameter combinations per sweep"}
+    combinations = []
+    for values in itertools.product(*choices):
+        try:
+            bound = endpoint.signature().bind(symbol=symbol, interval=interval, **(params or {}), **dict(zip(names, values)))
+        except TypeError as e:
+            return {"error": f"Invalid parameters for {function}: {e}"}
+        bound.apply_defaults()
+        combinations.append(bound.arguments)
+
+    # Checked before fetching the series, which would spend quota for nothing
+    if not sweepable(function, combinations):
+        return {"error": f"{function} cannot be swept locally"}
+    max_wait = max_wait_ms / 1000 if max_wait_ms is not None else DEFAULT_MAX_WAIT
+    series = price_series(symbol, interval, max_wait, priority, client)
+    if "error" in series:
+        return series
+    outputs = sweep(function, series, combinations)
+    if outputs is None:
+        return {"error": f"{function} cannot be swept locally"}
+
+    columns = [{**{name: arguments[name] for name in names}, "output": output}
+               for arguments in combinations for output in outputs]
+    # Interleave so each combination's outputs sit next to each other, like columns
+    matrix = np.stack(list(outputs.values()), axis=2).reshape(len(series["timestamp"]), len(columns))
+    keep = np.flatnonzero(~np.isnan(matrix).all(axis=1))
+    lo, hi = Projection(start, end, last_n).window(keep, key=lambda index: series["timestamp"][index])
+    keep = keep[lo:hi][::-1]
+    values = np.round(matrix[keep], 4)
+    return {
         "symbol": symbol,
-        "market": market,
-        "apikey": api_key
-    }
-    response = requests.get(url, params=params)
-
-    if response.status_code == 200:
-        data = response.json()
-        
-        # Check if the data contains the required information
-        if "Time Series (Digital Currency Weekly)" in data:
-            return data["Time Series (Digital Currency Weekly)"]
+        "interval": interval,
+        "function": function,
+        "columns": columns,
+        "timestamps": [series["timestamp"][index][:16] for index in keep.tolist()],
+        "values": [[None if value != value else value for value in row] for row in values.tolist()],
+    }
+
+MAX_QUOTES = 100  # symbols per get_quotes call
+
+# Shared by every get_quotes call; the rate limiter, not the pool, bounds upstream concurrency
+_quote_pool = ThreadPoolExecutor(max_workers=POOL_SIZE, thread_name_prefix="alpha-vantage-quotes")
+
+def get_quotes(symbols: list, max_wait_ms: Optional[float] = None, priority: str = NORMAL,
+               client: str = "default") -> dict:
+    """
+    Global quotes of several symbols in one call. Quotes still in the memory cache are answered
+    right away; the others are fetched concurrently, queueing for the rate limiter like any other
+    call. Every symbol gets a status ("cached", "fetched" or "error"), so a symbol whose quote is
+    unknown or would wait longer than max_wait_ms does not fail the whole batch.
+    """
+    symbols = list(dict.fromkeys(str(symbol).strip() for symbol in symbols if str(symbol).strip()))
+    if len(symbols) > MAX_QUOTES:
+        return {"error": f"At most {MAX_QUOTES} symbols per call"}
+    endpoint = ENDPOINTS_BY_NAME["get_quote"]
+    max_wait = max_wait_ms / 1000 if max_wait_ms is not None else DEFAULT_MAX_WAIT
+
+    def quote(symbol: str) -> dict:
+        try:
+            return call_endpoint(endpoint, {"symbol": symbol}, max_wait, priority, client)
+        except Exception as e:
+            return {"error": str(e)}
+
+    # Keyed like call_endpoint, which queries the listed spelling (ibm -> IBM, brk.b -> BRK-B)
+    cached = {symbol for symbol in symbols
+              if response_cache.peek(make_key(endpoint.query({"symbol": symbol_check.normalize(symbol)}))) is not MISSING}
+    results = {symbol: quote(symbol) for symbol in symbols if symbol in cached}
+    pending = [symbol for symbol in symbols if symbol not in cached]
+    results.update(zip(pending, _quote_pool.map(quote, pending)))
+
+    quotes = {}
+    for symbol in symbols:
+        data = results[symbol]
+        if "error" in data:
+            quotes[symbol] = {"status": "error", "error": data["error"]}
+        elif not data:
+            # Unknown symbols come back as an empty "Global Quote"
+            quotes[symbol] = {"status": "error", "error": f"No quote for {symbol}"}
         else:
-            return {"error": "Invalid data returned"}
-    else:
-        return {"error": "Failed to fetch data"}
-    
-def get_digital_currency_monthly_data(symbol: str, market: str) -> dict:
-    """
-    Fetch monthly historical time series for a digital currency (e.g., BTC)
-    traded on a specific market (e.g., EUR/Euro), refreshed daily at midnight (UTC).
-    """
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "DIGITAL_CURRENCY_MONTHLY",
-        "symbol": symbol,
-        "market": market,
-        "apikey": api_key
-    }
-    response = requests.get(url, params=params)
+            quotes[symbol] = {"status": "cached" if symbol in cached else "fetched", "quote": data}
+    failed = sum(entry["status"] == "error" for entry in quotes.values())
+    return {"quotes": quotes, "ok": len(quotes) - failed, "failed": failed}
 
-    if response.status_code == 200:
-        data = response.json()
-        
-        # Check if the data contains the required information
-        if "Time Series (Digital Currency Monthly)" in data:
-            return data["Time Series (Digital Currency Monthly)"]
-        else:
-            return {"error": "Invalid data returned"}
-    else:
-        return {"error": "Failed to fetch data"}
-    
-def get_crude_oil_wti_data(interval: Optional[str]) -> dict:
-    """
-    Fetch the West Texas Intermediate (WTI) crude oil prices in daily, weekly, and monthly horizons.
-    """
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "WTI",
-        "interval": interval,
-        "apikey": api_key
-    }
-    response = requests.get(url, params=params)
-    
-    if response.status_code == 200:
-        data = response.json()
-        
-    if data:
-        return data
-    else:
-        return {"error": "Failed to fetch data"}
-    
-def get_crude_oil_brent_data(interval: Optional[str]) -> dict:
+def search_symbol(query: str, limit: int = 10, max_wait_ms: Optional[float] = None, priority: str = INTERACTIVE,
+                  client: str = "default") -> dict:
     """
-    Fetch the Brent crude oil prices in daily, weekly, and monthly horizons.
+    Search listed US stocks and ETFs by symbol or company name in the local LISTING_STATUS index.
+    The listing is fetched at most once a day; searches are answered from memory.
     """
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "BRENT",
-        "interval": interval,
-        "apikey": api_key
-    }
-    response = requests.get(url, params=params)
-    
-    if response.status_code == 200:
-        data = response.json()
-        
-    if data:
+    max_wait = max_wait_ms / 1000 if max_wait_ms is not None else DEFAULT_MAX_WAIT
+    data = call_endpoint(ENDPOINTS_BY_NAME["get_listing_delisting_status"], {}, max_wait, priority, client)
+    if "error" in data:
         return data
-    else:
-        return {"error": "Failed to fetch data"}
-    
-def get_natural_gas_data(interval: Optional[str]) -> dict:
-    """
-    Fetch the natural Henry Hub gas prices in daily, weekly, and monthly horizons.
-    """
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "NATURAL_GAS",
-        "interval": interval,
-        "apikey": api_key
-    }
-    response = requests.get(url, params=params)
-    
-    if response.status_code == 200:
-        data = response.json()
+    index = symbol_check.index(data)
+    if index is None:
+        return {"error": "Listing not available"}
+    return {"query": query, "matches": index.search(query, max(1, min(limit, 100)))}
 
-    if data:
-        return data
-    else:
-        return {"error": "Failed to fetch data"}
-    
-def get_copper_data(interval: Optional[str]) -> dict:
-    """
-    Fetch the copper prices in monthly, quarterly, and annual horizons.
-    """
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "COPPER",
-        "interval": interval,
-        "apikey": api_key
-    }
-    response = requests.get(url, params=params)
-    
-    if response.status_code == 200:
-        data = response.json()
-        
-    if data:
-        return data
-    else:
-        return {"error": "Failed to fetch data"}
-    
-def get_aluminum_data(interval: Optional[str]) -> dict:
-    """
-    Fetch the aluminum prices in monthly, quarterly, and annual horizons.
-    """
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "ALUMINUM",
-        "interval": interval,
-        "apikey": api_key
-    }
-    response = requests.get(url, params=params)
-    
-    if response.status_code == 200:
-        data = response.json()
-        
-    if data:
-        return data
-    else:
-        return {"error": "Failed to fetch data"}
-    
-def get_wheat_data(interval: Optional[str]) -> dict:
-    """
-    Fetch the wheat prices in monthly, quarterly, and annual horizons.
-    """
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "WHEAT",
-        "interval": interval,
-        "apikey": api_key
-    }
-    response = requests.get(url, params=params)
-    
-    if response.status_code == 200:
-        data = response.json()
-        
-    if data:
-        return data
-    else:
-        return {"error": "Failed to fetch data"}
-    
-def get_corn_data(interval: Optional[str]) -> dict:
-    """
-    Fetch the corn prices in monthly, quarterly, and annual horizons.
-    """
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "CORN",
-        "interval": interval,
-        "apikey": api_key
-    }
-    response = requests.get(url, params=params)
-    
-    if response.status_code == 200:
-        data = response.json()
-        
-    if data:
-        return data
-    else:
-        return {"error": "Failed to fetch data"}
-    
-def get_cotton_data(interval: Optional[str]) -> dict:
-    """
-    Fetch the cotton prices in monthly, quarterly, and annual horizons.
-    """
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "COTTON",
-        "interval": interval,
-        "apikey": api_key
-    }
-    response = requests.get(url, params=params)
-    
-    if response.status_code == 200:
-        data = response.json()
-        
-    if data:
-        return data
-    else:
-        return {"error": "Failed to fetch data"}
-    
-def get_sugar_data(interval: Optional[str]) -> dict:
-    """
-    Fetch the sugar prices in monthly, quarterly, and annual horizons.
-    """
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "SUGAR",
-        "interval": interval,
-        "apikey": api_key
-    }
-    response = requests.get(url, params=params)
-    
-    if response.status_code == 200:
-        data = response.json()
-        
-    if data:
-        return data
-    else:
-        return {"error": "Failed to fetch data"}
-    
-def get_coffee_data(interval: Optional[str]) -> dict: 
+EARNINGS_DAYS = 7  # default window of get_earnings: the coming week
+
+def get_earnings(start: Optional[str] = None, end: Optional[str] = None, symbol: Optional[str] = None,
+                 max_wait_ms: Optional[float] = None, priority: str = INTERACTIVE, client: str = "default") -> dict:
     """
-    Fetch the coffee prices in monthly, quarterly, and annual horizons.
+    Earnings reports dated start to end (inclusive dates, by default today and the next 7 days), optionally
+    for one symbol, by date. Answered from a local index of the EARNINGS_CALENDAR table, fetched at most
+    once a day per horizon (3, 6 or 12 months ahead, the shortest that reaches end).
     """
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "COFFEE",
-        "interval": interval,
-        "apikey": api_key
-    }
-    response = requests.get(url, params=params)
-    
-    if response.status_code == 200:
-        data = response.json()
-        
-    if data:
-        return data
-    else:
-        return {"error": "Failed to fetch data"}
-    
-def get_all_commodities_data(interval: Optional[str]) -> dict:
-    """
-    Fetch the global price index of all commodities in monthly, quarterly, and annual temporal dimensions.
-    """
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "ALL_COMMODITIES",
-        "interval": interval,
-        "apikey": api_key
-    }
-    response = requests.get(url, params=params)
-    
-    if response.status_code == 200:
-        data = response.json()
-        
-    if data:
-        return data
-    else:
-        return {"error": "Failed to fetch data"}
-    
-def get_real_gdp(interval: Optional[str]) -> dict:
-    """
-    Fetch the Real GDP of the US data in quarterly and annual temporal dimensions.
-    """
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "REAL_GDP",
-        "interval": interval,
-        "apikey": api_key
-    }
-    response = requests.get(url, params=params)
-    
-    if response.status_code == 200:
-        data = response.json()
-        
-    if data:
-        return data
-    else:
-        return {"error": "Failed to fetch data"}
-    
-def get_real_gdp_per_capita() -> dict:
-    """
-    Fetch the quarterly Real GDP per Capita data of the United States..
-    """
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "REAL_GDP_PER_CAPITA",
-        "apikey": api_key
-    }
-    response = requests.get(url, params=params)
-    
-    if response.status_code == 200:
-        data = response.json()
-        
-    if data:
-        return data
-    else:
-        return {"error": "Failed to fetch data"}
-    
-def get_treasury_yield(interval: Optional[str], maturity: Optional[str]) -> dict:
-    """
-    Fetch the daily, weekly, and monthly US treasury yield of a given maturity timeline (e.g., 5 year, 30 year, etc).
-    """
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "TREASURY_YIELD",
-        "interval": interval,
-        "maturity": maturity,
-        "apikey": api_key
-    }
-    response = requests.get(url, params=params)
-    
-    if response.status_code == 200:
-        data = response.json()
-        
-    if data:
-        return data
-    else:
-        return {"error": "Failed to fetch data"}
-    
-def get_federal_funds_rate(interval: Optional[str]) -> dict:
-    """
-    Fetch the daily, weekly, and monthly federal funds rate (interest rate) of the US.
-    """
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "FEDERAL_FUNDS_RATE",
-        "interval": interval,
-        "apikey": api_key
-    }
-    response = requests.get(url, params=params)
-    
-    if response.status_code == 200:
-        data = response.json()
-        
-    if data:
-        return data
-    else:
-        return {"error": "Failed to fetch data"}
-    
-def get_cpi_data(interval: Optional[str]) -> dict:
-    """
-    Fetch the monthly and semiannual consumer price index (CPI) of the US.
-    """
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "CPI",
-        "interval": interval,
-        "apikey": api_key
-    }
-    response = requests.get(url, params=params)
-    
-    if response.status_code == 200:
-        data = response.json()
-        
-    if data:
-        return data
-    else:
-        return {"error": "Failed to fetch data"}
-    
-def get_inflation() -> dict:
-    """
-    Fetch the annual inflation rates (consumer prices) of the US.
-    """
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "INFLATION",
-        "apikey": api_key
-    }
-    response = requests.get(url, params=params)
-    
-    if response.status_code == 200:
-        data = response.json()
-        
-    if data:
-        return data
-    else:
-        return {"error": "Failed to fetch data"}
-    
-def get_retail_sales() -> dict:
-    """
-    Fetch the monthly Advance Retail Sales: Retail Trade data of the US.
-    """
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "RETAIL_SALES",
-        "apikey": api_key
-    }
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-    
-    if data:
-        return data
-    else:
-        return {"error": "Failed to fetch data"}
-    
-def get_durables() -> dict:
-    """
-    Fetch the monthly manufacturers' new orders of durable goods in the US.
-    """
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "DURABLES",
-        "apikey": api_key
-    }
-    response = requests.get(url, params=params)
-    
-    if response.status_code == 200:
-        data = response.json()
-        
-    if data:
-        return data
-    else:
-        return {"error": "Failed to fetch data"}
-    
-def get_monthly_unemployment() -> dict:
-    """
-    Fetch the monthly unemployment rate of the US.
-    """
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "UNEMPLOYMENT",
-        "apikey": api_key
-    }
-    response = requests.get(url, params=params)
-    
-    if response.status_code == 200:
-        data = response.json()
-        
-    if data:
-        return data
-    else:
-        return {"error": "Failed to fetch data"}
-    
-def get_nonfarm_payroll() -> dict:
-    """
-    Fetch the monthly US All Employees: Total Nonfarm (commonly known as Total Nonfarm Payroll), 
-    a measure of the number of U.S. workers in the economy that excludes proprietors, private household employees,
-    unpaid volunteers, farm employees, and the unincorporated self-employed.
-    """
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "NONFARM_PAYROLL",
-        "apikey": api_key
-    }
-    response = requests.get(url, params=params)
-    
-    if response.status_code == 200:
-        data = response.json()
-        
-    if data:
-        return data
-    else:
-        return {"error": "Failed to fetch data"}
-    
-
-        return {"error": "Failed to fetch data"}
-
-def get_sma_values(symbol: str, interval: str = "daily", time_period: int = 60, series_type: str = "close") -> dict:
-    """
-    Fetch Simple Moving Average (SMA) values for a given symbol.
-    """
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    if not api_key:
-        return "Error: ALPHA_VANTAGE_API_KEY not configured"
-    
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "SMA",
-        "symbol": symbol,
-        "interval": interval,
-        "time_period": time_period,
-        "series_type": series_type,
-        "apikey": api_key
-    }
-
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        if "Technical Analysis: SMA" in data:
-            return data["Technical Analysis: SMA"]
-        return {"error": "Missing SMA data"}
-    return {"error": "Failed to fetch data"}
-
-def get_ema_values(symbol: str, interval: str = "daily", time_period: int = 60, series_type: str = "close") -> dict:
-    """
-    Fetch Exponential Moving Average (EMA) values for a given symbol.
-    """
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    if not api_key:
-        return "Error: ALPHA_VANTAGE_API_KEY not configured"
-    
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "EMA",
-        "symbol": symbol,
-        "interval": interval,
-        "time_period": time_period,
-        "series_type": series_type,
-        "apikey": api_key
-    }
-
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        if "Technical Analysis: EMA" in data:
-            return data["Technical Analysis: EMA"]
-        return {"error": "Missing EMA data"}
-    return {"error": "Failed to fetch data"}
-
-def get_wma_values(symbol: str, interval: str = "daily", time_period: int = 60, series_type: str = "close") -> dict:
-    """
-    Fetch Weighted Moving Average (WMA) values for a given symbol.
-    """
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    if not api_key:
-        return "Error: ALPHA_VANTAGE_API_KEY not configured"
-    
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "WMA",
-        "symbol": symbol,
-        "interval": interval,
-        "time_period": time_period,
-        "series_type": series_type,
-        "apikey": api_key
-    }
-
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        if "Technical Analysis: WMA" in data:
-            return data["Technical Analysis: WMA"]
-        return {"error": "Missing WMA data"}
-    return {"error": "Failed to fetch data"}
-
-def get_dema_values(symbol: str, interval: str = "daily", time_period: int = 60, series_type: str = "close") -> dict:
-    """
-    Fetch Double Exponential Moving Average (DEMA) values for a given symbol.
-    """
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    if not api_key:
-        return "Error: ALPHA_VANTAGE_API_KEY not configured"
-    
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "DEMA",
-        "symbol": symbol,
-        "interval": interval,
-        "time_period": time_period,
-        "series_type": series_type,
-        "apikey": api_key
-    }
-
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        if "Technical Analysis: DEMA" in data:
-            return data["Technical Analysis: DEMA"]
-        return {"error": "Missing DEMA data"}
-    return {"error": "Failed to fetch data"}
-
-def get_tema_values(symbol: str, interval: str = "daily", time_period: int = 60, series_type: str = "close") -> dict:
-    """
-    Fetch Triple Exponential Moving Average (TEMA) values for a given symbol.
-    """
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    if not api_key:
-        return "Error: ALPHA_VANTAGE_API_KEY not configured"
-    
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "TEMA",
-        "symbol": symbol,
-        "interval": interval,
-        "time_period": time_period,
-        "series_type": series_type,
-        "apikey": api_key
-    }
-
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        if "Technical Analysis: TEMA" in data:
-            return data["Technical Analysis: TEMA"]
-        return {"error": "Missing TEMA data"}
-    return {"error": "Failed to fetch data"}
-
-def get_trima_values(symbol: str, interval: str = "daily", time_period: int = 60, series_type: str = "close") -> dict:
-    """
-    Fetch Triangular Moving Average (TRIMA) values for a given symbol.
-    """
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    if not api_key:
-        return "Error: ALPHA_VANTAGE_API_KEY not configured"
-    
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "TRIMA",
-        "symbol": symbol,
-        "interval": interval,
-        "time_period": time_period,
-        "series_type": series_type,
-        "apikey": api_key
-    }
-
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        if "Technical Analysis: TRIMA" in data:
-            return data["Technical Analysis: TRIMA"]
-        return {"error": "Missing TRIMA data"}
-    return {"error": "Failed to fetch data"}
-
-def get_kama_values(symbol: str, interval: str = "daily", time_period: int = 60, series_type: str = "close") -> dict:
-    """
-    Fetch Kaufman Adaptive Moving Average (KAMA) values for a given symbol.
-    """
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    if not api_key:
-        return "Error: ALPHA_VANTAGE_API_KEY not configured"
-    
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "KAMA",
-        "symbol": symbol,
-        "interval": interval,
-        "time_period": time_period,
-        "series_type": series_type,
-        "apikey": api_key
-    }
-
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        if "Technical Analysis: KAMA" in data:
-            return data["Technical Analysis: KAMA"]
-        return {"error": "Missing KAMA data"}
-    return {"error": "Failed to fetch data"}
-
-def get_mama_values(symbol: str, interval: str = "daily", time_period: int = 60, series_type: str = "close") -> dict:
-    """
-    Fetch MESA Adaptive Moving Average (MAMA) values for a given symbol.
-    """
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    if not api_key:
-        return "Error: ALPHA_VANTAGE_API_KEY not configured"
-    
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "MAMA",
-        "symbol": symbol,
-        "interval": interval,
-        "time_period": time_period,
-        "series_type": series_type,
-        "apikey": api_key
-    }
-
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        if "Technical Analysis: MAMA" in data:
-            return data["Technical Analysis: MAMA"]
-        return {"error": "Missing MAMA data"}
-    return {"error": "Failed to fetch data"}
-
-def get_vwap_values(symbol: str, interval: str = "15min") -> dict:
-    """
-    Fetch Volume Weighted Average Price (VWAP) values for a given symbol.
-    """
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    if not api_key:
-        return "Error: ALPHA_VANTAGE_API_KEY not configured"
-    
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "VWAP",
-        "symbol": symbol,
-        "interval": interval,
-        "apikey": api_key
-    }
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        if "Technical Analysis: VWAP" in data:
-            return data["Technical Analysis: VWAP"]
-        return {"error": "Missing VWAP data"}
-    return {"error": "Failed to fetch data"}
-
-def get_tthree_values(symbol: str, interval: str = "daily", time_period: int = 60, series_type: str = "close") -> dict:
-    """
-    Fetch Triple Exponential Moving Average (T3) values for a given symbol.
-    """
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    if not api_key:
-        return "Error: ALPHA_VANTAGE_API_KEY not configured"
-    
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "T3",
-        "symbol": symbol,
-        "interval": interval,
-        "time_period": time_period,
-        "series_type": series_type,
-        "apikey": api_key
-    }
-
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        if "Technical Analysis: T3" in data:
-            return data["Technical Analysis: T3"]
-        return {"error": "Missing T3 data"}
-    return {"error": "Failed to fetch data"}
-
-def get_macd_values(symbol: str, interval: str = "daily", series_type: str = "open", fastperiod: int = 12,
-                    slowperiod: int = 26, signalperiod: int = 9) -> dict:
-    """
-    Fetch Moving Average Convergence Divergence (MACD) values for a given symbol.
-    """
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    if not api_key:
-        return "Error: ALPHA_VANTAGE_API_KEY not configured"
-    
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "MACD",
-        "symbol": symbol,
-        "interval": interval,
-        "series_type": series_type,
-        "fastperiod": fastperiod,
-        "slowperiod": slowperiod,
-        "signalperiod": signalperiod,
-        "apikey": api_key
-    }
-
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        if "Technical Analysis: MACD" in data:
-            return data["Technical Analysis: MACD"]
-        return {"error": "Missing MACD data"}
-    return {"error": "Failed to fetch data"}
-
-def get_macdext_values(symbol: str, interval: str = "daily", series_type: str = "open", fastperiod: int = 12,
-                       slowperiod: int = 26, signalperiod: int = 9) -> dict:
-    """
-    Fetch Moving Average Convergence Divergence (MACD) with controllable moving average type.
-    """
-
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    if not api_key:
-        return "Error: ALPHA_VANTAGE_API_KEY not configured"
-    
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "MACDEXT",
-        "symbol": symbol,
-        "interval": interval,
-        "series_type": series_type,
-        "fastperiod": fastperiod,
-        "slowperiod": slowperiod,
-        "signalperiod": signalperiod,
-        "apikey": api_key
-    }
-
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        if "Technical Analysis: MACDEXT" in data:
-            return data["Technical Analysis: MACDEXT"]
-        return {"error": "Missing MACDEXT data"}
-    return {"error": "Failed to fetch data"}
-
-def get_stoch_oscillator_values(symbol: str, interval: str = "daily", fastk_period: int = 14, slowk_period: int = 3,
-                                slowd_period: int = 3, series_type: str = "close") -> dict:
-    """
-    Fetch the Stochastic Oscillator (STOCH) data for a given stock symbol from Alpha Vantage.
-    """
-
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    if not api_key:
-        return "Error: ALPHA_VANTAGE_API_KEY not configured"
-
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "STOCH",
-        "symbol": symbol,
-        "interval": interval,
-        "fastk_period": fastk_period,
-        "slowk_period": slowk_period,
-        "slowd_period": slowd_period,
-        "series_type": series_type,
-        "apikey": api_key
-    }
-    response = requests.get(url, params=params)
-    
-    if response.status_code == 200:
-        data = response.json()
-        
-        # Check if the data contains the required information
-        if "Technical Analysis: STOCH" in data:
-            return data["Technical Analysis: STOCH"]
-        else:
-            return {"error": "Invalid data returned or no data available"}
-    else:
-        return {"error": "Failed to fetch data"}
-    
-def get_stochf_oscillator_values(symbol: str, interval: str = "daily", fastk_period: int = 5, fastdperiod: int = 3) -> dict:
-    """
-    Fetch the Stochastic Fast (STOCHF) data for a given stock symbol from Alpha Vantage.
-    """
-
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    if not api_key:
-        return "Error: ALPHA_VANTAGE_API_KEY not configured"
-    
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "STOCHF",
-        "symbol": symbol,
-        "interval": interval,
-        "fastk_period": fastk_period,
-        "fastd_period": fastdperiod,
-        "apikey": api_key
-    }
-    response = requests.get(url, params=params)
-    
-    if response.status_code == 200:
-        data = response.json()
-        
-        # Check if the data contains the required information
-        if "Technical Analysis: STOCHF" in data:
-            return data["Technical Analysis: STOCHF"]
-        else:
-            return {"error": "Invalid data returned or no data available"}
-    else:
-        return {"error": "Failed to fetch data"}
-    
-def get_rsi_values(symbol: str, interval: str = "daily", time_period: int = 60, series_type: str = "close") -> dict:
-    """
-    Fetch Relative Strength Index (RSI) values for a given symbol.
-    """
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    if not api_key:
-        return "Error: ALPHA_VANTAGE_API_KEY not configured"
-
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "STOCHF",
-        "symbol": symbol,
-        "interval": interval,
-        "time_period": time_period,
-        "series_type": series_type,
-        "apikey": api_key
-    }
-    response = requests.get(url, params=params)
-    
-    if response.status_code == 200:
-        data = response.json()
-        
-        # Check if the data contains the required information
-        if "Technical Analysis: RSI" in data:
-            return data["Technical Analysis: RSI"]
-        else:
-            return {"error": "Invalid data returned or no data available"}
-    else:
-        return {"error": "Failed to fetch data"}
-    
-def get_stochrsi_values(symbol: str, interval: str = "daily", time_period: int = 60, series_type: str = "close",
-                        fastkperiod: int = 5, fastdperiod: int = 3) -> dict:
-    """
-    Fetch Stochastic Relative Strength Index (STOCHRSI) values for a given symbol.
-    """
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    if not api_key:
-        return "Error: ALPHA_VANTAGE_API_KEY not configured"
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "STOCHRSI",
-        "symbol": symbol,
-        "interval": interval,
-        "time_period": time_period,
-        "series_type": series_type,
-        "fastkperiod": fastkperiod,
-        "fastdperiod": fastdperiod,
-        "apikey": api_key
-    }
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        
-        # Check if the data contains the required information
-        if "Technical Analysis: STOCHRSI" in data:
-            return data["Technical Analysis: STOCHRSI"]
-        else:
-            return {"error": "Invalid data returned or no data available"}
-    else:
-        return {"error": "Failed to fetch data"}
-    
-def get_willr_values(symbol: str, interval: str = "daily", time_period: int = 60) -> dict:
-    """
-    Fetch Williams %R (WILLR) values for a given symbol.
-    """
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    if not api_key:
-        return "Error: ALPHA_VANTAGE_API_KEY not configured"
-    
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "WILLR",
-        "symbol": symbol,
-        "interval": interval,
-        "time_period": time_period,
-        "apikey": api_key
-    }
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        
-        # Check if the data contains the required information
-        if "Technical Analysis: WILLR" in data:
-            return data["Technical Analysis: WILLR"]
-        else:
-            return {"error": "Invalid data returned or no data available"}
-    else:
-        return {"error": "Failed to fetch data"}
-    
-def get_adx_values(symbol: str, interval: str = "daily", time_period: int = 60, series_type: str = "close") -> dict:
-    """
-    Fetch Average Directional Movement Index (ADX) values for a given symbol.
-    """
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    if not api_key:
-        return "Error: ALPHA_VANTAGE_API_KEY not configured"
-    
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "ADX",
-        "symbol": symbol,
-        "interval": interval,
-        "time_period": time_period,
-        "series_type": series_type,
-        "apikey": api_key
-    }
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        
-        # Check if the data contains the required information
-        if "Technical Analysis: ADX" in data:
-            return data["Technical Analysis: ADX"]
-        else:
-            return {"error": "Invalid data returned or no data available"}
-        
-def get_adxr_values(symbol: str, interval: str = "daily", time_period: int = 60, series_type: str = "close") -> dict:
-    """
-    Fetch Average Directional Movement Rating Index (ADXR) values for a given symbol.
-    """
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    if not api_key:
-        return "Error: ALPHA_VANTAGE_API_KEY not configured"
-    
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "ADXR",
-        "symbol": symbol,
-        "interval": interval,
-        "time_period": time_period,
-        "series_type": series_type,
-        "apikey": api_key
-    }
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        
-        # Check if the data contains the required information
-        if "Technical Analysis: ADXR" in data:
-            return data["Technical Analysis: ADXR"]
-        else:
-            return {"error": "Invalid data returned or no data available"}
-        
-def get_apo_values(symbol: str, interval: str = "daily", series_type: str = "close", fastperiod: int = 12,
-                   slowperiod: int = 26) -> dict:
-    """
-    Fetch Absolute Price Oscillator (APO) values for a given symbol.
-    """
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    if not api_key:
-        return "Error: ALPHA_VANTAGE_API_KEY not configured"
-    
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "APO",
-        "symbol": symbol,
-        "interval": interval,
-        "series_type": series_type,
-        "fastperiod": fastperiod,
-        "slowperiod": slowperiod,
-        "apikey": api_key
-    }
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        
-        # Check if the data contains the required information
-        if "Technical Analysis: APO" in data:
-            return data["Technical Analysis: APO"]
-        else:
-            return {"error": "Invalid data returned or no data available"}
-    else:
-        return {"error": "Failed to fetch data"}
-    
-def get_ppo_values(symbol: str, interval: str = "daily", series_type: str = "close", fastperiod: int = 12,
-                   slowperiod: int = 26) -> dict:
-    """
-    Fetch Percentage Price Oscillator (PPO) values for a given symbol.
-    """
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    if not api_key:
-        return "Error: ALPHA_VANTAGE_API_KEY not configured"
-    
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "PPO",
-        "symbol": symbol,
-        "interval": interval,
-        "series_type": series_type,
-        "fastperiod": fastperiod,
-        "slowperiod": slowperiod,
-        "apikey": api_key
-    }
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        
-        # Check if the data contains the required information
-        if "Technical Analysis: PPO" in data:
-            return data["Technical Analysis: PPO"]
-        else:
-            return {"error": "Invalid data returned or no data available"}
-    else:
-        return {"error": "Failed to fetch data"}
-    
-def get_mom_values(symbol: str, interval: str = "daily", time_period: int = 60, series_type: str = "close") -> dict:
-    """
-    Fetch Momentum (MOM) values for a given symbol.
-    """
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    if not api_key:
-        return "Error: ALPHA_VANTAGE_API_KEY not configured"
-    
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "MOM",
-        "symbol": symbol,
-        "interval": interval,
-        "time_period": time_period,
-        "series_type": series_type,
-        "apikey": api_key
-    }
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        
-        # Check if the data contains the required information
-        if "Technical Analysis: MOM" in data:
-            return data["Technical Analysis: MOM"]
-        else:
-            return {"error": "Invalid data returned or no data available"}
-    else:
-        return {"error": "Failed to fetch data"}
-    
-def get_bop_values(symbol: str, interval: str = "daily") -> dict:
-    """
-    Fetch Balance of Power (BOP) values for a given symbol.
-    """
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    if not api_key:
-        return "Error: ALPHA_VANTAGE_API_KEY not configured"
-    
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "BOP",
-        "symbol": symbol,
-        "interval": interval,
-        "apikey": api_key
-    }
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        
-        # Check if the data contains the required information
-        if "Technical Analysis: BOP" in data:
-            return data["Technical Analysis: BOP"]
-        else:
-            return {"error": "Invalid data returned or no data available"}
-    else:
-        return {"error": "Failed to fetch data"}
-    
-def get_cci_values(symbol: str, interval: str = "daily", time_period: int = 60) -> dict:
-    """
-    Fetch Commodity Channel Index (CCI) values for a given symbol.
-    """
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    if not api_key:
-        return "Error: ALPHA_VANTAGE_API_KEY not configured"
-    
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "CCI",
-        "symbol": symbol,
-        "interval": interval,
-        "time_period": time_period,
-        "apikey": api_key
-    }
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        
-        # Check if the data contains the required information
-        if "Technical Analysis: CCI" in data:
-            return data["Technical Analysis: CCI"]
-        else:
-            return {"error": "Invalid data returned or no data available"}
-    else:
-        return {"error": "Failed to fetch data"}
-    
-def get_cmo_values(symbol: str, interval: str = "daily", time_period: int = 60, series_type: str = "close") -> dict:
-    """
-    Fetch Chande momentum oscillator (CMO) values for a given symbol.
-    """
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    if not api_key:
-        return "Error: ALPHA_VANTAGE_API_KEY not configured"
-    
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "CMO",
-        "symbol": symbol,
-        "interval": interval,
-        "time_period": time_period,
-        "series_type": series_type,
-        "apikey": api_key
-    }
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        
-        # Check if the data contains the required information
-        if "Technical Analysis: CMO" in data:
-            return data["Technical Analysis: CMO"]
-        else:
-            return {"error": "Invalid data returned or no data available"}
-    else:
-        return {"error": "Failed to fetch data"}
-    
-def get_roc_values(symbol: str, interval: str = "daily", time_period: int = 60, series_type: str = "close") -> dict:
-    """
-    Fetch rate of change (ROC) values for a given symbol.
-    """
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    if not api_key:
-        return "Error: ALPHA_VANTAGE_API_KEY not configured"
-    
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "ROC",
-        "symbol": symbol,
-        "interval": interval,
-        "time_period": time_period,
-        "series_type": series_type,
-        "apikey": api_key
-    }
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        
-        # Check if the data contains the required information
-        if "Technical Analysis: ROC" in data:
-            return data["Technical Analysis: ROC"]
-        else:
-            return {"error": "Invalid data returned or no data available"}
-    else:
-        return {"error": "Failed to fetch data"}
-    
-def get_rocr_values(symbol: str, interval: str = "daily", time_period: int = 60, series_type: str = "close") -> dict:
-    """
-    Fetch rate of change ratio (ROCR) values for a given symbol.
-    """
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    if not api_key:
-        return "Error: ALPHA_VANTAGE_API_KEY not configured"
-    
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "ROCR",
-        "symbol": symbol,
-        "interval": interval,
-        "time_period": time_period,
-        "series_type": series_type,
-        "apikey": api_key
-    }
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        
-        # Check if the data contains the required information
-        if "Technical Analysis: ROCR" in data:
-            return data["Technical Analysis: ROCR"]
-        else:
-            return {"error": "Invalid data returned or no data available"}
-    else:
-        return {"error": "Failed to fetch data"}
-
-def get_aroon_values(symbol: str, interval: str = "daily", time_period: int = 14) -> dict:
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    if not api_key:
-        return "Error: ALPHA_VANTAGE_API_KEY not configured"
-
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "AROON",
-        "symbol": symbol,
-        "interval": interval,
-        "time_period": time_period,
-        "apikey": api_key
-    }
-
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        if "Technical Analysis: AROON" in data:
-            return data["Technical Analysis: AROON"]
-        return {"error": "Invalid data returned or no data available"}
-    return {"error": "Failed to fetch data"}
-
-
-def get_aroonosc_values(symbol: str, interval: str = "daily", time_period: int = 14) -> dict:
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    if not api_key:
-        return "Error: ALPHA_VANTAGE_API_KEY not configured"
-
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "AROONOSC",
-        "symbol": symbol,
-        "interval": interval,
-        "time_period": time_period,
-        "apikey": api_key
-    }
-
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        if "Technical Analysis: AROONOSC" in data:
-            return data["Technical Analysis: AROONOSC"]
-        return {"error": "Invalid data returned or no data available"}
-    return {"error": "Failed to fetch data"}
-
-
-def get_mfi_values(symbol: str, interval: str = "daily", time_period: int = 14) -> dict:
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    if not api_key:
-        return "Error: ALPHA_VANTAGE_API_KEY not configured"
-
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "MFI",
-        "symbol": symbol,
-        "interval": interval,
-        "time_period": time_period,
-        "apikey": api_key
-    }
-
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        if "Technical Analysis: MFI" in data:
-            return data["Technical Analysis: MFI"]
-        return {"error": "Invalid data returned or no data available"}
-    return {"error": "Failed to fetch data"}
-
-
-def get_trix_values(symbol: str, interval: str = "daily", time_period: int = 15, series_type: str = "close") -> dict:
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    if not api_key:
-        return "Error: ALPHA_VANTAGE_API_KEY not configured"
-
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "TRIX",
-        "symbol": symbol,
-        "interval": interval,
-        "time_period": time_period,
-        "series_type": series_type,
-        "apikey": api_key
-    }
-
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        if "Technical Analysis: TRIX" in data:
-            return data["Technical Analysis: TRIX"]
-        return {"error": "Invalid data returned or no data available"}
-    return {"error": "Failed to fetch data"}
-
-
-def get_ultosc_values(symbol: str, interval: str = "daily", timeperiod1: int = 7, timeperiod2: int = 14, timeperiod3: int = 28) -> dict:
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    if not api_key:
-        return "Error: ALPHA_VANTAGE_API_KEY not configured"
-
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "ULTOSC",
-        "symbol": symbol,
-        "interval": interval,
-        "timeperiod1": timeperiod1,
-        "timeperiod2": timeperiod2,
-        "timeperiod3": timeperiod3,
-        "apikey": api_key
-    }
-
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        if "Technical Analysis: ULTOSC" in data:
-            return data["Technical Analysis: ULTOSC"]
-        return {"error": "Invalid data returned or no data available"}
-    return {"error": "Failed to fetch data"}
-
-
-def get_dx_values(symbol: str, interval: str = "daily", time_period: int = 14) -> dict:
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    if not api_key:
-        return "Error: ALPHA_VANTAGE_API_KEY not configured"
-
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "DX",
-        "symbol": symbol,
-        "interval": interval,
-        "time_period": time_period,
-        "apikey": api_key
-    }
-
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        if "Technical Analysis: DX" in data:
-            return data["Technical Analysis: DX"]
-        return {"error": "Invalid data returned or no data available"}
-    return {"error": "Failed to fetch data"}
-
-
-def get_minus_di_values(symbol: str, interval: str = "daily", time_period: int = 14) -> dict:
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    if not api_key:
-        return "Error: ALPHA_VANTAGE_API_KEY not configured"
-
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "MINUS_DI",
-        "symbol": symbol,
-        "interval": interval,
-        "time_period": time_period,
-        "apikey": api_key
-    }
-
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        if "Technical Analysis: MINUS_DI" in data:
-            return data["Technical Analysis: MINUS_DI"]
-        return {"error": "Invalid data returned or no data available"}
-    return {"error": "Failed to fetch data"}
-
-def get_plus_di_values(symbol: str, interval: str = "daily", time_period: int = 14) -> dict:
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    if not api_key:
-        return "Error: ALPHA_VANTAGE_API_KEY not configured"
-
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "PLUS_DI",
-        "symbol": symbol,
-        "interval": interval,
-        "time_period": time_period,
-        "apikey": api_key
-    }
-
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        if "Technical Analysis: PLUS_DI" in data:
-            return data["Technical Analysis: PLUS_DI"]
-        return {"error": "Invalid data returned or no data available"}
-    return {"error": "Failed to fetch data"}
-
-# MINUS_DM
-
-def get_minus_dm_values(symbol: str, interval: str = "daily", time_period: int = 14) -> dict:
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    if not api_key:
-        return "Error: ALPHA_VANTAGE_API_KEY not configured"
-
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "MINUS_DM",
-        "symbol": symbol,
-        "interval": interval,
-        "time_period": time_period,
-        "apikey": api_key
-    }
-
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        if "Technical Analysis: MINUS_DM" in data:
-            return data["Technical Analysis: MINUS_DM"]
-        return {"error": "Invalid data returned or no data available"}
-    return {"error": "Failed to fetch data"}
-
-# PLUS_DM
-
-def get_plus_dm_values(symbol: str, interval: str = "daily", time_period: int = 14) -> dict:
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    if not api_key:
-        return "Error: ALPHA_VANTAGE_API_KEY not configured"
-
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "PLUS_DM",
-        "symbol": symbol,
-        "interval": interval,
-        "time_period": time_period,
-        "apikey": api_key
-    }
-
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        if "Technical Analysis: PLUS_DM" in data:
-            return data["Technical Analysis: PLUS_DM"]
-        return {"error": "Invalid data returned or no data available"}
-    return {"error": "Failed to fetch data"}
-
-# BBANDS
-
-def get_bbands_values(symbol: str, interval: str = "daily", time_period: int = 20, series_type: str = "close") -> dict:
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    if not api_key:
-        return "Error: ALPHA_VANTAGE_API_KEY not configured"
-
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "BBANDS",
-        "symbol": symbol,
-        "interval": interval,
-        "time_period": time_period,
-        "series_type": series_type,
-        "apikey": api_key
-    }
-
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        if "Technical Analysis: BBANDS" in data:
-            return data["Technical Analysis: BBANDS"]
-        return {"error": "Invalid data returned or no data available"}
-    return {"error": "Failed to fetch data"}
-
-# MIDPOINT
-
-def get_midpoint_values(symbol: str, interval: str = "daily", time_period: int = 14) -> dict:
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    if not api_key:
-        return "Error: ALPHA_VANTAGE_API_KEY not configured"
-
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "MIDPOINT",
-        "symbol": symbol,
-        "interval": interval,
-        "time_period": time_period,
-        "apikey": api_key
-    }
-
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        if "Technical Analysis: MIDPOINT" in data:
-            return data["Technical Analysis: MIDPOINT"]
-        return {"error": "Invalid data returned or no data available"}
-    return {"error": "Failed to fetch data"}
-
-def get_plus_di_values(symbol: str, interval: str = "daily", time_period: int = 14) -> dict:
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    if not api_key:
-        return "Error: ALPHA_VANTAGE_API_KEY not configured"
-
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "PLUS_DI",
-        "symbol": symbol,
-        "interval": interval,
-        "time_period": time_period,
-        "apikey": api_key
-    }
-
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        if "Technical Analysis: PLUS_DI" in data:
-            return data["Technical Analysis: PLUS_DI"]
-        return {"error": "Invalid data returned or no data available"}
-    return {"error": "Failed to fetch data"}
-
-# MINUS_DM
-
-def get_minus_dm_values(symbol: str, interval: str = "daily", time_period: int = 14) -> dict:
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    if not api_key:
-        return "Error: ALPHA_VANTAGE_API_KEY not configured"
-
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "MINUS_DM",
-        "symbol": symbol,
-        "interval": interval,
-        "time_period": time_period,
-        "apikey": api_key
-    }
-
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        if "Technical Analysis: MINUS_DM" in data:
-            return data["Technical Analysis: MINUS_DM"]
-        return {"error": "Invalid data returned or no data available"}
-    return {"error": "Failed to fetch data"}
-
-# PLUS_DM
-
-def get_plus_dm_values(symbol: str, interval: str = "daily", time_period: int = 14) -> dict:
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    if not api_key:
-        return "Error: ALPHA_VANTAGE_API_KEY not configured"
-
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "PLUS_DM",
-        "symbol": symbol,
-        "interval": interval,
-        "time_period": time_period,
-        "apikey": api_key
-    }
-
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        if "Technical Analysis: PLUS_DM" in data:
-            return data["Technical Analysis: PLUS_DM"]
-        return {"error": "Invalid data returned or no data available"}
-    return {"error": "Failed to fetch data"}
-
-# BBANDS
-
-def get_bbands_values(symbol: str, interval: str = "daily", time_period: int = 20, series_type: str = "close") -> dict:
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    if not api_key:
-        return "Error: ALPHA_VANTAGE_API_KEY not configured"
-
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "BBANDS",
-        "symbol": symbol,
-        "interval": interval,
-        "time_period": time_period,
-        "series_type": series_type,
-        "apikey": api_key
-    }
-
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        if "Technical Analysis: BBANDS" in data:
-            return data["Technical Analysis: BBANDS"]
-        return {"error": "Invalid data returned or no data available"}
-    return {"error": "Failed to fetch data"}
-
-# MIDPOINT
-
-def get_midpoint_values(symbol: str, interval: str = "daily", time_period: int = 14) -> dict:
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    if not api_key:
-        return "Error: ALPHA_VANTAGE_API_KEY not configured"
-
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "MIDPOINT",
-        "symbol": symbol,
-        "interval": interval,
-        "time_period": time_period,
-        "apikey": api_key
-    }
-
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        if "Technical Analysis: MIDPOINT" in data:
-            return data["Technical Analysis: MIDPOINT"]
-        return {"error": "Invalid data returned or no data available"}
-    return {"error": "Failed to fetch data"}
-
-# MIDPRICE
-
-def get_midprice_values(symbol: str, interval: str = "daily", time_period: int = 14) -> dict:
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    if not api_key:
-        return "Error: ALPHA_VANTAGE_API_KEY not configured"
-
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "MIDPRICE",
-        "symbol": symbol,
-        "interval": interval,
-        "time_period": time_period,
-        "apikey": api_key
-    }
-
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        if "Technical Analysis: MIDPRICE" in data:
-            return data["Technical Analysis: MIDPRICE"]
-        return {"error": "Invalid data returned or no data available"}
-    return {"error": "Failed to fetch data"}
-
-def get_plus_di_values(symbol: str, interval: str = "daily", time_period: int = 14) -> dict:
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    if not api_key:
-        return "Error: ALPHA_VANTAGE_API_KEY not configured"
-
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "PLUS_DI",
-        "symbol": symbol,
-        "interval": interval,
-        "time_period": time_period,
-        "apikey": api_key
-    }
-
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        if "Technical Analysis: PLUS_DI" in data:
-            return data["Technical Analysis: PLUS_DI"]
-        return {"error": "Invalid data returned or no data available"}
-    return {"error": "Failed to fetch data"}
-
-# MINUS_DM
-
-def get_minus_dm_values(symbol: str, interval: str = "daily", time_period: int = 14) -> dict:
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    if not api_key:
-        return "Error: ALPHA_VANTAGE_API_KEY not configured"
-
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "MINUS_DM",
-        "symbol": symbol,
-        "interval": interval,
-        "time_period": time_period,
-        "apikey": api_key
-    }
-
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        if "Technical Analysis: MINUS_DM" in data:
-            return data["Technical Analysis: MINUS_DM"]
-        return {"error": "Invalid data returned or no data available"}
-    return {"error": "Failed to fetch data"}
-
-# PLUS_DM
-
-def get_plus_dm_values(symbol: str, interval: str = "daily", time_period: int = 14) -> dict:
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    if not api_key:
-        return "Error: ALPHA_VANTAGE_API_KEY not configured"
-
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "PLUS_DM",
-        "symbol": symbol,
-        "interval": interval,
-        "time_period": time_period,
-        "apikey": api_key
-    }
-
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        if "Technical Analysis: PLUS_DM" in data:
-            return data["Technical Analysis: PLUS_DM"]
-        return {"error": "Invalid data returned or no data available"}
-    return {"error": "Failed to fetch data"}
-
-# BBANDS
-
-def get_bbands_values(symbol: str, interval: str = "daily", time_period: int = 20, series_type: str = "close") -> dict:
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    if not api_key:
-        return "Error: ALPHA_VANTAGE_API_KEY not configured"
-
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "BBANDS",
-        "symbol": symbol,
-        "interval": interval,
-        "time_period": time_period,
-        "series_type": series_type,
-        "apikey": api_key
-    }
-
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        if "Technical Analysis: BBANDS" in data:
-            return data["Technical Analysis: BBANDS"]
-        return {"error": "Invalid data returned or no data available"}
-    return {"error": "Failed to fetch data"}
-
-# MIDPOINT
-
-def get_midpoint_values(symbol: str, interval: str = "daily", time_period: int = 14) -> dict:
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    if not api_key:
-        return "Error: ALPHA_VANTAGE_API_KEY not configured"
-
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "MIDPOINT",
-        "symbol": symbol,
-        "interval": interval,
-        "time_period": time_period,
-        "apikey": api_key
-    }
-
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        if "Technical Analysis: MIDPOINT" in data:
-            return data["Technical Analysis: MIDPOINT"]
-        return {"error": "Invalid data returned or no data available"}
-    return {"error": "Failed to fetch data"}
-
-# MIDPRICE
-
-def get_midprice_values(symbol: str, interval: str = "daily", time_period: int = 14) -> dict:
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    if not api_key:
-        return "Error: ALPHA_VANTAGE_API_KEY not configured"
-
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "MIDPRICE",
-        "symbol": symbol,
-        "interval": interval,
-        "time_period": time_period,
-        "apikey": api_key
-    }
-
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        if "Technical Analysis: MIDPRICE" in data:
-            return data["Technical Analysis: MIDPRICE"]
-        return {"error": "Invalid data returned or no data available"}
-    return {"error": "Failed to fetch data"}
-
-# SAR
-
-def get_sar_values(symbol: str, interval: str = "daily", acceleration: float = 0.02, maximum: float = 0.2) -> dict:
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    if not api_key:
-        return "Error: ALPHA_VANTAGE_API_KEY not configured"
-
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "SAR",
-        "symbol": symbol,
-        "interval": interval,
-        "acceleration": acceleration,
-        "maximum": maximum,
-        "apikey": api_key
-    }
-
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        if "Technical Analysis: SAR" in data:
-            return data["Technical Analysis: SAR"]
-        return {"error": "Invalid data returned or no data available"}
-    return {"error": "Failed to fetch data"}
-
-# TRANGE
-
-def get_trange_values(symbol: str, interval: str = "daily") -> dict:
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    if not api_key:
-        return "Error: ALPHA_VANTAGE_API_KEY not configured"
-
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "TRANGE",
-        "symbol": symbol,
-        "interval": interval,
-        "apikey": api_key
-    }
-
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        if "Technical Analysis: TRANGE" in data:
-            return data["Technical Analysis: TRANGE"]
-        return {"error": "Invalid data returned or no data available"}
-    return {"error": "Failed to fetch data"}
-
-# ATR
-
-def get_atr_values(symbol: str, interval: str = "daily", time_period: int = 14) -> dict:
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    if not api_key:
-        return "Error: ALPHA_VANTAGE_API_KEY not configured"
-
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "ATR",
-        "symbol": symbol,
-        "interval": interval,
-        "time_period": time_period,
-        "apikey": api_key
-    }
-
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        if "Technical Analysis: ATR" in data:
-            return data["Technical Analysis: ATR"]
-        return {"error": "Invalid data returned or no data available"}
-    return {"error": "Failed to fetch data"}
-
-# NATR
-
-def get_natr_values(symbol: str, interval: str = "daily", time_period: int = 14) -> dict:
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    if not api_key:
-        return "Error: ALPHA_VANTAGE_API_KEY not configured"
-
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "NATR",
-        "symbol": symbol,
-        "interval": interval,
-        "time_period": time_period,
-        "apikey": api_key
-    }
-
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        if "Technical Analysis: NATR" in data:
-            return data["Technical Analysis: NATR"]
-        return {"error": "Invalid data returned or no data available"}
-    return {"error": "Failed to fetch data"}
-
-# AD
-
-def get_ad_values(symbol: str, interval: str = "daily") -> dict:
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    if not api_key:
-        return "Error: ALPHA_VANTAGE_API_KEY not configured"
-
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "AD",
-        "symbol": symbol,
-        "interval": interval,
-        "apikey": api_key
-    }
-
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        if "Technical Analysis: Chaikin A/D" in data:
-            return data["Technical Analysis: Chaikin A/D"]
-        return {"error": "Invalid data returned or no data available"}
-    return {"error": "Failed to fetch data"}
-
-# ADOSC
-
-def get_adosc_values(symbol: str, interval: str = "daily", fastperiod: int = 3, slowperiod: int = 10) -> dict:
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    if not api_key:
-        return "Error: ALPHA_VANTAGE_API_KEY not configured"
-
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "ADOSC",
-        "symbol": symbol,
-        "interval": interval,
-        "fastperiod": fastperiod,
-        "slowperiod": slowperiod,
-        "apikey": api_key
-    }
-
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        if "Technical Analysis: ADOSC" in data:
-            return data["Technical Analysis: ADOSC"]
-        return {"error": "Invalid data returned or no data available"}
-    return {"error": "Failed to fetch data"}
-
-def get_obv_values(symbol: str, interval: str = "daily") -> dict:
-    """
-    Fetch On Balance Volume (OBV) values for a given symbol.
-    """
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    if not api_key:
-        return "Error: ALPHA_VANTAGE_API_KEY not configured"
-    
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "OBV",
-        "symbol": symbol,
-        "interval": interval,
-        "apikey": api_key
-    }
-    
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        if "Technical Analysis: OBV" in data:
-            return data["Technical Analysis: OBV"]
-        return {"error": "Invalid data returned or no data available"}
-    return {"error": "Failed to fetch data"}
-
-# HT_TRENDLINE
-
-def get_ht_trendline_values(symbol: str, interval: str = "daily") -> dict:
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    if not api_key:
-        return "Error: ALPHA_VANTAGE_API_KEY not configured"
-
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "HT_TRENDLINE",
-        "symbol": symbol,
-        "interval": interval,
-        "apikey": api_key
-    }
-
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        if "Technical Analysis: HT_TRENDLINE" in data:
-            return data["Technical Analysis: HT_TRENDLINE"]
-        return {"error": "Invalid data returned or no data available"}
-    return {"error": "Failed to fetch data"}
-
-# HT_SINE
-
-def get_ht_sine_values(symbol: str, interval: str = "daily") -> dict:
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    if not api_key:
-        return "Error: ALPHA_VANTAGE_API_KEY not configured"
-
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "HT_SINE",
-        "symbol": symbol,
-        "interval": interval,
-        "apikey": api_key
-    }
-
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        if "Technical Analysis: HT_SINE" in data:
-            return data["Technical Analysis: HT_SINE"]
-        return {"error": "Invalid data returned or no data available"}
-    return {"error": "Failed to fetch data"}
-
-# HT_TRENDMODE
-
-def get_ht_trendmode_values(symbol: str, interval: str = "daily") -> dict:
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    if not api_key:
-        return "Error: ALPHA_VANTAGE_API_KEY not configured"
-
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "HT_TRENDMODE",
-        "symbol": symbol,
-        "interval": interval,
-        "apikey": api_key
-    }
-
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        if "Technical Analysis: HT_TRENDMODE" in data:
-            return data["Technical Analysis: HT_TRENDMODE"]
-        return {"error": "Invalid data returned or no data available"}
-    return {"error": "Failed to fetch data"}
-
-# HT_DCPERIOD
-
-def get_ht_dcperiod_values(symbol: str, interval: str = "daily") -> dict:
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    if not api_key:
-        return "Error: ALPHA_VANTAGE_API_KEY not configured"
-
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "HT_DCPERIOD",
-        "symbol": symbol,
-        "interval": interval,
-        "apikey": api_key
-    }
-
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        if "Technical Analysis: HT_DCPERIOD" in data:
-            return data["Technical Analysis: HT_DCPERIOD"]
-        return {"error": "Invalid data returned or no data available"}
-    return {"error": "Failed to fetch data"}
-
-# HT_DCPHASE
-
-def get_ht_dcphase_values(symbol: str, interval: str = "daily") -> dict:
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    if not api_key:
-        return "Error: ALPHA_VANTAGE_API_KEY not configured"
-
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "HT_DCPHASE",
-        "symbol": symbol,
-        "interval": interval,
-        "apikey": api_key
-    }
-
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        if "Technical Analysis: HT_DCPHASE" in data:
-            return data["Technical Analysis: HT_DCPHASE"]
-        return {"error": "Invalid data returned or no data available"}
-    return {"error": "Failed to fetch data"}
-
-# HT_PHASOR
-
-def get_ht_phasor_values(symbol: str, interval: str = "daily") -> dict:
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    if not api_key:
-        return "Error: ALPHA_VANTAGE_API_KEY not configured"
-
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "HT_PHASOR",
-        "symbol": symbol,
-        "interval": interval,
-        "apikey": api_key
-    }
-
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        if "Technical Analysis: HT_PHASOR" in data:
-            return data["Technical Analysis: HT_PHASOR"]
-        return {"error": "Invalid data returned or no data available"}
-    return {"error": "Failed to fetch data"}
-
-def get_obv_values(symbol: str, interval: str = "daily") -> dict:
-    """
-    Fetch On Balance Volume (OBV) values for a given symbol.
-    """
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
-    if not api_key:
-        return "Error: ALPHA_VANTAGE_API_KEY not configured"
-    
-    url = "https://www.alphavantage.co/query"
-    params = {
-        "function": "OBV",
-        "symbol": symbol,
-        "interval": interval,
-        "apikey": api_key
-    }
-    
-    response = requests.get(url, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        if "Technical Analysis: OBV" in data:
-            return data["Technical Analysis: OBV"]
-        return {"error": "Invalid data returned or no data available"}
-    return {"error": "Failed to fetch data"}    
+    today = market_calendar.now().date()
+    try:
+        first = date.fromisoformat(start) if start else today
+        last = date.fromisoformat(end) if end else first + timedelta(days=EARNINGS_DAYS)
+    except ValueError as e:
+        return {"error": f"Invalid date: {e}"}
+    if last < first:
+        return {"error": "end is before start"}
+    if symbol is not None:
+        invalid = symbol_check.check(symbol)
+        if invalid:
+            return {"error": invalid}
+        symbol = symbol_check.normalize(symbol).upper()
+    max_wait = max_wait_ms / 1000 if max_wait_ms is not None else DEFAULT_MAX_WAIT
+    span = earnings.horizon(last, today)
+    data = call_endpoint(ENDPOINTS_BY_NAME["get_earnings_calendar"], {"horizon": span}, max_wait, priority, client)
+    if "error" in data:
+        return data
+    index = earnings_calendar.index(span, data)
+    start, end = first.isoformat(), last.isoformat()
+    rows = index.of_symbol(symbol, start, end) if symbol is not None else index.between(start, end)
+    return {"start": start, "end": end, "symbol": symbol, "horizon": span, "columns": index.columns, "rows": rows}
 
 client = OpenAI(api_key=os.environ['OPENAI_API_KEY'])
 
@@ -0,0 +1,96 @@
+from datetime import datetime, timedelta
+from typing import Optional
+
+import market_calendar
+from cache import MISSING, make_key, response_cache
+from endpoints import TTL_REALTIME, Endpoint
+
+# Cache lifetimes that follow the US equity trading calendar. Intraday bars stay
+# valid until the next bar boundary, daily bars until the session close, and
+# nothing changes overnight, on weekends or on exchange holidays.
+
+BAR_GRACE = timedelta(seconds=5)        # upstream needs a moment to publish a finished bar
+SETTLE_DELAY = timedelta(minutes=30)    # end-of-day bars are published some time after the close
+MIN_TTL = 5.0
+MAX_TTL = 4 * 24 * 60 * 60.0
+
+
+def _seconds_until(moment: datetime, target: datetime) -> float:
+    return min(max((target - moment).total_seconds(), MIN_TTL), MAX_TTL)
+
+
+def _interval_minutes(interval) -> Optional[int]:
+    if isinstance(interval, str) and interval.endswith("min") and interval[:-3].isdigit():
+        return int(interval[:-3])
+    return None
+
+
+def us_market_reported_closed() -> bool:
+    """
+    True when the last cached MARKET_STATUS response reports the US equity market as closed.
+    Catches unscheduled closures the local calendar does not know about; never calls upstream.
+    """
+    data = response_cache.peek(make_key({"function": "MARKET_STATUS"}))
+    if data is MISSING:
+        return False
+    for market in data.get("markets", []):
+        if market.get("region") == "United States" and market.get("market_type") == "Equity":
+            return market.get("current_status", "").lower() == "closed"
+    return False
+
+
+def _session_active(moment: datetime, extended: bool) -> bool:
+    if not market_calendar.is_open(moment, extended):
+        return False
+    # Only trust a "closed" status during regular hours, it is always "closed" in extended hours
+    return not (market_calendar.is_open(moment) and us_market_reported_closed())
+
+
+def intraday_ttl(minutes: int, moment: datetime) -> float:
+    """
+    Until the next bar boundary while the extended session runs, else until the next session opens.
+    """
+    if not _session_active(moment, extended=True):
+        return _seconds_until(moment, market_calendar.next_open(moment, extended=True) + BAR_GRACE)
+    midnight = moment.replace(hour=0, minute=0, second=0, microsecond=0)
+    elapsed = (moment - midnight).total_seconds()
+    next_bar = midnight + timedelta(seconds=(elapsed // (minutes * 60) + 1) * minutes * 60)
+    return _seconds_until(moment, next_bar + BAR_GRACE)
+
+
+def realtime_ttl(ttl: float, moment: datetime) -> float:
+    """
+    ttl while trading is going on, else until the next session opens.
+    """
+    if _session_active(moment, extended=True):
+        return ttl
+    return _seconds_until(moment, market_calendar.next_open(moment, extended=True))
+
+
+def end_of_day_ttl(moment: datetime) -> float:
+    """
+    Until the end-of-day bar of the current (or next) session has been published.
+    """
+    day = moment.date()
+    if market_calendar.is_trading_day(day):
+        published = market_calendar.session(day)[1] + SETTLE_DELAY
+        if moment < published:
+            return _seconds_until(moment, published)
+    next_day = market_calendar.next_trading_day(day)
+    return _seconds_until(moment, market_calendar.session(next_day)[1] + SETTLE_DELAY)
+
+
+def cache_ttl(endpoint: Endpoint, arguments: dict, moment: datetime = None) -> float:
+    """
+    Cache lifetime for one call of a registry endpoint.
+    """
+    ttl = endpoint.cache_ttl(arguments)
+    if not endpoint.market_hours:
+        return ttl
+    moment = moment or market_calendar.now()
+    minutes = _interval_minutes(arguments.get("interval") or endpoint.fixed.get("interval"))
+    if minutes:
+        return intraday_ttl(minutes, moment)
+    if ttl <= TTL_REALTIME:
+        return realtime_ttl(ttl, moment)
+    return end_of_day_ttl(moment)
@@ -0,0 +1,53 @@
+import asyncio
+import json
+import os
+import sys
+
+import pytest
+
+import stub
+
+# The server modules read their configuration at import time: point them at the
+# local fake upstream, without rate limits or a disk cache, before any is imported.
+_server = stub.start()
+os.environ["ALPHA_VANTAGE_BASE_URL"] = f"http://127.0.0.1:{_server.server_address[1]}/query"
+os.environ["ALPHA_VANTAGE_API_KEY"] = "test"
+os.environ.pop("ALPHA_VANTAGE_API_KEYS", None)
+os.environ["ALPHA_VANTAGE_RATE_PER_MINUTE"] = "0"
+os.environ["ALPHA_VANTAGE_RATE_PER_DAY"] = "0"
+os.environ["ALPHA_VANTAGE_DISK_CACHE"] = ""
+os.environ.setdefault("OPENAI_API_KEY", "test")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "src"))
+
+
+@pytest.fixture
+def upstream():
+    """
+    The fake upstream with no responses configured, and empty response caches.
+    """
+    from cache import negative_cache, response_cache
+
+    stub.upstream.reset()
+    response_cache.clear()
+    negative_cache.clear()
+    yield stub.upstream
+    stub.upstream.reset()
+
+
+async def call_tool(name: str, arguments: dict):
+    """
+    Call an MCP tool of server.py and decode its JSON text result.
+    """
+    import server
+
+    result = await server.mcp.call_tool(name, arguments)
+    content = result[0] if isinstance(result, tuple) else result
+    return json.loads(content[0].text)
+
+
+@pytest.fixture
+def call():
+    """
+    call(name, **arguments): one MCP tool call, run to completion.
+    """
+    return lambda name, **arguments: asyncio.run(call_tool(name, arguments))
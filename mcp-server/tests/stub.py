@@ -0,0 +1,110 @@
+import http.server
+import json
+import threading
+import time
+from datetime import date, timedelta
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+
+# Local fake of the Alpha Vantage API for the tests: answers each query from
+# Upstream.responses by function (a dict, a callable taking the query, or a str
+# sent as CSV) and records the queries it received.
+
+
+class Upstream:
+    def __init__(self):
+        self.responses = {}
+        self.calls = []
+        self.delay = 0.0  # seconds each request takes
+        self._lock = threading.Lock()
+
+    def reset(self) -> None:
+        self.responses.clear()
+        self.delay = 0.0
+        with self._lock:
+            self.calls.clear()
+
+    def record(self, query: dict) -> None:
+        with self._lock:
+            self.calls.append(query)
+
+    def functions(self) -> list:
+        with self._lock:
+            return [query.get("function") for query in self.calls]
+
+    def respond(self, query: dict):
+        response = self.responses.get(query.get("function"))
+        if callable(response):
+            response = response(query)
+        if response is None:
+            return {"Error Message": "Invalid API call."}
+        return response
+
+
+upstream = Upstream()
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:
+        query = {name: values[0] for name, values in parse_qs(urlparse(self.path).query).items()}
+        upstream.record(query)
+        time.sleep(upstream.delay)
+        response = upstream.respond(query)
+        if isinstance(response, str):
+            body, content_type = response.encode(), "text/csv"
+        else:
+            body, content_type = json.dumps(response).encode(), "application/json"
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+def start() -> http.server.ThreadingHTTPServer:
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def daily_bars(bars: int, seed: int = 0) -> list:
+    """
+    (date, open, high, low, close, volume) of a random walk over bars weekdays, oldest first.
+    """
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, bars)))
+    open_ = close * (1 + rng.normal(0, 0.003, bars))
+    high = np.maximum(open_, close) * (1 + rng.uniform(0, 0.01, bars))
+    low = np.minimum(open_, close) * (1 - rng.uniform(0, 0.01, bars))
+    volume = rng.integers(1_000_000, 5_000_000, bars)
+    days, day = [], date(2020, 1, 1)
+    while len(days) < bars:
+        if day.weekday() < 5:
+            days.append(day.isoformat())
+        day += timedelta(days=1)
+    return list(zip(days, open_.round(4), high.round(4), low.round(4), close.round(4), volume.tolist()))
+
+
+def daily_adjusted(bars: list):
+    """
+    TIME_SERIES_DAILY_ADJUSTED response handler over daily_bars, honouring outputsize.
+    """
+    def respond(query: dict) -> dict:
+        rows = bars if query.get("outputsize") == "full" else bars[-100:]
+        series = {
+            day: {"1. open": f"{o:.4f}", "2. high": f"{h:.4f}", "3. low": f"{l:.4f}", "4. close": f"{c:.4f}",
+                  "5. adjusted close": f"{c:.4f}", "6. volume": str(v), "7. dividend amount": "0.0000",
+                  "8. split coefficient": "1.0"}
+            for day, o, h, l, c, v in reversed(rows)
+        }
+        return {"Meta Data": {"2. Symbol": query.get("symbol")}, "Time Series (Daily)": series}
+
+    return respond
@@ -0,0 +1,29 @@
+import asyncio
+import time
+
+import server  # noqa: F401  imported up front so the timing covers the calls only
+from conftest import call_tool
+
+DELAY = 0.5  # seconds the fake upstream takes per request
+
+
+def quote(query: dict) -> dict:
+    return {"Global Quote": {"01. symbol": query["symbol"], "05. price": "100.0000"}}
+
+
+def test_concurrent_tool_calls_overlap_their_upstream_waits(upstream):
+    upstream.responses["GLOBAL_QUOTE"] = quote
+    upstream.delay = DELAY
+    symbols = ["AAA", "BBB", "CCC", "DDD", "EEE", "FFF", "GGG", "HHH"]
+
+    async def burst():
+        return await asyncio.gather(*(call_tool("get_quote_tool", {"symbol": symbol}) for symbol in symbols))
+
+    start = time.perf_counter()
+    results = asyncio.run(burst())
+    elapsed = time.perf_counter() - start
+
+    assert [result["01. symbol"] for result in results] == symbols
+    assert len(upstream.calls) == len(symbols)
+    # Serialized calls would take len(symbols) * DELAY
+    assert elapsed < 2 * DELAY
@@ -0,0 +1,106 @@
+import numpy as np
+import pytest
+
+import indicators
+from endpoints import INDICATORS
+from listing import symbol_check
+from stub import daily_adjusted, daily_bars
+from tools import get_indicator_bundle, get_indicator_sweep, get_listing_delisting_status
+
+talib = pytest.importorskip("talib")
+from talib import abstract  # noqa: E402
+
+# Tool parameter names that TA-Lib spells differently
+TALIB_NAMES = {"time_period": "timeperiod", "fastkperiod": "fastk_period", "fastdperiod": "fastd_period"}
+
+
+def columns(bars: int = 500) -> dict:
+    day, open_, high, low, close, volume = map(np.array, zip(*daily_bars(bars)))
+    return {"open": open_, "high": high, "low": low, "close": close, "volume": volume.astype(float)}
+
+
+def defaults(function: str) -> dict:
+    """
+    Default arguments of the tool of an indicator function.
+    """
+    return {name: parameter.default for name, parameter in INDICATORS[function].signature().parameters.items()
+            if parameter.default is not parameter.empty}
+
+
+@pytest.mark.parametrize("function", sorted(indicators.COMPUTE))
+def test_local_indicators_match_talib(function):
+    series = columns()
+    arguments = defaults(function)
+    local = indicators.compute(function, series, arguments)
+
+    reference = abstract.Function(function)
+    params = {}
+    for name, value in arguments.items():
+        name = TALIB_NAMES.get(name, name)
+        if name in reference.parameters:
+            params[name] = type(reference.parameters[name])(value)
+    if "matype" in reference.parameters:
+        params["matype"] = int(arguments.get("matype") or 0)  # Alpha Vantage defaults to SMA, TA-Lib to EMA
+    inputs = dict(series)
+    if arguments.get("series_type"):
+        inputs["close"] = series[arguments["series_type"]]
+    expected = reference(inputs, **params)
+    expected = expected if isinstance(expected, list) else [expected]
+
+    assert len(local) == len(expected)
+    for (name, values), reference_values in zip(local.items(), expected):
+        # Same warm-up bars left out, same values after them
+        np.testing.assert_array_equal(np.isnan(values), np.isnan(reference_values), err_msg=name)
+        valid = ~np.isnan(values)
+        np.testing.assert_allclose(values[valid], reference_values[valid], rtol=1e-9, atol=1e-9, err_msg=name)
+
+
+def test_indicator_falls_back_to_upstream_when_the_series_is_refused(upstream, call):
+    upstream.responses["TIME_SERIES_DAILY_ADJUSTED"] = {
+        "Information": "Thank you for using Alpha Vantage! This is a premium endpoint."}
+    upstream.responses["SMA"] = {"Meta Data": {}, "Technical Analysis: SMA": {"2024-01-02": {"SMA": "101.5000"}}}
+
+    assert call("get_sma_data_tool", symbol="IBM") == {"2024-01-02": {"SMA": "101.5000"}}
+    # The refusal is remembered: the next indicator goes straight to its own endpoint
+    assert call("get_sma_data_tool", symbol="IBM", time_period=20) == {"2024-01-02": {"SMA": "101.5000"}}
+    # Both outputsizes of the series were tried once, the full one first
+    assert upstream.functions() == ["TIME_SERIES_DAILY_ADJUSTED", "TIME_SERIES_DAILY_ADJUSTED", "SMA", "SMA"]
+
+
+def test_indicator_is_computed_from_the_price_series(upstream, call):
+    upstream.responses["TIME_SERIES_DAILY_ADJUSTED"] = daily_adjusted(daily_bars(300))
+
+    first = call("get_sma_data_tool", symbol="MSFT", time_period=20)
+    second = call("get_ema_data_tool", symbol="MSFT", time_period=20)
+    assert len(first) == 300 - 19 and len(second) == 300 - 19
+    assert upstream.functions() == ["TIME_SERIES_DAILY_ADJUSTED"]
+
+
+def test_currency_pair_indicator_is_not_rejected_by_the_listing(upstream, call):
+    upstream.responses["LISTING_STATUS"] = ("symbol,name,exchange,assetType,ipoDate,delistingDate,status\r\n"
+                                            "IBM,International Business Machines Corp,NYSE,Stock,1962-01-02,null,Active\r\n")
+    upstream.responses["RSI"] = {"Meta Data": {}, "Technical Analysis: RSI": {"2024-01-02": {"RSI": "55.0000"}}}
+    assert symbol_check.index(get_listing_delisting_status()) is not None
+
+    assert call("get_rsi_data_tool", symbol="USDEUR") == {"2024-01-02": {"RSI": "55.0000"}}
+    assert "error" in call("get_rsi_data_tool", symbol="US$EUR")
+    assert upstream.functions() == ["LISTING_STATUS", "RSI"]
+
+
+def test_refused_series_error_is_a_plain_error(upstream, call):
+    upstream.responses["TIME_SERIES_DAILY_ADJUSTED"] = {"Error Message": "Invalid API call."}
+
+    assert call("get_daily_adjusted_tool", symbol="NOPE") == {"error": "Invalid API call."}
+    assert call("get_indicator_sweep_tool", symbol="NOPE", function="SMA",
+                grid={"time_period": [5, 10]}) == {"error": "Invalid API call."}
+
+
+def test_bundle_and_sweep_accept_every_local_indicator(upstream):
+    upstream.responses["TIME_SERIES_DAILY_ADJUSTED"] = daily_adjusted(daily_bars(300))
+
+    assert set(indicators.COMPUTE) <= set(INDICATORS)
+    bundle = get_indicator_bundle("BUNDLE", ["AD", "OBV", {"function": "SMA", "time_period": 20}], last_n=5)
+    assert bundle["indicators"] == ["AD", "OBV", "SMA_20"] and "errors" not in bundle
+    assert all(list(row["AD"]) == ["Chaikin A/D"] for row in bundle["data"].values())
+    assert "error" not in get_indicator_sweep("BUNDLE", "ADOSC", {"fastperiod": [3, 5]})
+    assert upstream.functions() == ["TIME_SERIES_DAILY_ADJUSTED"]
@@ -0,0 +1,16 @@
+from listing import SymbolIndex
+
+
+def index() -> SymbolIndex:
+    return SymbolIndex([("BRK-A", "Berkshire Hathaway Inc", "NYSE", "Stock", "1980-03-17"),
+                        ("BRK-B", "Berkshire Hathaway Inc", "NYSE", "Stock", "1996-05-09"),
+                        ("IBM", "International Business Machines Corp", "NYSE", "Stock", "1962-01-02")])
+
+
+def test_search_matches_symbols_by_their_listed_spelling():
+    symbols = index()
+
+    assert [(row["symbol"], row["match"]) for row in symbols.search("brk.b")] == [("BRK-B", "symbol")]
+    assert [row["symbol"] for row in symbols.search("brk/a")] == ["BRK-A"]
+    assert [row["symbol"] for row in symbols.search("brk.")] == ["BRK-A", "BRK-B"]
+    assert [row["symbol"] for row in symbols.search("ibm")] == ["IBM"]
@@ -0,0 +1,25 @@
+import pytest
+
+from stub import daily_adjusted, daily_bars
+
+
+@pytest.mark.parametrize("function", ["EMA", "RSI", "MACD", "ATR", "OBV", "SAR", "STOCH"])
+def test_streaming_indicator_projects_repeat_calls(upstream, call, function):
+    upstream.responses["TIME_SERIES_DAILY_ADJUSTED"] = daily_adjusted(daily_bars(300))
+    tool = f"get_{function.lower()}_data_tool"
+
+    first = call(tool, symbol=f"P{function}", last_n=2)
+    second = call(tool, symbol=f"P{function}", last_n=2)
+    assert len(first) == 2 and second == first
+    window = call(tool, symbol=f"P{function}", start="2020-06-01", end="2020-06-05")
+    assert sorted(window) == ["2020-06-01", "2020-06-02", "2020-06-03", "2020-06-04", "2020-06-05"]
+    full = call(tool, symbol=f"P{function}")
+    assert len(full) > 200 and list(full)[:2] == list(first)
+    assert upstream.functions() == ["TIME_SERIES_DAILY_ADJUSTED"]
+
+
+def test_projection_selects_fields(upstream, call):
+    upstream.responses["TIME_SERIES_DAILY_ADJUSTED"] = daily_adjusted(daily_bars(300))
+
+    result = call("get_macd_data_tool", symbol="PFIELDS", last_n=1, fields="MACD_Hist")
+    assert [list(values) for values in result.values()] == [["MACD_Hist"]]
@@ -0,0 +1,38 @@
+from listing import symbol_check
+from tools import get_listing_delisting_status, get_quotes
+
+LISTING = ("symbol,name,exchange,assetType,ipoDate,delistingDate,status\r\n"
+           "BRK-B,Berkshire Hathaway Inc,NYSE,Stock,1996-05-09,null,Active\r\n"
+           "IBM,International Business Machines Corp,NYSE,Stock,1962-01-02,null,Active\r\n")
+
+
+def quote(query: dict) -> dict:
+    return {"Global Quote": {"01. symbol": query["symbol"], "05. price": "100.0000"}}
+
+
+def test_quotes_report_cached_symbols_by_their_listed_spelling(upstream):
+    upstream.responses["LISTING_STATUS"] = LISTING
+    upstream.responses["GLOBAL_QUOTE"] = quote
+    assert symbol_check.index(get_listing_delisting_status()) is not None
+
+    first = get_quotes(["ibm", "brk.b"])
+    assert {symbol: entry["status"] for symbol, entry in first["quotes"].items()} == {"ibm": "fetched",
+                                                                                     "brk.b": "fetched"}
+    second = get_quotes(["IBM", "ibm", "BRK.B"])
+    assert {symbol: entry["status"] for symbol, entry in second["quotes"].items()} == {
+        "IBM": "cached", "ibm": "cached", "BRK.B": "cached"}
+    assert sorted(query["symbol"] for query in upstream.calls if query["function"] == "GLOBAL_QUOTE") == ["BRK-B", "IBM"]
+
+
+def test_unlisted_symbol_goes_upstream_once(upstream, call):
+    upstream.responses["LISTING_STATUS"] = LISTING
+    upstream.responses["GLOBAL_QUOTE"] = lambda query: quote(query) if query["symbol"] == "VFIAX" else None
+    assert symbol_check.index(get_listing_delisting_status()) is not None
+
+    # A mutual fund is not in the listing but upstream knows it
+    assert call("get_quote_tool", symbol="VFIAX")["05. price"] == "100.0000"
+    # A well-formed unknown symbol is refused upstream, then answered from the negative cache
+    assert call("get_quote_tool", symbol="NOPEX") == {"error": "Invalid API call."}
+    assert call("get_quote_tool", symbol="NOPEX") == {"error": "Invalid API call."}
+    assert "error" in call("get_quote_tool", symbol="NO PE")
+    assert upstream.functions() == ["LISTING_STATUS", "GLOBAL_QUOTE", "GLOBAL_QUOTE"]
@@ -0,0 +1,81 @@
+import threading
+import time
+
+import pytest
+
+from rate_limit import BACKGROUND, INTERACTIVE, NORMAL, RateLimiter, RateLimitExceeded
+
+HOLD = 0.5  # seconds every key sits out while the test queues its calls
+
+
+@pytest.fixture
+def limiter(monkeypatch):
+    """
+    A limiter over two keys of 600 requests a minute (one token every 0.1 s) and no daily bucket.
+    """
+    monkeypatch.setenv("ALPHA_VANTAGE_API_KEYS", "KEYAAAA,KEYBBBB")
+    return RateLimiter(per_minute=600, per_day=0)
+
+
+def served(limiter: RateLimiter, calls: list) -> list:
+    """
+    Queue calls (name, priority, client) one after another while the keys are held back, then
+    return the names in the order they were granted a token.
+    """
+    order = []
+    for key in limiter.keys():
+        key.quarantined_until = time.monotonic() + HOLD
+        take = key.take
+        key.take = lambda now, take=take: (order.append(threading.current_thread().name), take(now))
+    threads = []
+    for name, priority, client in calls:
+        thread = threading.Thread(target=limiter.acquire, kwargs={"priority": priority, "client": client}, name=name)
+        thread.start()
+        threads.append(thread)
+        while limiter.stats()["queue_depth"] < len(threads):
+            time.sleep(0.005)
+    for thread in threads:
+        thread.join()
+    return order
+
+
+def drain(limiter: RateLimiter) -> None:
+    for _ in range(2 * 600):
+        limiter.acquire()
+
+
+def test_interactive_call_overtakes_queued_background_work(limiter):
+    order = served(limiter, [("background", BACKGROUND, "batch"), ("normal", NORMAL, "batch"),
+                             ("interactive", INTERACTIVE, "chat")])
+    assert order == ["interactive", "normal", "background"]
+
+
+def test_clients_of_one_class_alternate(limiter):
+    order = served(limiter, [("a1", NORMAL, "a"), ("a2", NORMAL, "a"), ("a3", NORMAL, "a"),
+                             ("b1", NORMAL, "b"), ("b2", NORMAL, "b")])
+    assert order == ["a1", "b1", "a2", "b2", "a3"]
+
+
+def test_max_wait_rejects_a_call_estimated_to_wait_longer(limiter):
+    drain(limiter)
+    # Both keys are empty: the next token is about 0.1 s away
+    with pytest.raises(RateLimitExceeded):
+        limiter.acquire(max_wait=0.01)
+    assert limiter.stats()["rejected"] == 1
+    start = time.monotonic()
+    limiter.acquire(max_wait=1.0)
+    assert time.monotonic() - start < 0.5
+
+
+def test_quarantined_key_is_skipped(limiter):
+    first, second = limiter.keys()
+    limiter.quarantine(first, "per_minute")
+    assert all(limiter.acquire() is second for _ in range(10))
+    assert first.requests == 0 and first.throttled == 1
+
+
+def test_key_with_most_headroom_is_used(limiter):
+    first, second = limiter.keys()
+    for _ in range(3):
+        first.take(time.monotonic())
+    assert limiter.acquire() is second
@@ -0,0 +1,88 @@
+import threading
+import time
+
+from cache import Refusal
+from columnar import Series
+from series_store import SeriesStore, merge
+from stub import daily_adjusted, daily_bars
+from tools import get_daily_adjusted
+
+
+def test_projection_selects_from_the_whole_history(upstream):
+    upstream.responses["TIME_SERIES_DAILY_ADJUSTED"] = daily_adjusted(daily_bars(300))
+
+    assert len(get_daily_adjusted("HIST")) == 100
+    assert len(get_daily_adjusted("HIST", fields="close")) == 100
+    assert len(get_daily_adjusted("HIST", last_n=250)) == 250
+    assert min(get_daily_adjusted("HIST", start="2020-01-01", end="2020-01-10")) == "2020-01-01"
+    assert upstream.functions() == ["TIME_SERIES_DAILY_ADJUSTED"]
+
+
+def test_waiting_for_a_refresh_respects_max_wait(upstream):
+    upstream.responses["TIME_SERIES_DAILY_ADJUSTED"] = daily_adjusted(daily_bars(300))
+    upstream.delay = 0.5
+    leader = threading.Thread(target=get_daily_adjusted, args=("SLOW",))
+    leader.start()
+    while not upstream.calls:
+        time.sleep(0.01)
+
+    start = time.perf_counter()
+    result = get_daily_adjusted("SLOW", max_wait_ms=50)
+    assert time.perf_counter() - start < 0.3
+    assert "refresh in progress" in result["error"]
+    leader.join()
+    # Once refreshed, the history is answered without waiting or another upstream call
+    assert len(get_daily_adjusted("SLOW", max_wait_ms=0)) == 100
+    assert len(upstream.calls) == 1
+
+
+PREMIUM = {"Information": "Thank you for using Alpha Vantage! This is a premium endpoint."}
+
+
+def test_refused_full_series_falls_back_to_compact(upstream):
+    compact = daily_adjusted(daily_bars(300))
+    upstream.responses["TIME_SERIES_DAILY_ADJUSTED"] = (
+        lambda query: PREMIUM if query.get("outputsize") == "full" else compact(query))
+
+    assert len(get_daily_adjusted("IBM")) == 100
+    assert len(get_daily_adjusted("IBM", outputsize="full")) == 100
+    assert [query["outputsize"] for query in upstream.calls] == ["full", "compact"]
+
+
+def test_compact_only_history_grows_with_each_refresh():
+    bars = daily_bars(300)
+    calls = []
+
+    def load(outputsize):
+        calls.append(outputsize)
+        if outputsize == "full":
+            return Refusal(error=PREMIUM["Information"])
+        data = daily_adjusted(bars[:100 + 20 * calls.count("compact")])({"outputsize": outputsize})
+        return Series.from_rows(data["Time Series (Daily)"])
+
+    store = SeriesStore()
+    query = {"function": "TIME_SERIES_DAILY_ADJUSTED", "symbol": "GROW"}
+    assert len(store.get(query, 0, load)) == 100
+    assert len(store.get(query, 0, load)) == 120
+    assert len(store.get(query, 0, load)) == 140
+    assert calls == ["full", "compact", "compact", "compact"]
+    assert store.stats()["full_refusals"] == 1
+
+
+def unadjusted(bars: list, scale: float = 1.0) -> Series:
+    """
+    A Series shaped like TIME_SERIES_INTRADAY over daily_bars, prices multiplied by scale.
+    """
+    return Series.from_rows({
+        day: {"1. open": f"{o * scale:.4f}", "2. high": f"{h * scale:.4f}", "3. low": f"{l * scale:.4f}",
+              "4. close": f"{c * scale:.4f}", "5. volume": str(v)}
+        for day, o, h, l, c, v in reversed(bars)})
+
+
+def test_revised_prices_of_an_unadjusted_series_need_a_full_fetch():
+    bars = daily_bars(200)
+    history = unadjusted(bars[:150])
+
+    assert len(merge(history, unadjusted(bars[100:]))) == 200
+    # A 2:1 split shows up as halved prices of the shared bars
+    assert merge(history, unadjusted(bars[100:], 0.5)) is None
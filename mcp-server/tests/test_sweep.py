@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+import indicators
+from endpoints import INDICATORS
+from stub import daily_adjusted, daily_bars
+from tools import get_indicator_sweep, price_series
+
+
+def test_unsweepable_function_spends_no_upstream_call(upstream):
+    upstream.responses["TIME_SERIES_DAILY_ADJUSTED"] = daily_adjusted(daily_bars(300))
+
+    assert "error" in get_indicator_sweep("IBM", "MAMA", {"fastlimit": [0.01, 0.02]})
+    assert "error" in get_indicator_sweep("IBM", "BBANDS", {"time_period": [10, 20]}, params={"matype": 1})
+    assert upstream.calls == []
+
+
+def test_sweep_shares_one_series(upstream):
+    upstream.responses["TIME_SERIES_DAILY_ADJUSTED"] = daily_adjusted(daily_bars(300))
+
+    result = get_indicator_sweep("IBM", "SMA", {"time_period": [5, 10, 20]}, last_n=3)
+    assert [column["time_period"] for column in result["columns"]] == [5, 10, 20]
+    assert len(result["timestamps"]) == 3
+    assert upstream.functions() == ["TIME_SERIES_DAILY_ADJUSTED"]
+
+
+@pytest.mark.parametrize("function, grid", [
+    ("SMA", {"time_period": [5, 20], "series_type": ["close", "open"]}),
+    ("EMA", {"series_type": ["high", "close", "low"], "time_period": [10]}),
+    ("RSI", {"time_period": [14], "series_type": ["open", "close"]}),
+    ("MACD", {"fastperiod": [8, 12], "series_type": ["close", "high"]}),
+    ("APO", {"slowperiod": [20, 26], "series_type": ["low", "close"]}),
+    ("WMA", {"time_period": [5, 10], "series_type": ["close", "open"]}),
+])
+def test_sweep_columns_match_single_indicators(upstream, function, grid):
+    upstream.responses["TIME_SERIES_DAILY_ADJUSTED"] = daily_adjusted(daily_bars(300))
+
+    result = get_indicator_sweep("GRID", function, grid)
+    series = price_series("GRID", "daily")
+    newest_first = [series["timestamp"].index(stamp) for stamp in result["timestamps"]]
+    defaults = INDICATORS[function].signature()
+    for j, column in enumerate(result["columns"]):
+        arguments = defaults.bind(symbol="GRID", **{name: column[name] for name in grid}).arguments
+        arguments = {**{name: p.default for name, p in defaults.parameters.items()}, **arguments}
+        expected = np.round(indicators.compute(function, series, arguments)[column["output"]][newest_first], 4)
+        actual = np.array([np.nan if row[j] is None else row[j] for row in result["values"]])
+        np.testing.assert_allclose(actual, expected, err_msg=str(column))